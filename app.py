@@ -0,0 +1,274 @@
+import os
+import re
+import json
+import time
+
+import pygame
+
+from render import create_backend
+
+# 앱 컨텍스트
+#
+# 모듈을 import하는 것만으로는 pygame 초기화, 창 생성, 폰트 검색, 디렉토리 생성이
+# 일어나지 않습니다. 각 자원은 처음 사용될 때 초기화됩니다.
+# 창과 렌더링 백엔드(software/sdl2)는 처음 사용될 때 render.py에서 선택됩니다.
+
+_process_start = time.perf_counter()
+
+# 화면 설정 - 게임 내부 좌표는 이 기준 해상도를 사용하고 실제 화면에 맞게 확대/축소됩니다
+SCREEN_WIDTH = 1024
+SCREEN_HEIGHT = 768
+CAPTION = '타로 카드 리딩'
+
+# 색상 정의
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+PURPLE = (128, 0, 128)
+GOLD = (218, 165, 32)
+LIGHT_BLUE = (173, 216, 230)
+DARK_BLUE = (0, 0, 139)
+BACKGROUND = (20, 20, 50)
+
+# 카드 크기 (기준 해상도, 스프레드의 card_scale 1.0 기준)
+CARD_WIDTH, CARD_HEIGHT = 120, 180
+
+# 환경 변수 TAROT_FULLSCREEN=1이면 실제 디스플레이 해상도의 전체 화면으로 실행
+FULLSCREEN = os.environ.get('TAROT_FULLSCREEN') == '1'
+
+# 폰트 설정 (한글 지원) - 앞에서부터 처음 찾은 폰트를 사용
+FONT_CANDIDATES = ('malgungothic', 'nanumgothic', 'notosanscjkkr', 'applegothic')
+FONT_SIZES = {
+    'large': 48,
+    'medium': 28,
+    'small': 20,
+}
+# 이미지 파일이 없는 카드의 앞면 글자 크기 (이름, 의미) - 기준 카드 크기로 그린 뒤 확대/축소
+FACE_FONT_SIZES = (16, 14)
+
+# 시작 시간 예산 (밀리초) - 이 모듈이 import된 시점부터 첫 화면 표시까지
+STARTUP_BUDGET_MS = 500
+
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'tarot-game')
+FONT_CACHE_PATH = os.path.join(CACHE_DIR, 'fonts.json')
+
+# 폰트를 설치하면 바뀌는 디렉토리 (시스템/사용자 폰트 디렉토리와 fontconfig 설정/캐시)
+FONT_DIRS = ('/usr/share/fonts', '/usr/local/share/fonts', '~/.fonts', '~/.local/share/fonts',
+             '/etc/fonts', '/var/cache/fontconfig', '~/.cache/fontconfig',
+             '/Library/Fonts', '~/Library/Fonts', '/System/Library/Fonts',
+             os.path.join(os.environ.get('WINDIR', 'C:\\Windows'), 'Fonts'),
+             os.path.join(os.environ.get('LOCALAPPDATA', ''), 'Microsoft', 'Windows', 'Fonts'))
+
+# 한 기기에서 게임을 여러 개 실행할 때 인스턴스를 구분하는 이름 (세션 스냅샷처럼 인스턴스마다 따로 두는 파일에 사용)
+# 환경 변수 TAROT_INSTANCE, 없으면 디스플레이 이름(WAYLAND_DISPLAY, DISPLAY)
+INSTANCE_ID = re.sub(r'[^0-9A-Za-z_.-]', '_', os.environ.get('TAROT_INSTANCE') or os.environ.get('WAYLAND_DISPLAY')
+                     or os.environ.get('DISPLAY') or '')
+
+
+def _load_font_cache(path):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_font_cache(path, cache):
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False)
+    except OSError:
+        pass
+
+
+def font_dirs_state(dirs=FONT_DIRS):
+    """
+    폰트 디렉토리와 바로 아래 디렉토리들의 수정 시각 목록 - 폰트를 설치하거나 지우면 바뀜
+    """
+    state = []
+    for directory in dirs:
+        directory = os.path.expanduser(directory)
+        try:
+            entries = [directory] + sorted(entry.path for entry in os.scandir(directory) if entry.is_dir())
+        except OSError:
+            continue
+        for path in entries:
+            try:
+                state.append([path, os.stat(path).st_mtime_ns])
+            except OSError:
+                pass
+    return state
+
+
+def resolve_font_path(candidates=FONT_CANDIDATES, cache_path=FONT_CACHE_PATH):
+    """
+    폰트 파일 경로를 찾는 함수
+
+    SysFont의 시스템 폰트 검색은 느리므로 결과를 캐시 파일에 저장해 두고
+    같은 기기에서는 한 번만 검색합니다. 찾지 못하면 None(기본 폰트)을 반환합니다.
+    찾지 못한 결과는 폰트 디렉토리 상태(font_dirs_state)와 함께 저장하므로
+    나중에 한글 폰트를 설치하면 다음 실행에서 다시 검색합니다.
+    """
+    key = ','.join(candidates)
+    cache = _load_font_cache(cache_path)
+    path = cache.get(key)
+    if path and os.path.exists(path):
+        return path
+    state = font_dirs_state()
+    if key in cache and path is None and cache.get('font_dirs') == state:
+        return None
+
+    path = None
+    for name in candidates:
+        path = pygame.font.match_font(name)
+        if path:
+            break
+
+    cache[key] = path
+    if path is None:
+        cache['font_dirs'] = state
+    _save_font_cache(cache_path, cache)
+    return path
+
+
+class Viewport:
+    """
+    기준 해상도(SCREEN_WIDTH x SCREEN_HEIGHT)의 좌표를 실제 화면 좌표로 바꾸는 변환
+
+    화면비가 다르면 가로세로 비율을 유지한 채 가운데에 배치합니다.
+    """
+
+    def __init__(self, width, height, base_width=SCREEN_WIDTH, base_height=SCREEN_HEIGHT):
+        self.width = width
+        self.height = height
+        self.scale = min(width / base_width, height / base_height)
+        self.offset_x = (width - base_width * self.scale) / 2
+        self.offset_y = (height - base_height * self.scale) / 2
+
+    @property
+    def size(self):
+        return (self.width, self.height)
+
+    def length(self, value):
+        return max(1, round(value * self.scale))
+
+    def point(self, pos):
+        return (round(self.offset_x + pos[0] * self.scale), round(self.offset_y + pos[1] * self.scale))
+
+    def scale_size(self, size):
+        return (self.length(size[0]), self.length(size[1]))
+
+    def rect(self, rect):
+        # 같은 크기의 Rect는 위치와 관계없이 항상 같은 화면 크기가 되도록 크기를 따로 변환
+        rect = pygame.Rect(rect)
+        return pygame.Rect(self.point(rect.topleft), self.scale_size(rect.size))
+
+    def to_logical(self, pos):
+        return (int((pos[0] - self.offset_x) / self.scale), int((pos[1] - self.offset_y) / self.scale))
+
+
+class AppContext:
+    """
+    화면, 폰트, 디렉토리를 처음 사용할 때 초기화하는 앱 컨텍스트
+    """
+
+    def __init__(self, width=SCREEN_WIDTH, height=SCREEN_HEIGHT, caption=CAPTION, fullscreen=FULLSCREEN):
+        self.width = width
+        self.height = height
+        self.caption = caption
+        self.fullscreen = fullscreen
+        self.viewport = Viewport(width, height)
+        self._backend = None
+        self._font_path = False
+        self._fonts = {}
+        self._desktop_scale = None
+        # 초기화 단계별 소요 시간 (밀리초)
+        self.timings = {}
+        self.first_frame_ms = None
+
+    def _timed(self, name, func, *args):
+        start = time.perf_counter()
+        result = func(*args)
+        self.timings[name] = self.timings.get(name, 0) + (time.perf_counter() - start) * 1000
+        return result
+
+    @property
+    def backend(self):
+        # 렌더링 백엔드 (render.py) - 모든 그리기는 이 객체를 거침
+        if self._backend is None:
+            self._backend = self._timed('display', self._init_display)
+        return self._backend
+
+    @property
+    def frame(self):
+        # 지금 그리고 있는 프레임 번호 (화면을 만들기 전에는 0)
+        return self._backend.frames if self._backend is not None else 0
+
+    def _init_display(self):
+        pygame.display.init()
+        backend = create_backend((self.width, self.height), self.caption, self.fullscreen)
+        self.viewport = Viewport(*backend.size)
+        return backend
+
+    def resize(self, width, height):
+        # 창 크기 변경 - 해상도별 캐시는 viewport 크기가 바뀐 것을 보고 다시 만들어집니다
+        self.width = width
+        self.height = height
+        if self._backend is not None:
+            self._backend.resize((width, height))
+        self.viewport = Viewport(width, height)
+
+    def max_scale(self):
+        # 이 기기에서 가능한 가장 큰 화면 배율 (창은 데스크톱 크기보다 커지지 않음)
+        if self._desktop_scale is None and pygame.display.get_init():
+            self._desktop_scale = max((Viewport(width, height).scale
+                                       for width, height in pygame.display.get_desktop_sizes()), default=0)
+        return max(self.viewport.scale, self._desktop_scale or 0)
+
+    def init(self):
+        # 게임 루프 시작 전에 화면과 기본 폰트를 명시적으로 초기화
+        self.backend
+        for size in FONT_SIZES.values():
+            self.font(size)
+        return self
+
+    def font(self, size):
+        font = self._fonts.get(size)
+        if font is None:
+            font = self._timed('fonts', self._load_font, size)
+            self._fonts[size] = font
+        return font
+
+    def _load_font(self, size):
+        if not pygame.font.get_init():
+            pygame.font.init()
+        try:
+            return pygame.font.Font(self.font_path, size)
+        except (OSError, pygame.error):
+            return pygame.font.Font(None, size)
+
+    @property
+    def font_path(self):
+        # 한글 폰트 파일 경로 (없으면 None - 기본 폰트)
+        if self._font_path is False:
+            self._font_path = resolve_font_path()
+        return self._font_path
+
+    def mark_first_frame(self):
+        # 첫 화면이 표시된 시점을 기록하고 예산을 넘으면 경고
+        if self.first_frame_ms is not None:
+            return
+        self.first_frame_ms = (time.perf_counter() - _process_start) * 1000
+        if self.first_frame_ms > STARTUP_BUDGET_MS:
+            details = ', '.join(f"{name} {ms:.0f}ms" for name, ms in self.timings.items())
+            print(f"경고: 시작 시간 {self.first_frame_ms:.0f}ms가 예산 {STARTUP_BUDGET_MS}ms를 넘었습니다. ({details})")
+
+    def quit(self):
+        self._fonts.clear()
+        if self._backend is not None:
+            self._backend.close()
+            self._backend = None
+        pygame.quit()
+
+
+app = AppContext()
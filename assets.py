@@ -0,0 +1,286 @@
+import os
+import weakref
+from collections import OrderedDict
+
+import pygame
+
+from app import app, SCREEN_WIDTH, SCREEN_HEIGHT
+from glyphs import render_text
+from shared_assets import open_shared_assets
+
+# 이미지와 해상도별 자원 캐시
+#
+# 카드 이미지는 읽을 때 화면에 표시되는 가장 큰 크기로 줄여서 보관하고,
+# 메모리 예산(TAROT_ASSET_BUDGET_MB, 기본 10MB)을 넘으면 가장 오래 쓰지 않은
+# 이미지부터 내보냅니다. 내보낸 이미지는 다시 필요할 때 파일에서 읽습니다.
+# 화면 크기로 줄인 카드 이미지(scaled_image)는 원본을 내보내도 남아 있으므로
+# 화면에 놓인 카드를 그리려고 원본을 다시 읽지 않습니다.
+# 배경처럼 화면 크기인 Surface도 예산에 들어가므로 기준 해상도(1024x768)보다 큰 화면에서는
+# 화면 넓이에 비례하여 예산을 늘리고, 지금 프레임에 그린 이미지는 예산을 넘어도 내보내지 않습니다.
+#
+# 카드 이미지, 텍스트, 배경처럼 화면 크기에 따라 달라지는 Surface는 해상도마다
+# 한 번만 만들어 둡니다. 창 크기가 바뀌면(app.viewport 변경) 해상도별 캐시만 비우고
+# 원본 이미지에서 다시 만들기 때문에 Card 객체를 다시 만들거나 이미지 파일을
+# 다시 읽을 필요가 없습니다.
+#
+# 공유 자원 파일(shared_assets.py)이 있으면 원본 이미지는 파일을 읽지 않고 여러 게임 인스턴스가
+# 함께 쓰는 메모리를 그대로 사용합니다. 이 이미지는 프로세스 메모리가 아니므로 예산에 넣지 않습니다.
+
+# 텍스트 캐시 최대 항목 수 (넘으면 비움)
+MAX_TEXT_ENTRIES = 512
+
+# 자원 캐시 메모리 예산 (바이트)
+ASSET_BUDGET_BYTES = int(float(os.environ.get('TAROT_ASSET_BUDGET_MB', 10)) * 1024 * 1024)
+
+
+def surface_bytes(surface):
+    return surface.get_pitch() * surface.get_height()
+
+
+def _same_format(surface, screen):
+    return (surface.get_bitsize() == screen.get_bitsize() and surface.get_masks() == screen.get_masks()
+            and not surface.get_flags() & pygame.SRCALPHA)
+
+
+def load_image(path, max_size=None):
+    """
+    이미지 파일을 읽어 max_size를 덮는 가장 작은 크기로 줄이는 함수
+
+    원본 해상도(예: 1280px JPEG)를 그대로 보관하지 않도록 읽자마자 줄입니다.
+    """
+    image = pygame.image.load(path)
+    if max_size is not None:
+        width, height = image.get_size()
+        scale = max(max_size[0] / width, max_size[1] / height)
+        if scale < 1:
+            size = (max(1, round(width * scale)), max(1, round(height * scale)))
+            try:
+                image = pygame.transform.smoothscale(image, size)
+            except ValueError:
+                image = pygame.transform.scale(image, size)
+    # 불투명한 원본은 확대/축소(scaled)의 입력으로만 쓰이므로 24비트 그대로 보관하여 메모리를 줄임
+    if pygame.display.get_surface() is not None and image.get_flags() & pygame.SRCALPHA:
+        image = image.convert_alpha()
+    return image
+
+
+class AssetCache:
+    def __init__(self, budget=ASSET_BUDGET_BYTES):
+        self.budget = budget
+        # 원본 이미지 (경로 -> Surface, 가장 최근에 쓴 것이 뒤)
+        self._images = OrderedDict()
+        # 공유 자원의 원본 이미지 (경로 -> Surface, 내보내지 않음)
+        self._shared = {}
+        self._resolution = None
+        self._scaled = weakref.WeakKeyDictionary()
+        # (경로, 화면 크기) -> 화면 크기로 줄인 이미지 (가장 최근에 쓴 것이 뒤)
+        self._sized = OrderedDict()
+        # (경로, 화면 크기) -> 마지막으로 쓴 프레임 번호 (app.frame)
+        self._sized_frames = {}
+        # 확대/축소된 Surface -> 180도 돌린 Surface (역방향 카드)
+        self._rotated = weakref.WeakKeyDictionary()
+        self._text = {}
+        self._named = {}
+
+    def _check_resolution(self):
+        resolution = app.viewport.size
+        if resolution != self._resolution:
+            self.clear()
+            self._resolution = resolution
+
+    def clear(self):
+        # 해상도별 캐시만 비움 (원본 이미지는 유지)
+        self._scaled = weakref.WeakKeyDictionary()
+        self._sized.clear()
+        self._sized_frames.clear()
+        self._rotated = weakref.WeakKeyDictionary()
+        self._text.clear()
+        self._named.clear()
+
+    def image(self, path, fallback=None, max_size=None):
+        """
+        원본 이미지를 반환하는 함수
+
+        Args:
+            path (str): 이미지 파일 경로 (캐시 키)
+            fallback: 파일이 없을 때 Surface를 만드는 함수
+            max_size (tuple): 화면에 표시되는 가장 큰 크기 - 읽을 때 이 크기로 줄임
+
+        Card는 이 Surface를 들고 있지 않고 그릴 때마다 여기서 가져오므로
+        예산을 넘어 내보낸 이미지는 실제로 메모리에서 해제됩니다.
+        """
+        image = self._shared.get(path)
+        if image is not None:
+            return image
+        image = self._images.get(path)
+        if image is not None:
+            self._images.move_to_end(path)
+            return image
+
+        shared = open_shared_assets()
+        image = shared.get(path, max_size) if shared is not None else None
+        if image is not None:
+            self._shared[path] = image
+            return image
+
+        if os.path.exists(path) or fallback is None:
+            image = load_image(path, max_size)
+        else:
+            image = fallback()
+        self._images[path] = image
+        self._enforce_budget()
+        return image
+
+    def _enforce_budget(self):
+        # 가장 최근에 쓴 이미지 하나는 남기고 큰 원본 이미지부터 오래된 순서로 내보냄
+        budget = self.screen_budget()
+        while len(self._images) > 1 and self.resident_bytes()['total'] > budget:
+            _, image = self._images.popitem(last=False)
+            self._scaled.pop(image, None)
+        # 그래도 넘으면 화면 크기 이미지도 오래된 것부터 내보냄
+        # 이번 프레임에 그린 이미지는 예산을 넘더라도 남김 (내보내면 매 프레임 원본을 다시 읽게 됨)
+        frame = app.frame
+        while len(self._sized) > 1 and self.resident_bytes()['total'] > budget:
+            key = next(iter(self._sized))
+            if self._sized_frames.get(key) == frame:
+                break
+            del self._sized[key]
+            self._sized_frames.pop(key, None)
+
+    def screen_budget(self):
+        """
+        지금 화면 크기에서의 메모리 예산 (바이트)
+
+        배경과 오버레이처럼 내보낼 수 없는 화면 크기 Surface도 예산에 들어가므로
+        기준 해상도보다 큰 화면에서는 화면 넓이에 비례하여 예산을 늘립니다.
+        """
+        viewport = app.viewport
+        area = viewport.width * viewport.height / (SCREEN_WIDTH * SCREEN_HEIGHT)
+        return int(self.budget * max(1, area))
+
+    def resident_bytes(self):
+        """
+        캐시에 있는 Surface의 픽셀 메모리(바이트)를 종류별로 반환하는 함수
+        """
+        images = sum(surface_bytes(image) for image in self._images.values())
+        sources = {id(image) for image in self._images.values()} | {id(image) for image in self._shared.values()}
+        scaled = sum(surface_bytes(scaled)
+                     for source, sizes in self._scaled.items()
+                     for scaled in sizes.values() if scaled is not source)
+        scaled += sum(surface_bytes(scaled) for scaled in self._sized.values() if id(scaled) not in sources)
+        rotated = sum(surface_bytes(surface) for surface in self._rotated.values())
+        text = sum(surface_bytes(surface) for surface in self._text.values())
+        named = sum(surface_bytes(surface) for surface in self._named.values())
+        shared = sum(surface_bytes(image) for image in self._shared.values())
+        return {
+            'images': images,
+            'scaled': scaled,
+            'rotated': rotated,
+            'text': text,
+            'cached': named,
+            'total': images + scaled + rotated + text + named,
+            # 다른 인스턴스와 함께 쓰는 메모리 (total에 포함하지 않음)
+            'shared': shared,
+        }
+
+    def report(self):
+        usage = self.resident_bytes()
+        lines = [f"이미지 {len(self._images)}개 (공유 {len(self._shared)}개), 예산 {self.screen_budget() / 1024 / 1024:.1f}MB"]
+        for name, size in usage.items():
+            lines.append(f"  {name:8s} {size / 1024 / 1024:7.2f}MB")
+        return '\n'.join(lines)
+
+    def _scale(self, surface, size):
+        if surface.get_size() == size:
+            scaled = surface
+        else:
+            try:
+                scaled = pygame.transform.smoothscale(surface, size)
+            except ValueError:
+                # 8/16비트 Surface는 smoothscale을 지원하지 않음
+                scaled = pygame.transform.scale(surface, size)
+        # 화면 픽셀 형식으로 변환해 두면 blit이 빨라짐
+        # (이미 화면 형식인 원본을 그대로 쓸 때는 복사하지 않음)
+        screen = pygame.display.get_surface()
+        if screen is not None and not _same_format(scaled, screen):
+            scaled = scaled.convert()
+        return scaled
+
+    def scaled(self, surface, size):
+        """
+        원본 Surface를 지정한 화면 크기로 확대/축소한 Surface를 반환하는 함수
+
+        같은 원본과 크기에 대해서는 해상도가 바뀌기 전까지 캐시된 Surface를 반환합니다.
+        """
+        self._check_resolution()
+        sizes = self._scaled.get(surface)
+        if sizes is None:
+            sizes = self._scaled[surface] = {}
+        scaled = sizes.get(size)
+        if scaled is None:
+            scaled = sizes[size] = self._scale(surface, size)
+            self._enforce_budget()
+        return scaled
+
+    def scaled_image(self, path, size, fallback=None, max_size=None):
+        """
+        이미지 파일을 지정한 화면 크기로 줄인 Surface를 반환하는 함수 (인자는 image()와 같음)
+
+        원본 이미지와 따로 보관하므로 예산을 넘어 원본을 내보내도 해상도가 바뀌기 전까지 남아 있습니다.
+        """
+        self._check_resolution()
+        key = (path, size)
+        self._sized_frames[key] = app.frame
+        scaled = self._sized.get(key)
+        if scaled is not None:
+            self._sized.move_to_end(key)
+            return scaled
+        scaled = self._sized[key] = self._scale(self.image(path, fallback, max_size), size)
+        self._enforce_budget()
+        return scaled
+
+    def rotated(self, surface):
+        """
+        Surface를 180도 돌린 Surface(역방향 카드)를 반환하는 함수
+
+        scaled()가 반환한 Surface마다 한 번만 돌려 두므로 프레임마다 회전하지 않습니다.
+        """
+        rotated = self._rotated.get(surface)
+        if rotated is None:
+            rotated = pygame.transform.rotate(surface, 180)
+            self._rotated[surface] = rotated
+        return rotated
+
+    def text(self, text, size, color):
+        """
+        기준 해상도의 폰트 크기로 지정한 텍스트를 실제 화면 크기에 맞게 렌더링하는 함수
+        """
+        self._check_resolution()
+        key = (text, size, color)
+        surface = self._text.get(key)
+        if surface is None:
+            if len(self._text) >= MAX_TEXT_ENTRIES:
+                self._text.clear()
+            # 글리프 아틀라스가 있으면 아틀라스로, 없으면 폰트로 렌더링 (glyphs.py)
+            surface = render_text(text, size, color)
+            self._text[key] = surface
+        return surface
+
+    def cached(self, key, builder):
+        """
+        배경이나 오버레이처럼 해상도마다 한 번 만드는 Surface를 반환하는 함수
+
+        Args:
+            key: 캐시 키
+            builder: viewport를 받아 Surface를 만드는 함수
+        """
+        self._check_resolution()
+        surface = self._named.get(key)
+        if surface is None:
+            surface = builder(app.viewport)
+            self._named[key] = surface
+            self._enforce_budget()
+        return surface
+
+
+assets = AssetCache()
@@ -0,0 +1,535 @@
+import os
+import sys
+import json
+import glob
+import time
+import argparse
+import tempfile
+import subprocess
+
+# 성능 측정 도구
+#
+# 사용법:
+#   python benchmark.py              # 모든 항목 측정
+#   python benchmark.py startup      # 시작 시간만 측정
+#   python benchmark.py render       # 렌더링 백엔드와 창 크기별 프레임 시간 측정
+#   python benchmark.py deal         # 78장 덱의 셔플과 나눠 주기 애니메이션 프레임 시간 측정
+#   python benchmark.py memory       # 창 크기별 카드 이미지 메모리 사용량 측정
+#   python benchmark.py search       # 카드 검색 색인 생성과 검색 시간 측정
+#   python benchmark.py history      # 리딩 기록 저장 시간 측정
+#   python benchmark.py snapshot     # 세션 스냅샷 저장과 복원 시간 측정
+#   python benchmark.py shared       # 여러 인스턴스가 공유 자원을 쓸 때의 메모리 측정
+#   python benchmark.py replay       # 기록된 입력(sessions/*.trr)을 재생하여 프레임 시간 측정
+#   python benchmark.py leak         # 리딩을 반복하며 메모리가 계속 늘지 않는지 확인
+#   python benchmark.py --headless   # 창 없이 측정 (SDL 더미 드라이버)
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# import만으로 걸리는 시간 예산 (밀리초)
+IMPORT_BUDGET_MS = 300
+
+_STARTUP_SCRIPT = """
+import json, time
+start = time.perf_counter()
+import pygame
+import game
+imported = time.perf_counter()
+display_initialized = pygame.display.get_init()
+from app import app, STARTUP_BUDGET_MS
+game.draw_background()
+game.draw_text('타로 카드 리딩', 48, game.GOLD, center=(512, 284))
+app.backend.present()
+app.mark_first_frame()
+print(json.dumps({
+    'import_ms': (imported - start) * 1000,
+    'first_frame_ms': app.first_frame_ms,
+    'budget_ms': STARTUP_BUDGET_MS,
+    'display_on_import': display_initialized,
+    'timings': app.timings,
+}))
+"""
+
+
+def _run_python(script, headless, **extra_env):
+    env = dict(os.environ, **extra_env)
+    if headless:
+        env['SDL_VIDEODRIVER'] = 'dummy'
+        env['SDL_AUDIODRIVER'] = 'dummy'
+    env['PYGAME_HIDE_SUPPORT_PROMPT'] = '1'
+    result = subprocess.run([sys.executable, '-c', script], cwd=BASE_DIR, env=env,
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def bench_startup(args):
+    """
+    새 프로세스에서 import 시간과 첫 화면 표시까지의 시간을 측정하는 함수
+    """
+    runs = [_run_python(_STARTUP_SCRIPT, args.headless) for _ in range(args.repeat)]
+    import_ms = min(run['import_ms'] for run in runs)
+    first_frame_ms = min(run['first_frame_ms'] for run in runs)
+    budget_ms = runs[0]['budget_ms']
+
+    print(f"import:      {import_ms:7.1f}ms (예산 {IMPORT_BUDGET_MS}ms)")
+    print(f"첫 화면:      {first_frame_ms:7.1f}ms (예산 {budget_ms}ms)")
+    for name, ms in runs[-1]['timings'].items():
+        print(f"  {name:10s} {ms:7.1f}ms")
+
+    ok = import_ms <= IMPORT_BUDGET_MS and first_frame_ms <= budget_ms
+    if any(run['display_on_import'] for run in runs):
+        print("실패: import 중에 디스플레이가 초기화되었습니다.")
+        ok = False
+    return ok
+
+
+_RENDER_SCRIPT = """
+import json, time
+import game
+from app import app
+from sprites import SpriteBatch
+app.resize({width}, {height})
+app.init()
+cards = game.init_game()
+batch = SpriteBatch()
+result = {{'backend': app.backend.name}}
+# 모든 카드를 정방향으로, 다음에는 역방향으로 놓고 측정
+for orientation in ('upright', 'reversed'):
+    for card in cards:
+        card.reversed = orientation == 'reversed'
+    frames = []
+    for i in range({frames}):
+        # 카드 뒤집기 애니메이션을 반복 (20프레임마다 다시 시작)
+        if i % 20 == 0:
+            for card in cards:
+                card.revealed = card.flipping = False
+                card.start_flip()
+        start = time.perf_counter()
+        game.draw_background()
+        for card in cards:
+            card.draw(batch)
+        batch.draw()
+        app.backend.present()
+        frames.append((time.perf_counter() - start) * 1000)
+    frames.sort()
+    result[orientation] = {{'mean_ms': sum(frames) / len(frames), 'p95_ms': frames[int(len(frames) * 0.95)]}}
+print(json.dumps(result))
+"""
+
+# 프레임 시간 예산 (밀리초) - 60 FPS
+FRAME_BUDGET_MS = 1000 / 60
+
+# 렌더링과 메모리를 측정할 창 크기 (기본 크기, 1080p, 4K)
+RESOLUTIONS = ((1024, 768), (1920, 1080), (3840, 2160))
+
+
+def bench_render(args):
+    """
+    렌더링 백엔드와 창 크기마다 카드 21장의 뒤집기 애니메이션 프레임 시간을 측정하는 함수
+
+    카드를 모두 정방향으로 놓았을 때와 모두 역방향으로 놓았을 때를 따로 측정합니다.
+    """
+    ok = True
+    for width, height in RESOLUTIONS:
+        for renderer in ('software', 'sdl2'):
+            script = _RENDER_SCRIPT.format(frames=args.frames, width=width, height=height)
+            result = _run_python(script, args.headless, TAROT_RENDERER=renderer)
+            label = f"{renderer:9s} {width}x{height}"
+            if result['backend'] != renderer:
+                print(f"{label:19s} 사용할 수 없음")
+                continue
+            upright, reversed_ = result['upright'], result['reversed']
+            print(f"{label:19s} 평균 {upright['mean_ms']:6.2f}ms  p95 {upright['p95_ms']:6.2f}ms  "
+                  f"역방향 평균 {reversed_['mean_ms']:6.2f}ms  p95 {reversed_['p95_ms']:6.2f}ms (예산 {FRAME_BUDGET_MS:.1f}ms)")
+            ok = max(upright['p95_ms'], reversed_['p95_ms']) <= FRAME_BUDGET_MS and ok
+    return ok
+
+
+_DEAL_SCRIPT = """
+import json, time
+import game
+from app import app, SCREEN_WIDTH
+from sprites import SpriteBatch, DealAnimation
+app.init()
+size = (game.CARD_WIDTH, game.CARD_HEIGHT)
+# 덱 전체를 화면 가로로 펼침
+step = (SCREEN_WIDTH - 60 - size[0]) / ({deck} - 1)
+targets = [(30 + i * step, 300) for i in range({deck})]
+batch = SpriteBatch()
+frames = []
+animation = None
+for i in range({frames}):
+    if animation is None or animation.done:
+        animation = DealAnimation({deck}, targets, size, i)
+    start = time.perf_counter()
+    game.draw_background()
+    animation.update()
+    animation.draw(batch, game.card_back_surface(app.viewport.scale_size(size)))
+    batch.draw()
+    app.backend.present()
+    frames.append((time.perf_counter() - start) * 1000)
+frames.sort()
+print(json.dumps({{
+    'backend': app.backend.name,
+    'mean_ms': sum(frames) / len(frames),
+    'p95_ms': frames[int(len(frames) * 0.95)],
+}}))
+"""
+
+# 셔플과 나눠 주기 애니메이션을 측정할 덱 크기 (메이저와 마이너 아르카나 전체)
+DEAL_DECK_SIZE = 78
+
+
+def bench_deal(args):
+    """
+    렌더링 백엔드마다 78장 덱의 셔플과 나눠 주기 애니메이션 프레임 시간을 측정하는 함수
+    """
+    ok = True
+    for renderer in ('software', 'sdl2'):
+        script = _DEAL_SCRIPT.format(frames=args.frames, deck=DEAL_DECK_SIZE)
+        result = _run_python(script, args.headless, TAROT_RENDERER=renderer)
+        if result['backend'] != renderer:
+            print(f"{renderer:9s} 사용할 수 없음")
+            continue
+        print(f"{renderer:9s} 평균 {result['mean_ms']:6.2f}ms  p95 {result['p95_ms']:6.2f}ms (예산 {FRAME_BUDGET_MS:.1f}ms)")
+        ok = result['p95_ms'] <= FRAME_BUDGET_MS and ok
+    return ok
+
+
+_MEMORY_SCRIPT = """
+import json, resource, sys
+import pygame
+import assets as assets_module
+import game
+from app import app
+from assets import assets
+from card_store import open_store
+# 이미지 파일을 읽은 횟수
+loads = []
+load_image = assets_module.load_image
+assets_module.load_image = lambda *args: loads.append(args[0]) or load_image(*args)
+app.resize({width}, {height})
+app.init()
+store = open_store()
+ids = store.ids()
+# 모든 카드를 한 번씩 상세 보기 크기로 그림
+for card_id in ids:
+    card = game.Card(0, 0, game.DETAIL_CARD_WIDTH, game.DETAIL_CARD_HEIGHT, store.get(card_id))
+    card.flip_progress = 100
+    game.draw_background()
+    card.draw()
+    app.backend.present()
+# 리딩 결과 위에 상세 보기를 띄운 화면을 여러 프레임 그림 (배경, 카드 3장, 오버레이, 큰 카드)
+cards = [game.Card(200 + i * 250, 150, game.CARD_WIDTH, game.CARD_HEIGHT, store.get(card_id))
+         for i, card_id in enumerate(ids[:3])]
+for card in cards:
+    card.flip_progress = 100
+detail_rect = app.viewport.rect((0, 100, game.DETAIL_CARD_WIDTH, game.DETAIL_CARD_HEIGHT))
+for frame in range({frames}):
+    if frame == 1:
+        # 첫 프레임에 읽은 이미지는 빼고 셈
+        del loads[:]
+    game.draw_background()
+    for card in cards:
+        card.draw()
+    app.backend.blit(assets.cached('overlay', lambda viewport: pygame.Surface(viewport.size, pygame.SRCALPHA)), (0, 0))
+    app.backend.blit(cards[0].face_surface(detail_rect.size), detail_rect.topleft)
+    app.backend.present()
+max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{
+    'report': assets.report(),
+    'resident': assets.resident_bytes(),
+    'budget': assets.screen_budget(),
+    'loads_per_frame': len(loads) / ({frames} - 1),
+    # 리눅스는 KB, macOS는 바이트 단위
+    'max_rss': max_rss if sys.platform == 'darwin' else max_rss * 1024,
+}}))
+"""
+
+# 프로세스 최대 메모리 예산 (바이트)
+RSS_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+def bench_memory(args):
+    """
+    창 크기마다 카드를 모두 한 번씩 그린 뒤 자원 캐시와 프로세스의 메모리 사용량을 측정하는 함수
+
+    상세 보기 화면을 그리는 동안 매 프레임 이미지 파일을 다시 읽지 않는지도 확인합니다.
+    최대 RSS 예산은 기본 창 크기에만 적용합니다 (큰 화면은 화면 버퍼만으로도 커짐).
+    """
+    ok = True
+    for width, height in RESOLUTIONS:
+        result = _run_python(_MEMORY_SCRIPT.format(width=width, height=height, frames=30), args.headless)
+        print(f"[{width}x{height}]")
+        print(result['report'])
+        print(f"프레임당 읽기 {result['loads_per_frame']:6.2f}회 (예산 0회)")
+        print(f"최대 RSS     {result['max_rss'] / 1024 / 1024:7.2f}MB", end='')
+        ok = result['resident']['total'] <= result['budget'] and result['loads_per_frame'] == 0 and ok
+        if (width, height) == RESOLUTIONS[0]:
+            print(f" (예산 {RSS_BUDGET_BYTES / 1024 / 1024:.0f}MB)")
+            ok = result['max_rss'] <= RSS_BUDGET_BYTES and ok
+        else:
+            print()
+    return ok
+
+
+# 검색 한 번의 시간 예산 (마이크로초)
+SEARCH_BUDGET_US = 100
+SEARCH_QUERIES = ('직관', '새로운 시작', '힘', '사랑과 조화', '변화', '없는 검색어')
+
+
+def bench_search(args):
+    """
+    카드 검색 색인을 만드는 시간과 검색 한 번의 평균 시간을 측정하는 함수
+    """
+    from card_store import open_store
+    from search import SearchIndex
+
+    store = open_store()
+    start = time.perf_counter()
+    index = SearchIndex(store)
+    build_ms = (time.perf_counter() - start) * 1000
+
+    rounds = 1000 * args.repeat
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for query in SEARCH_QUERIES:
+            index.search(query)
+    query_us = (time.perf_counter() - start) * 1e6 / (rounds * len(SEARCH_QUERIES))
+
+    print(f"색인 생성    {build_ms:7.2f}ms")
+    print(f"검색        {query_us:7.2f}us (예산 {SEARCH_BUDGET_US}us)")
+    return query_us <= SEARCH_BUDGET_US
+
+
+# 리딩 기록 한 번에 게임 루프가 기다리는 시간 예산 (마이크로초)
+RECORD_BUDGET_US = 100
+
+
+def bench_history(args):
+    """
+    리딩 기록을 많이 저장할 때 record() 호출 시간과 모두 저장될 때까지의 시간을 측정하는 함수
+    """
+    from history import ReadingHistory, iter_readings
+
+    count = 20000
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'history.sqlite3')
+        history = ReadingHistory(path)
+        times = []
+        start = time.perf_counter()
+        for i in range(count):
+            record_start = time.perf_counter()
+            history.record(i, 'three_card', [(i % 22, False), ((i + 7) % 22, True), ((i + 14) % 22, False)])
+            times.append((time.perf_counter() - record_start) * 1e6)
+        history.close()
+        total_ms = (time.perf_counter() - start) * 1000
+        stored = sum(1 for _ in iter_readings(path))
+
+    times.sort()
+    p99_us = times[int(len(times) * 0.99)]
+    print(f"record()    평균 {sum(times) / len(times):6.2f}us  p99 {p99_us:6.2f}us (예산 {RECORD_BUDGET_US}us)")
+    print(f"저장 완료    {total_ms:7.1f}ms ({stored}/{count}개)")
+    return p99_us <= RECORD_BUDGET_US and stored == count
+
+
+_SNAPSHOT_SCRIPT = """
+import json, os, random, tempfile, time
+import game
+from spreads import load_spreads
+from snapshot import SessionSnapshots, SessionState, card_record
+cards = game.init_game(1)
+spread = load_spreads()[0]
+for card in cards[:spread.size]:
+    card.start_flip()
+with tempfile.TemporaryDirectory() as directory:
+    snapshots = SessionSnapshots(os.path.join(directory, 'session.snapshot'))
+    # 게임 루프에서 화면이 바뀔 때 드는 시간 (상태 수집과 인코딩 - 파일 쓰기는 스냅샷 스레드)
+    save_times = []
+    for i in range({count}):
+        start = time.perf_counter()
+        snapshots.save(SessionState(game.GameState.READING, spread.id, 1, [card_record(card) for card in cards],
+                                    list(range(spread.size)), None, None, None, random.getstate()))
+        save_times.append((time.perf_counter() - start) * 1e6)
+    snapshots.flush()
+    size = os.path.getsize(snapshots.path)
+    # 시작할 때 스냅샷을 읽어 카드를 다시 만드는 시간
+    restore_times = []
+    for i in range({count}):
+        start = time.perf_counter()
+        game.restore_session(snapshots.load(), load_spreads())
+        restore_times.append((time.perf_counter() - start) * 1000)
+save_times.sort()
+restore_times.sort()
+print(json.dumps({{
+    'size': size,
+    'save_p99_us': save_times[int(len(save_times) * 0.99)],
+    'restore_p99_ms': restore_times[int(len(restore_times) * 0.99)],
+}}))
+"""
+
+# 스냅샷 저장(게임 루프에서 드는 시간)과 복원 시간 예산
+SNAPSHOT_SAVE_BUDGET_US = 500
+SNAPSHOT_RESTORE_BUDGET_MS = 5
+
+
+def bench_snapshot(args):
+    """
+    카드 21장 상태의 세션 스냅샷 저장과 복원 시간을 측정하는 함수
+    """
+    result = _run_python(_SNAPSHOT_SCRIPT.format(count=200), True)
+    print(f"크기        {result['size']} 바이트")
+    print(f"저장        p99 {result['save_p99_us']:7.1f}us (예산 {SNAPSHOT_SAVE_BUDGET_US}us)")
+    print(f"복원        p99 {result['restore_p99_ms']:7.2f}ms (예산 {SNAPSHOT_RESTORE_BUDGET_MS}ms)")
+    return (result['save_p99_us'] <= SNAPSHOT_SAVE_BUDGET_US and
+            result['restore_p99_ms'] <= SNAPSHOT_RESTORE_BUDGET_MS)
+
+
+_SHARED_SCRIPT = """
+import json, sys
+import game
+from app import app
+from assets import assets
+from card_store import open_store
+app.init()
+store = open_store()
+for card_id in store.ids():
+    card = game.Card(0, 0, game.DETAIL_CARD_WIDTH, game.DETAIL_CARD_HEIGHT, store.get(card_id))
+    card.flip_progress = 100
+    card.draw()
+back = game.card_back_image()
+app.backend.present()
+# 비례 배분 메모리(Pss)와 이 프로세스만 쓰는 메모리(Private) - 리눅스 /proc
+usage = {}
+with open('/proc/self/smaps_rollup') as f:
+    for line in f:
+        name, _, value = line.partition(':')
+        if name in ('Pss', 'Private_Clean', 'Private_Dirty', 'Shared_Clean', 'Shared_Dirty'):
+            usage[name] = int(value.split()[0]) * 1024
+print(json.dumps(dict(usage, shared_images=assets.resident_bytes()['shared'])), flush=True)
+# 모든 인스턴스가 측정을 마칠 때까지 이미지를 들고 기다림
+sys.stdin.read()
+"""
+
+# 동시에 실행할 게임 인스턴스 수
+SHARED_INSTANCES = 3
+
+
+def _run_instances(count, cwd=BASE_DIR, **extra_env):
+    env = dict(os.environ, SDL_VIDEODRIVER='dummy', SDL_AUDIODRIVER='dummy', PYGAME_HIDE_SUPPORT_PROMPT='1',
+               PYTHONPATH=BASE_DIR, **extra_env)
+    processes = [subprocess.Popen([sys.executable, '-c', _SHARED_SCRIPT], cwd=cwd, env=env,
+                                  stdin=subprocess.PIPE, stdout=subprocess.PIPE, text=True)
+                 for _ in range(count)]
+    try:
+        return [json.loads(process.stdout.readline()) for process in processes]
+    finally:
+        for process in processes:
+            process.stdin.close()
+            process.wait()
+
+
+def bench_shared(args):
+    """
+    여러 게임 인스턴스가 카드 이미지를 모두 읽었을 때의 메모리를
+    공유 자원 파일(shared_assets.py)을 쓰지 않을 때와 쓸 때로 비교하는 함수
+
+    공유 자원을 쓰는 인스턴스는 게임 디렉토리가 아닌 곳에서 실행하여 작업 디렉토리와 관계없이
+    공유 자원을 찾는지도 확인합니다.
+    """
+    if not os.path.exists('/proc/self/smaps_rollup'):
+        print("이 시스템에서는 측정할 수 없습니다 (/proc/self/smaps_rollup 필요).")
+        return True
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'assets.bin')
+        _run_python(f"import shared_assets; shared_assets.main(['--output', {path!r}]); print('{{}}')", True)
+        results = {
+            '개별': _run_instances(SHARED_INSTANCES, TAROT_SHARED_ASSETS=''),
+            '공유': _run_instances(SHARED_INSTANCES, directory, TAROT_SHARED_ASSETS=path),
+        }
+    for name, runs in results.items():
+        private = sum(run['Private_Clean'] + run['Private_Dirty'] for run in runs) / len(runs)
+        pss = sum(run['Pss'] for run in runs)
+        print(f"{name}  인스턴스 {len(runs)}개  Pss 합계 {pss / 1024 / 1024:7.2f}MB  "
+              f"인스턴스당 Private {private / 1024 / 1024:6.2f}MB  공유 이미지 {runs[0]['shared_images'] / 1024 / 1024:5.2f}MB")
+    saved = sum(run['Pss'] for run in results['개별']) - sum(run['Pss'] for run in results['공유'])
+    print(f"절약        {saved / 1024 / 1024:7.2f}MB")
+    if not all(run['shared_images'] for run in results['공유']):
+        print("실패: 다른 디렉토리에서 실행한 인스턴스가 공유 자원을 사용하지 않았습니다.")
+        return False
+    return saved > 0
+
+
+def bench_replay(args):
+    """
+    sessions 디렉토리(와 환경 변수 TAROT_SESSIONS 디렉토리)의 입력 기록을 재생하여
+    실제 사용 흐름의 프레임 시간을 측정하는 함수
+    """
+    directories = [os.path.join(BASE_DIR, 'sessions')]
+    if os.environ.get('TAROT_SESSIONS'):
+        directories.append(os.environ['TAROT_SESSIONS'])
+    paths = sorted(path for directory in directories for path in glob.glob(os.path.join(directory, '*.trr')))
+    if not paths:
+        print("재생할 입력 기록이 없습니다.")
+        return True
+
+    ok = True
+    for path in paths:
+        script = f"import replay; replay.main([{path!r}, '--json'])"
+        result = _run_python(script, True)
+        stats = result['replay']
+        print(f"{os.path.basename(path):20s} {result['frames']:5d}프레임  평균 {stats['mean_ms']:6.2f}ms  "
+              f"p95 {stats['p95_ms']:6.2f}ms  최대 {stats['max_ms']:7.2f}ms (예산 {FRAME_BUDGET_MS:.1f}ms)")
+        ok = stats['p95_ms'] <= FRAME_BUDGET_MS and ok
+    return ok
+
+
+# 메모리 진단에서 반복할 리딩 수
+LEAK_CYCLES = 12
+
+
+def bench_leak(args):
+    """
+    리딩을 반복하며 메모리가 계속 늘지 않는지 확인하는 함수 (diagnostics.py)
+    """
+    script = f"import diagnostics; diagnostics.main(['--cycles', '{LEAK_CYCLES}', '--json'])"
+    result = _run_python(script, True)
+    for name, value in result['growth'].items():
+        mark = '  <- 증가' if name in result['flagged'] else ''
+        print(f"{name:14s} {value:12.1f}{mark}")
+    return not result['flagged']
+
+
+BENCHMARKS = {
+    'startup': bench_startup,
+    'render': bench_render,
+    'deal': bench_deal,
+    'memory': bench_memory,
+    'search': bench_search,
+    'history': bench_history,
+    'snapshot': bench_snapshot,
+    'shared': bench_shared,
+    'replay': bench_replay,
+    'leak': bench_leak,
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='타로 카드 게임 성능 측정')
+    parser.add_argument('names', nargs='*', help=f"측정할 항목 ({', '.join(BENCHMARKS)})")
+    parser.add_argument('--headless', action='store_true', help='창 없이 측정')
+    parser.add_argument('--repeat', type=int, default=3, help='반복 횟수')
+    parser.add_argument('--frames', type=int, default=200, help='렌더링 측정 프레임 수')
+    args = parser.parse_args(argv)
+    for name in args.names:
+        if name not in BENCHMARKS:
+            parser.error(f"알 수 없는 항목입니다: {name}")
+
+    ok = True
+    for name in args.names or BENCHMARKS:
+        print(f"== {name} ==")
+        ok = BENCHMARKS[name](args) and ok
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
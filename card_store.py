@@ -0,0 +1,225 @@
+import os
+import mmap
+import struct
+import tempfile
+
+# 컴파일된 카드 데이터 파일
+#
+# 파일 구조 (리틀 엔디언)
+#   헤더:        매직(4) 버전(H) 필드 수(H) 로케일 수(H) 카드 수(H)
+#   필드 이름:    필드 수 x (길이(B) + UTF-8)
+#   로케일 목록:  로케일 수 x (코드 8바이트 + 색인 오프셋(I))
+#   색인:        로케일마다 카드 수 x (레코드 오프셋(I) + 길이(I))
+#   레코드:      필드 수 x (길이(H) + UTF-8)
+#
+# 색인까지만 읽어 두고 레코드는 카드 ID로 요청될 때 해당 부분만 디코딩합니다.
+
+MAGIC = b'TRCD'
+VERSION = 2
+FIELDS = ('name', 'meaning', 'description', 'reversed_meaning', 'reversed_description', 'image_file', 'image_url')
+DEFAULT_LOCALE = 'ko'
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PATH = os.path.join(BASE_DIR, 'tarot_cards.bin')
+SOURCE_PATH = os.path.join(BASE_DIR, 'tarot_data.py')
+
+_HEADER = struct.Struct('<4sHHHH')
+_LOCALE = struct.Struct('<8sI')
+_INDEX = struct.Struct('<II')
+_FIELD_LEN = struct.Struct('<H')
+
+
+class CardStoreError(Exception):
+    pass
+
+
+def compile_decks(decks, fields=FIELDS):
+    """
+    로케일별 카드 목록을 바이너리 데이터로 컴파일하는 함수
+
+    Args:
+        decks (dict): 로케일 코드 -> 카드 딕셔너리 목록
+        fields (tuple): 저장할 필드 이름
+
+    Returns:
+        bytes: 컴파일된 데이터
+    """
+    locales = sorted(decks)
+    card_count = len(decks[locales[0]])
+    for locale in locales:
+        if len(decks[locale]) != card_count:
+            raise CardStoreError(f"로케일 '{locale}'의 카드 수가 다릅니다.")
+
+    header = bytearray(_HEADER.pack(MAGIC, VERSION, len(fields), len(locales), card_count))
+    for field in fields:
+        encoded = field.encode('utf-8')
+        header += struct.pack('<B', len(encoded)) + encoded
+
+    locale_table_size = len(locales) * _LOCALE.size
+    index_size = card_count * _INDEX.size
+    data_start = len(header) + locale_table_size + len(locales) * index_size
+
+    locale_table = bytearray()
+    indexes = bytearray()
+    records = bytearray()
+    for i, locale in enumerate(locales):
+        index_offset = len(header) + locale_table_size + i * index_size
+        locale_table += _LOCALE.pack(locale.encode('ascii'), index_offset)
+        for card in decks[locale]:
+            record = bytearray()
+            for field in fields:
+                encoded = str(card.get(field, '')).encode('utf-8')
+                record += _FIELD_LEN.pack(len(encoded)) + encoded
+            indexes += _INDEX.pack(data_start + len(records), len(record))
+            records += record
+
+    return bytes(header + locale_table + indexes + records)
+
+
+class CardStore:
+    """
+    컴파일된 카드 데이터를 카드 ID 단위로 읽는 저장소
+
+    카드 ID는 tarot_data의 목록 순서(메이저 아르카나 번호)와 같습니다.
+    """
+
+    def __init__(self, buffer, source=None):
+        self.buffer = buffer
+        self.source = source
+        self._cache = {}
+
+        if len(buffer) < _HEADER.size:
+            raise CardStoreError("카드 데이터 파일이 너무 짧습니다.")
+        magic, version, field_count, locale_count, self.card_count = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise CardStoreError("카드 데이터 파일 형식이 아닙니다.")
+        if version != VERSION:
+            raise CardStoreError(f"지원하지 않는 카드 데이터 버전입니다: {version}")
+
+        offset = _HEADER.size
+        fields = []
+        for _ in range(field_count):
+            length = buffer[offset]
+            fields.append(bytes(buffer[offset + 1:offset + 1 + length]).decode('utf-8'))
+            offset += 1 + length
+        self.fields = tuple(fields)
+
+        self._index_offsets = {}
+        for _ in range(locale_count):
+            code, index_offset = _LOCALE.unpack_from(buffer, offset)
+            self._index_offsets[code.rstrip(b'\0').decode('ascii')] = index_offset
+            offset += _LOCALE.size
+        self.locales = tuple(self._index_offsets)
+
+    @classmethod
+    def open(cls, path=DEFAULT_PATH):
+        with open(path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer, source=path)
+
+    def __len__(self):
+        return self.card_count
+
+    def ids(self):
+        return range(self.card_count)
+
+    def get(self, card_id, locale=DEFAULT_LOCALE):
+        key = (locale, card_id)
+        card = self._cache.get(key)
+        if card is not None:
+            return card
+
+        if not 0 <= card_id < self.card_count:
+            raise KeyError(card_id)
+        if locale not in self._index_offsets:
+            raise KeyError(locale)
+
+        record_offset, _ = _INDEX.unpack_from(self.buffer, self._index_offsets[locale] + card_id * _INDEX.size)
+        card = {'id': card_id}
+        offset = record_offset
+        for field in self.fields:
+            (length,) = _FIELD_LEN.unpack_from(self.buffer, offset)
+            offset += _FIELD_LEN.size
+            card[field] = bytes(self.buffer[offset:offset + length]).decode('utf-8')
+            offset += length
+
+        self._cache[key] = card
+        return card
+
+    def close(self):
+        self._cache.clear()
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+
+def write_store(path=DEFAULT_PATH, decks=None):
+    """
+    카드 데이터를 컴파일하여 파일로 저장하는 함수
+
+    임시 파일에 먼저 쓴 뒤 교체하므로 읽는 중인 프로세스가 깨진 파일을 보지 않습니다.
+    """
+    if decks is None:
+        from tarot_data import decks
+    data = compile_decks(decks)
+    # 동시에 시작한 다른 인스턴스와 겹치지 않도록 임시 파일 이름은 매번 새로 만듦
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        # mkstemp는 소유자만 읽을 수 있는 파일을 만들므로 다른 사용자로 실행한 게임도 읽을 수 있게 함
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    return data
+
+
+def is_stale(path=DEFAULT_PATH, source=SOURCE_PATH):
+    if not os.path.exists(path):
+        return True
+    return os.path.exists(source) and os.path.getmtime(source) > os.path.getmtime(path)
+
+
+_store = None
+
+
+def open_store(path=DEFAULT_PATH):
+    """
+    카드 저장소를 여는 함수
+
+    컴파일된 파일이 없거나 tarot_data.py보다 오래되었으면 다시 컴파일합니다.
+    파일을 쓸 수 없는 환경(읽기 전용 파일 시스템)에서는 메모리에서 컴파일한 데이터를 사용합니다.
+    """
+    global _store
+    if _store is not None and path == DEFAULT_PATH:
+        return _store
+
+    store = None
+    if not is_stale(path):
+        try:
+            store = CardStore.open(path)
+        except (OSError, ValueError, CardStoreError):
+            store = None
+
+    if store is None:
+        try:
+            write_store(path)
+            store = CardStore.open(path)
+        except OSError:
+            from tarot_data import decks
+            store = CardStore(compile_decks(decks))
+
+    if path == DEFAULT_PATH:
+        _store = store
+    return store
+
+
+if __name__ == "__main__":
+    data = write_store()
+    store = CardStore(data)
+    print(f"{DEFAULT_PATH} 생성 완료: 카드 {store.card_count}장, 로케일 {', '.join(store.locales)}, {len(data)} 바이트")
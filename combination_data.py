@@ -0,0 +1,71 @@
+# 카드 조합 해석 데이터 (combinations.py에서 컴파일하여 사용)
+#
+# 카드 ID(tarot_data의 목록 순서)마다 정방향/역방향 핵심어와 성격(1: 긍정, 0: 도전)을 정하고,
+# 두 장/세 장 조합 해석은 성격의 조합에 따른 문장 틀에 핵심어를 넣어 만듭니다.
+# 특별한 조합은 AUTHORED_PAIRS, AUTHORED_TRIPLES에 직접 작성한 해석을 사용합니다.
+
+# (정방향 핵심어, 성격), (역방향 핵심어, 성격)
+card_traits = [
+    (("새로운 시작", 1), ("무모함", 0)),
+    (("의지", 1), ("속임수", 0)),
+    (("직관", 1), ("숨겨진 의도", 0)),
+    (("풍요", 1), ("정체", 0)),
+    (("안정", 1), ("경직", 0)),
+    (("신념", 1), ("맹신", 0)),
+    (("사랑", 1), ("불화", 0)),
+    (("전진", 1), ("좌절", 0)),
+    (("용기", 1), ("자기 의심", 0)),
+    (("성찰", 1), ("고립", 0)),
+    (("전환점", 1), ("악순환", 0)),
+    (("균형", 1), ("불공정", 0)),
+    (("기다림", 0), ("무의미한 희생", 0)),
+    (("변화", 0), ("집착", 0)),
+    (("조화", 1), ("조급함", 0)),
+    (("유혹", 0), ("해방", 1)),
+    (("격변", 0), ("변화 회피", 0)),
+    (("희망", 1), ("절망", 0)),
+    (("불확실성", 0), ("진실", 1)),
+    (("성공", 1), ("일시적 좌절", 0)),
+    (("각성", 1), ("후회", 0)),
+    (("완성", 1), ("미완성", 0)),
+]
+
+# 이어지는 두 카드의 해석 - (앞 카드 성격, 뒤 카드 성격)별 문장 틀
+# {a}, {b}는 핵심어이고 조사는 받침에 맞게 바뀝니다 ({b:으로}, {b:이}, {a:을}, {a:과})
+pair_templates = {
+    (1, 1): "{a}의 기운이 {b:으로} 자연스럽게 이어집니다",
+    (1, 0): "{a} 뒤에 {b:이} 찾아오니 방심하지 마세요",
+    (0, 1): "{a:을} 지나 {b:으로} 나아갑니다",
+    (0, 0): "{a:과} {b:이} 겹치니 신중함이 필요합니다",
+}
+
+# 과거·현재·미래 세 카드의 해석 - (과거, 현재, 미래 성격)별 문장 틀
+# {past}, {future}는 과거와 미래 카드의 핵심어
+triple_templates = {
+    (1, 1, 1): "{past}에서 시작된 좋은 흐름이 {future:으로} 결실을 맺습니다",
+    (1, 1, 0): "순조로운 흐름 끝에 {future:이} 기다리니 미리 대비하세요",
+    (1, 0, 1): "{past}의 힘으로 지금의 어려움을 넘어 {future}에 이릅니다",
+    (1, 0, 0): "{past}의 기억에 기대기보다 {future}에 맞설 준비를 하세요",
+    (0, 1, 1): "{past:을} 딛고 일어나 {future:으로} 향하고 있습니다",
+    (0, 1, 0): "회복의 시기를 지나도 {future:이} 남아 있으니 긴장을 늦추지 마세요",
+    (0, 0, 1): "{past}부터 이어진 시련이 끝나고 {future:이} 찾아옵니다",
+    (0, 0, 0): "{past}에서 {future}까지 어려움이 이어지니 흐름을 바꿀 결단이 필요합니다",
+}
+
+# 직접 작성한 조합 해석 (정방향 카드 ID 기준)
+AUTHORED_PAIRS = {
+    (13, 0): "끝은 곧 새로운 시작이 됩니다",
+    (16, 17): "무너진 자리에서 새로운 희망이 떠오릅니다",
+    (15, 16): "얽매였던 것이 한순간에 무너집니다",
+    (18, 19): "불안의 밤이 지나고 밝은 아침이 옵니다",
+    (9, 2): "고요한 성찰 속에서 직관이 깨어납니다",
+    (6, 19): "사랑이 기쁨으로 꽃피웁니다",
+    (12, 13): "오랜 기다림이 변화의 계기가 됩니다",
+    (7, 21): "거침없는 전진이 마침내 완성에 이릅니다",
+}
+
+AUTHORED_TRIPLES = {
+    (0, 10, 21): "새로운 여정이 전환점을 지나 하나의 완성에 이릅니다",
+    (15, 16, 17): "속박이 무너지고 그 자리에 희망이 자랍니다",
+    (18, 20, 19): "혼란 속에서 깨어나 밝은 성공을 맞이합니다",
+}
@@ -0,0 +1,296 @@
+import os
+import re
+import sys
+import mmap
+import struct
+import tempfile
+from array import array
+
+# 컴파일된 카드 조합 해석 파일
+#
+# 카드 키는 카드 ID x 2 + 역방향 여부이고, n = 카드 수 x 2 입니다.
+#
+# 파일 구조 (리틀 엔디언)
+#   헤더:       매직(4) 버전(H) 카드 수(H) 문장 수(I) 두 장 표 오프셋(I) 세 장 표 오프셋(I) 문장 색인 오프셋(I)
+#   두 장 표:    n x n x 문장 번호(I) - [앞 카드][뒤 카드]
+#   세 장 표:    n x n x n x 문장 번호(I) - [과거][현재][미래]
+#   문장 색인:   문장 수 x (오프셋(I) + 길이(I))
+#   문장:       UTF-8
+#
+# 같은 문장은 한 번만 저장합니다. 표는 메모리 매핑되어 조회하는 칸이 있는 페이지만 읽히므로
+# 카드가 많아져도(78장이면 세 장 조합 약 380만 칸) 시작 시간과 메모리 사용량이 늘지 않습니다.
+
+MAGIC = b'TRCB'
+VERSION = 1
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PATH = os.path.join(BASE_DIR, 'tarot_combinations.bin')
+SOURCE_PATHS = (
+    os.path.join(BASE_DIR, 'combination_data.py'),
+    os.path.join(BASE_DIR, 'tarot_data.py'),
+)
+
+_HEADER = struct.Struct('<4sHHIIII')
+_ENTRY = struct.Struct('<I')
+_PHRASE = struct.Struct('<II')
+
+_PLACEHOLDER = re.compile(r'\{(\w+)(?::(\w+))?\}')
+
+
+class CombinationError(Exception):
+    pass
+
+
+def _has_batchim(word):
+    code = ord(word[-1]) - 0xAC00
+    return 0 <= code < 11172 and code % 28 != 0
+
+
+def _particle(word, particle):
+    # 받침에 맞는 조사 (으로/로, 이/가, 을/를, 과/와)
+    batchim = _has_batchim(word)
+    if particle == '으로':
+        # ㄹ 받침 뒤에는 '로'
+        return '으로' if batchim and (ord(word[-1]) - 0xAC00) % 28 != 8 else '로'
+    return {'이': ('이', '가'), '을': ('을', '를'), '과': ('과', '와')}[particle][0 if batchim else 1]
+
+
+def fill_template(template, **words):
+    """
+    문장 틀의 {이름}, {이름:조사}를 핵심어와 받침에 맞는 조사로 채우는 함수
+    """
+    def replace(match):
+        word = words[match.group(1)]
+        return word + _particle(word, match.group(2)) if match.group(2) else word
+    return _PLACEHOLDER.sub(replace, template)
+
+
+def card_key(card_id, reversed=False):
+    return card_id * 2 + (1 if reversed else 0)
+
+
+def compile_combinations(card_traits, pair_templates, triple_templates, authored_pairs=None, authored_triples=None):
+    """
+    카드 특성과 문장 틀로 모든 두 장/세 장 조합의 해석을 만들어 바이너리 데이터로 컴파일하는 함수
+
+    Args:
+        card_traits (list): 카드 ID마다 ((정방향 핵심어, 성격), (역방향 핵심어, 성격))
+        pair_templates (dict): (앞, 뒤 성격) -> 문장 틀
+        triple_templates (dict): (과거, 현재, 미래 성격) -> 문장 틀
+        authored_pairs (dict): (카드 ID, 카드 ID) -> 직접 작성한 해석 (정방향)
+        authored_triples (dict): (카드 ID, 카드 ID, 카드 ID) -> 직접 작성한 해석 (정방향)
+
+    Returns:
+        bytes: 컴파일된 데이터
+    """
+    card_count = len(card_traits)
+    n = card_count * 2
+    traits = [trait for upright_and_reversed in card_traits for trait in upright_and_reversed]
+
+    phrases = []
+    phrase_ids = {}
+
+    def phrase_id(text):
+        index = phrase_ids.get(text)
+        if index is None:
+            index = phrase_ids[text] = len(phrases)
+            phrases.append(text)
+        return index
+
+    def check_card(card_id):
+        if not 0 <= card_id < card_count:
+            raise CombinationError(f"카드 ID가 범위를 벗어났습니다: {card_id}")
+        return card_key(card_id)
+
+    try:
+        # 두 장 표
+        pairs = array('I')
+        for a_word, a_tone in traits:
+            pairs.extend(phrase_id(fill_template(pair_templates[a_tone, b_tone], a=a_word, b=b_word))
+                         for b_word, b_tone in traits)
+        for (a, b), text in (authored_pairs or {}).items():
+            pairs[check_card(a) * n + check_card(b)] = phrase_id(text)
+
+        # 세 장 표 - 해석은 과거와 미래 핵심어, 현재 카드의 성격으로 정해지므로
+        # (과거, 현재 성격)마다 미래 카드 n개의 행을 한 번만 만들어 반복해서 붙임
+        triples = array('I')
+        for past_word, past_tone in traits:
+            rows = {}
+            for present_tone in (0, 1):
+                rows[present_tone] = array('I', (
+                    phrase_id(fill_template(triple_templates[past_tone, present_tone, future_tone],
+                                            past=past_word, future=future_word))
+                    for future_word, future_tone in traits))
+            for _, present_tone in traits:
+                triples.extend(rows[present_tone])
+        for (past, present, future), text in (authored_triples or {}).items():
+            triples[(check_card(past) * n + check_card(present)) * n + check_card(future)] = phrase_id(text)
+    except KeyError as e:
+        raise CombinationError(f"문장 틀이 없습니다: {e}")
+
+    if array('I').itemsize != _ENTRY.size:
+        raise CombinationError("이 플랫폼에서는 조합 표를 만들 수 없습니다.")
+    if sys.byteorder == 'big':
+        pairs.byteswap()
+        triples.byteswap()
+
+    encoded = [text.encode('utf-8') for text in phrases]
+    pairs_offset = _HEADER.size
+    triples_offset = pairs_offset + len(pairs) * _ENTRY.size
+    phrase_index_offset = triples_offset + len(triples) * _ENTRY.size
+    pool_offset = phrase_index_offset + len(encoded) * _PHRASE.size
+
+    phrase_index = bytearray()
+    offset = pool_offset
+    for data in encoded:
+        phrase_index += _PHRASE.pack(offset, len(data))
+        offset += len(data)
+
+    header = _HEADER.pack(MAGIC, VERSION, card_count, len(phrases), pairs_offset, triples_offset, phrase_index_offset)
+    return b''.join([header, pairs.tobytes(), triples.tobytes(), bytes(phrase_index)] + encoded)
+
+
+class CombinationTable:
+    """
+    컴파일된 조합 해석 표
+
+    조회는 표의 한 칸과 문장 하나만 읽으므로 카드 수와 관계없이 O(1)입니다.
+    """
+
+    def __init__(self, buffer, source=None):
+        self.buffer = buffer
+        self.source = source
+        self._cache = {}
+
+        if len(buffer) < _HEADER.size:
+            raise CombinationError("조합 해석 파일이 너무 짧습니다.")
+        (magic, version, self.card_count, self.phrase_count,
+         self._pairs_offset, self._triples_offset, self._phrase_index_offset) = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise CombinationError("조합 해석 파일 형식이 아닙니다.")
+        if version != VERSION:
+            raise CombinationError(f"지원하지 않는 조합 해석 버전입니다: {version}")
+        self._n = self.card_count * 2
+
+    @classmethod
+    def open(cls, path=DEFAULT_PATH):
+        with open(path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer, source=path)
+
+    def _key(self, card):
+        # card: (카드 ID, 역방향 여부)
+        card_id, reversed = card
+        if not 0 <= card_id < self.card_count:
+            raise KeyError(card_id)
+        return card_key(card_id, reversed)
+
+    def _phrase(self, index):
+        text = self._cache.get(index)
+        if text is None:
+            offset, length = _PHRASE.unpack_from(self.buffer, self._phrase_index_offset + index * _PHRASE.size)
+            text = self._cache[index] = bytes(self.buffer[offset:offset + length]).decode('utf-8')
+        return text
+
+    def pair(self, first, second):
+        """
+        이어지는 두 카드의 해석을 반환하는 함수
+
+        Args:
+            first, second (tuple): (카드 ID, 역방향 여부)
+        """
+        cell = self._key(first) * self._n + self._key(second)
+        (index,) = _ENTRY.unpack_from(self.buffer, self._pairs_offset + cell * _ENTRY.size)
+        return self._phrase(index)
+
+    def triple(self, past, present, future):
+        """
+        과거·현재·미래 세 카드의 해석을 반환하는 함수
+        """
+        cell = (self._key(past) * self._n + self._key(present)) * self._n + self._key(future)
+        (index,) = _ENTRY.unpack_from(self.buffer, self._triples_offset + cell * _ENTRY.size)
+        return self._phrase(index)
+
+    def close(self):
+        self._cache.clear()
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+
+
+def _compile_default():
+    import combination_data
+    from tarot_data import tarot_cards
+    if len(combination_data.card_traits) != len(tarot_cards):
+        raise CombinationError("combination_data의 카드 수가 tarot_data와 다릅니다.")
+    return compile_combinations(combination_data.card_traits, combination_data.pair_templates,
+                                combination_data.triple_templates, combination_data.AUTHORED_PAIRS,
+                                combination_data.AUTHORED_TRIPLES)
+
+
+def write_table(path=DEFAULT_PATH):
+    """
+    조합 해석을 컴파일하여 파일로 저장하는 함수 (임시 파일에 쓴 뒤 교체)
+    """
+    data = _compile_default()
+    # 동시에 시작한 다른 인스턴스와 겹치지 않도록 임시 파일 이름은 매번 새로 만듦
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        # mkstemp는 소유자만 읽을 수 있는 파일을 만들므로 다른 사용자로 실행한 게임도 읽을 수 있게 함
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    return data
+
+
+def is_stale(path=DEFAULT_PATH, sources=SOURCE_PATHS):
+    if not os.path.exists(path):
+        return True
+    mtime = os.path.getmtime(path)
+    return any(os.path.exists(source) and os.path.getmtime(source) > mtime for source in sources)
+
+
+_table = None
+
+
+def open_table(path=DEFAULT_PATH):
+    """
+    조합 해석 표를 여는 함수
+
+    컴파일된 파일이 없거나 데이터 파일보다 오래되었으면 다시 컴파일하고,
+    파일을 쓸 수 없는 환경에서는 메모리에서 컴파일한 데이터를 사용합니다.
+    """
+    global _table
+    if _table is not None and path == DEFAULT_PATH:
+        return _table
+
+    table = None
+    if not is_stale(path):
+        try:
+            table = CombinationTable.open(path)
+        except (OSError, ValueError, CombinationError):
+            table = None
+
+    if table is None:
+        try:
+            write_table(path)
+            table = CombinationTable.open(path)
+        except OSError:
+            table = CombinationTable(_compile_default())
+
+    if path == DEFAULT_PATH:
+        _table = table
+    return table
+
+
+if __name__ == "__main__":
+    data = write_table()
+    table = CombinationTable(data)
+    print(f"{DEFAULT_PATH} 생성 완료: 카드 {table.card_count}장, 문장 {table.phrase_count}개, {len(data)} 바이트")
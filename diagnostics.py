@@ -0,0 +1,257 @@
+import gc
+import os
+import sys
+import json
+import random
+import argparse
+import tracemalloc
+
+import pygame
+
+from app import app, SCREEN_WIDTH, SCREEN_HEIGHT
+
+# 메모리 진단 모드
+#
+# 게임을 창 없이 실행하여 리딩(시작 → 카드 선택 → 결과 → 상세 보기 → 다시 시작)을
+# 여러 번 반복하고, 리딩이 끝날 때마다 메모리를 측정합니다.
+#   traced_bytes:  tracemalloc으로 추적한 파이썬 할당 크기
+#   surfaces:      파이썬 객체가 참조하는 Surface 수와 픽셀 메모리(surface_bytes)
+#   cards:         살아 있는 Card 객체 수
+#   rss_bytes:     프로세스 상주 메모리
+#
+# 리딩마다 같은 시드로 같은 카드를 같은 순서로 선택하므로, 캐시가 채워진 뒤에는 메모리가
+# 일정해야 합니다. 처음 몇 번(WARMUP_CYCLES)은 캐시가 채워지는 구간이므로 제외하고, 나머지 측정값의
+# 앞 절반과 뒤 절반의 평균 차이가 GROWTH_LIMITS를 넘으면 메모리가 늘고 있다고 판단합니다.
+
+WARMUP_CYCLES = 3
+
+GROWTH_LIMITS = {
+    'traced_bytes': 64 * 1024,
+    'surfaces': 2,
+    'surface_bytes': 256 * 1024,
+    'cards': 0,
+    'rss_bytes': 2 * 1024 * 1024,
+}
+
+# 진단 도구 자신과 모듈 import로 생긴 할당은 측정에서 제외
+_TRACE_FILTERS = (
+    tracemalloc.Filter(False, __file__),
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+    tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+)
+
+# 스크립트 입력에서 카드를 뒤집고 이동하는 애니메이션이 끝날 때까지 기다리는 프레임 수
+ANIMATION_FRAMES = 25
+
+
+def resident_bytes():
+    # 현재 상주 메모리 (리눅스 /proc, 그 외에는 최대 상주 메모리)
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        import resource
+        max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+
+def count_surfaces():
+    """
+    파이썬 객체(목록, 딕셔너리, 인스턴스 속성)가 참조하는 Surface 수와 픽셀 메모리를 세는 함수
+
+    Surface는 가비지 컬렉터가 추적하지 않으므로 추적되는 객체의 참조를 따라가며 찾습니다.
+    """
+    seen = set()
+    total_bytes = 0
+    for obj in gc.get_objects():
+        for ref in gc.get_referents(obj):
+            if isinstance(ref, pygame.Surface) and id(ref) not in seen:
+                seen.add(id(ref))
+                total_bytes += ref.get_pitch() * ref.get_height()
+    return len(seen), total_bytes
+
+
+class MemoryTracker:
+    def __init__(self):
+        self.samples = []
+        self._baseline = None
+        self._card_type = None
+
+    def start(self):
+        tracemalloc.start()
+
+    def _snapshot(self):
+        return tracemalloc.take_snapshot().filter_traces(_TRACE_FILTERS)
+
+    def sample(self):
+        gc.collect()
+        if self._card_type is None:
+            from game import Card
+            self._card_type = Card
+        snapshot = self._snapshot()
+        surfaces, surface_bytes = count_surfaces()
+        self.samples.append({
+            'traced_bytes': sum(stat.size for stat in snapshot.statistics('filename')),
+            'surfaces': surfaces,
+            'surface_bytes': surface_bytes,
+            'cards': sum(1 for obj in gc.get_objects() if isinstance(obj, self._card_type)),
+            'rss_bytes': resident_bytes(),
+        })
+        if len(self.samples) == WARMUP_CYCLES:
+            self._baseline = snapshot
+
+    def growth(self):
+        """
+        워밍업 이후 측정값의 앞 절반과 뒤 절반의 평균 차이를 반환하는 함수
+        """
+        steady = self.samples[WARMUP_CYCLES:]
+        if len(steady) < 2:
+            return {}
+        half = len(steady) // 2
+        growth = {}
+        for name in GROWTH_LIMITS:
+            first = sum(sample[name] for sample in steady[:half]) / half
+            second = sum(sample[name] for sample in steady[-half:]) / half
+            growth[name] = second - first
+        return growth
+
+    def flagged(self):
+        return [name for name, value in self.growth().items() if value > GROWTH_LIMITS[name]]
+
+    def top_growth(self, limit=5):
+        # 워밍업 이후 가장 많이 늘어난 할당 위치
+        if self._baseline is None:
+            return []
+        stats = self._snapshot().compare_to(self._baseline, 'lineno')
+        return [str(stat) for stat in stats[:limit] if stat.size_diff > 0]
+
+    def stop(self):
+        tracemalloc.stop()
+
+
+class CycleInput:
+    """
+    같은 리딩을 정해진 횟수만큼 반복하는 스크립트 입력 소스
+
+    리딩이 끝나 시작 화면으로 돌아올 때마다 tracker로 메모리를 측정합니다.
+    """
+
+    def __init__(self, cycles, tracker, seed=0):
+        self.seed = seed
+        self.tracker = tracker
+        self._steps = self._script(cycles)
+        self._measure = False
+
+    def _script(self, cycles):
+        from game import CARD_WIDTH, CARD_HEIGHT, READING_DELAY_FRAMES
+        from spreads import load_spreads
+
+        spread = load_spreads()[0]
+        start_button = (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 125)
+        back_button = (SCREEN_WIDTH // 2, SCREEN_HEIGHT - 55)
+        first_position = (int(SCREEN_WIDTH * spread.positions[0][1]), int(SCREEN_HEIGHT * spread.positions[0][2]))
+
+        def card_center(index):
+            # init_game의 3행 7열 배치
+            return (30 + (index % 7) * (CARD_WIDTH + 10) + CARD_WIDTH // 2,
+                    150 + (index // 7) * (CARD_HEIGHT + 20) + CARD_HEIGHT // 2)
+
+        for _ in range(cycles):
+            # 리딩마다 같은 카드가 같은 자리에 놓이도록 시작 전에 난수를 다시 설정
+            random.seed(self.seed)
+            yield start_button, True
+            yield from [(start_button, False)] * 2
+            for pick in range(spread.size):
+                center = card_center(pick)
+                yield center, True
+                yield from [(center, False)] * ANIMATION_FRAMES
+            # 리딩 화면으로 넘어가 카드가 스프레드 위치로 이동할 때까지
+            yield from [(first_position, False)] * (READING_DELAY_FRAMES + ANIMATION_FRAMES)
+            # 상세 보기 → 결과 → 다시 시작
+            yield first_position, True
+            yield first_position, False
+            yield first_position, True
+            yield back_button, False
+            yield back_button, True
+            yield back_button, 'measure'
+
+    def start(self):
+        pass
+
+    def poll(self):
+        try:
+            pos, action = next(self._steps)
+        except StopIteration:
+            self._measure = False
+            return (0, 0), [pygame.event.Event(pygame.QUIT)]
+        self._measure = action == 'measure'
+        screen_pos = app.viewport.point(pos)
+        events = [pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=screen_pos, button=1)] if action is True else []
+        return screen_pos, events
+
+    def end_frame(self):
+        if self._measure:
+            self.tracker.sample()
+
+    def close(self):
+        pass
+
+
+def run(cycles):
+    """
+    리딩을 cycles번 반복하며 메모리를 측정하는 함수
+    """
+    import game
+    from history import history
+
+    history.path = None
+    tracker = MemoryTracker()
+    tracker.start()
+    try:
+        game.main(game.DARK_THEME, CycleInput(cycles, tracker))
+        return {
+            'samples': tracker.samples,
+            'growth': tracker.growth(),
+            'flagged': tracker.flagged(),
+            'top_growth': tracker.top_growth(),
+        }
+    finally:
+        tracker.stop()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='리딩을 반복하며 메모리 증가를 찾는 진단 도구')
+    parser.add_argument('--cycles', type=int, default=30, help='반복할 리딩 수')
+    parser.add_argument('--window', action='store_true', help='창을 띄워 실행 (기본은 창 없이)')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args(argv)
+    if args.cycles <= WARMUP_CYCLES + 1:
+        parser.error(f"--cycles는 {WARMUP_CYCLES + 1}보다 커야 합니다.")
+    if not args.window:
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+    result = run(args.cycles)
+    if args.json:
+        print(json.dumps(result))
+        return 1 if result['flagged'] else 0
+
+    print(f"{'':5s} {'추적(KB)':>10s} {'Surface':>8s} {'픽셀(KB)':>10s} {'카드':>5s} {'RSS(MB)':>8s}")
+    for i, sample in enumerate(result['samples'], 1):
+        print(f"{i:5d} {sample['traced_bytes'] / 1024:10.1f} {sample['surfaces']:8d} "
+              f"{sample['surface_bytes'] / 1024:10.1f} {sample['cards']:5d} {sample['rss_bytes'] / 1024 / 1024:8.1f}")
+    print(f"워밍업 {WARMUP_CYCLES}회 이후 증가량:")
+    for name, value in result['growth'].items():
+        mark = '  <- 증가' if name in result['flagged'] else ''
+        print(f"  {name:14s} {value:12.1f} (허용 {GROWTH_LIMITS[name]}){mark}")
+    if result['flagged']:
+        print("메모리가 계속 늘고 있습니다. 가장 많이 늘어난 할당 위치:")
+        for line in result['top_growth']:
+            print(f"  {line}")
+        return 1
+    print("메모리 사용량이 일정합니다.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
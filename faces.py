@@ -0,0 +1,150 @@
+import os
+import zlib
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pygame
+
+from app import app, CARD_WIDTH, CARD_HEIGHT, FACE_FONT_SIZES, WHITE, BLACK, PURPLE
+from glyphs import open_atlas, render_text
+
+# 카드 앞면 이미지 생성기
+#
+# 이미지 파일이 없는 카드의 앞면은 메모리에서 그립니다. init_game에서 배치되는 카드의
+# 앞면을 한 번에 작업 스레드로 넘겨 미리 그려 두고, 카드를 그릴 때 아직 끝나지 않았으면
+# 그 카드의 작업만 기다립니다.
+#
+# 기본적으로 디스크에는 쓰지 않습니다 (읽기 전용 파일 시스템에서도 실행 가능).
+# 환경 변수 TAROT_FACE_CACHE로 캐시 디렉토리를 지정하면 그린 이미지를 별도 스레드에서
+# PNG로 저장하고, 다음 실행부터는 저장된 이미지를 읽어 씁니다.
+
+FACE_CACHE_DIR = os.environ.get('TAROT_FACE_CACHE') or None
+
+
+def render_face(card_data, name_font, meaning_font):
+    """
+    카드 이름과 의미로 기본 카드 앞면을 그리는 함수
+
+    글자는 render_text로 그리므로 한글 폰트가 없는 기기에서도 글리프 아틀라스의 글자로 표시됩니다.
+    """
+    card_front = pygame.Surface((CARD_WIDTH, CARD_HEIGHT))
+    card_front.fill(WHITE)
+    pygame.draw.rect(card_front, BLACK, card_front.get_rect(), 2)
+
+    # 카드 이름
+    name_text = render_text(card_data["name"], FACE_FONT_SIZES[0], BLACK, name_font)
+    card_front.blit(name_text, name_text.get_rect(center=(60, 30)))
+
+    # 구분선
+    pygame.draw.line(card_front, BLACK, (20, 50), (100, 50), 1)
+
+    # 카드 의미
+    meaning_text = render_text(card_data["meaning"], FACE_FONT_SIZES[1], PURPLE, meaning_font)
+    card_front.blit(meaning_text, meaning_text.get_rect(center=(60, 70)))
+    return card_front
+
+
+def _face_key(card_data):
+    # 같은 이미지 파일이라도 언어가 다르면 다른 앞면
+    return (card_data['image_file'], card_data['name'], card_data['meaning'])
+
+
+def _load_font(path, size):
+    try:
+        return pygame.font.Font(path, size)
+    except (OSError, pygame.error):
+        return pygame.font.Font(None, size)
+
+
+class FaceGenerator:
+    def __init__(self, cache_dir=FACE_CACHE_DIR):
+        self.cache_dir = cache_dir
+        # 작업 스레드 전용 폰트 - 폰트 생성은 app의 폰트와 겹치지 않도록 메인 스레드(generate)에서 하고,
+        # 그리기는 작업 스레드 하나에서만 하므로 다른 스레드와 공유하지 않음
+        self._executor = None
+        self._writer = None
+        self._fonts = None
+        # 앞면 키 -> Future
+        self._pending = {}
+
+    def _cache_path(self, card_data):
+        if not self.cache_dir:
+            return None
+        stem = os.path.splitext(card_data['image_file'])[0]
+        checksum = zlib.crc32('\0'.join(_face_key(card_data)).encode('utf-8'))
+        return os.path.join(self.cache_dir, f"{stem}-{checksum:08x}.png")
+
+    def generate(self, cards_data):
+        """
+        카드 앞면들을 한 번에 작업 스레드에 맡기는 함수 (기다리지 않음)
+        """
+        if not pygame.font.get_init():
+            pygame.font.init()
+        if self._fonts is None:
+            font_path = app.font_path
+            self._fonts = tuple(_load_font(font_path, size) for size in FACE_FONT_SIZES)
+            # 글리프 아틀라스 파일도 작업 스레드가 쓰기 전에 메인 스레드에서 열어 둠
+            open_atlas()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tarot-faces')
+        for card_data in cards_data:
+            key = _face_key(card_data)
+            if key not in self._pending:
+                self._pending[key] = self._executor.submit(self._build, card_data, self._fonts)
+
+    def face(self, card_data):
+        """
+        카드 앞면을 반환하는 함수 - 작업이 끝나지 않았으면 기다림
+
+        반환한 Surface는 보관하지 않습니다 (보관은 assets 캐시가 담당).
+        """
+        self.generate([card_data])
+        return self._pending.pop(_face_key(card_data)).result()
+
+    def _build(self, card_data, fonts):
+        # 작업 스레드에서 실행
+        cache_path = self._cache_path(card_data)
+        if cache_path and os.path.exists(cache_path):
+            try:
+                return pygame.image.load(cache_path)
+            except pygame.error:
+                pass
+
+        face = render_face(card_data, *fonts)
+
+        if cache_path:
+            if self._writer is None:
+                self._writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tarot-face-cache')
+            self._writer.submit(self._save, face.copy(), cache_path)
+        return face
+
+    def _save(self, face, path):
+        # 저장에 실패해도 게임에는 영향이 없음 (다음 실행에서 다시 그림)
+        # 같은 캐시 디렉토리를 쓰는 다른 인스턴스와 겹치지 않도록 임시 파일 이름은 매번 새로 만듦
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + '.',
+                                             suffix='.tmp')
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                pygame.image.save(face, f, 'png')
+            os.replace(temp_path, path)
+        except (OSError, pygame.error):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    def close(self):
+        # 남은 작업과 저장을 마치고 스레드 종료 (pygame.quit 전에 호출)
+        self._pending.clear()
+        for executor in (self._executor, self._writer):
+            if executor is not None:
+                executor.shutdown(wait=True)
+        self._executor = self._writer = None
+        self._fonts = None
+
+
+faces = FaceGenerator()
@@ -1,47 +1,61 @@
 import pygame
 import random
-import sys
 import os
 from pygame.locals import *
-import urllib.request
-from tarot_data import tarot_cards
+from app import (app, SCREEN_WIDTH, SCREEN_HEIGHT, FONT_SIZES, CARD_WIDTH, CARD_HEIGHT,
+                 WHITE, BLACK, GOLD, LIGHT_BLUE, DARK_BLUE)
+from assets import assets
+from faces import faces
+from history import history
+from replay import input_source, LiveInput
+from snapshot import snapshots, SessionState, SnapshotError, card_record, record_reversed, apply_card_record
+from card_store import open_store
+from spreads import load_spreads, get_layout
+from sprites import SpriteBatch, DealAnimation
+from glyphs import text_width
 
-# 초기화
-pygame.init()
-pygame.font.init()
+# 카드 이미지 디렉토리 - 게임을 어느 디렉토리에서 실행해도 같은 파일을 읽음
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+IMAGE_DIR = os.path.join(BASE_DIR, 'images')
+CARD_BACK_PATH = os.path.join(IMAGE_DIR, 'card_back.png')
 
-# 화면 설정
-SCREEN_WIDTH = 1024
-SCREEN_HEIGHT = 768
-screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-pygame.display.set_caption('타로 카드 리딩')
+# 상세 보기 카드 크기 (기준 해상도)
+DETAIL_CARD_WIDTH, DETAIL_CARD_HEIGHT = 240, 360
 
-# 색상 정의
-WHITE = (255, 255, 255)
-BLACK = (0, 0, 0)
-PURPLE = (128, 0, 128)
-GOLD = (218, 165, 32)
-LIGHT_BLUE = (173, 216, 230)
-DARK_BLUE = (0, 0, 139)
-BACKGROUND = (20, 20, 50)
+# 카드가 역방향으로 뽑힐 확률
+REVERSED_CHANCE = 0.5
 
-# 폰트 설정 (한글 지원)
-try:
-    font_large = pygame.font.SysFont('malgungothic', 48)
-    font_medium = pygame.font.SysFont('malgungothic', 28)
-    font_small = pygame.font.SysFont('malgungothic', 20)
-except:
-    font_large = pygame.font.Font(None, 48)
-    font_medium = pygame.font.Font(None, 28)
-    font_small = pygame.font.Font(None, 20)
+# 마지막 카드를 고른 뒤 리딩 화면으로 넘어가기까지의 프레임 수 (뒤집기 20프레임 + 잠시 보여 줌)
+READING_DELAY_FRAMES = 40
 
-# 이미지 디렉토리 확인 및 생성
-if not os.path.exists('images'):
-    os.makedirs('images')
+# 화면 테마
+class Theme:
+    def __init__(self, background_top, background_bottom, star_color=None, star_count=50,
+                 title_color=GOLD, text_color=WHITE, panel_color=BLACK):
+        self.background_top = background_top
+        self.background_bottom = background_bottom
+        self.star_color = star_color  # None이면 별마다 밝기가 다른 흰색
+        self.star_count = star_count
+        self.title_color = title_color
+        self.text_color = text_color
+        self.panel_color = panel_color  # 안내문 배경 (None이면 그리지 않음)
+
+DARK_THEME = Theme((20, 20, 30), (50, 50, 60))
+
+# 텍스트 그리기 (기준 해상도 좌표, 예: center=(x, y))
+def draw_text(text, size, color, **position):
+    surface = assets.text(text, size, color)
+    (anchor, pos), = position.items()
+    app.backend.blit(surface, surface.get_rect(**{anchor: app.viewport.point(pos)}).topleft)
+
+# 카드 이미지를 보관할 최대 크기 (상세 보기 크기 x 이 기기에서 가능한 최대 화면 배율)
+def card_image_size():
+    scale = app.max_scale()
+    return (round(DETAIL_CARD_WIDTH * scale), round(DETAIL_CARD_HEIGHT * scale))
 
 # 카드 뒷면 이미지 생성
 def create_card_back():
-    card_back = pygame.Surface((120, 180))
+    card_back = pygame.Surface((CARD_WIDTH, CARD_HEIGHT))
     card_back.fill(DARK_BLUE)
     
     # 카드 뒷면 디자인
@@ -55,68 +69,77 @@ def create_card_back():
     # 대각선 그리기
     pygame.draw.line(card_back, GOLD, (center_x - 30, center_y - 30), (center_x + 30, center_y + 30), 1)
     pygame.draw.line(card_back, GOLD, (center_x - 30, center_y + 30), (center_x + 30, center_y - 30), 1)
-    
-    # 이미지 저장
-    pygame.image.save(card_back, 'images/card_back.png')
     return card_back
 
+def card_back_image():
+    return assets.image(CARD_BACK_PATH, create_card_back, card_image_size())
+
+# 화면 크기로 줄인 카드 뒷면
+def card_back_surface(size):
+    return assets.scaled_image(CARD_BACK_PATH, size, create_card_back, card_image_size())
+
+# 호버 테두리 (화면 크기의 카드마다 해상도별로 한 번만 그림)
+def hover_border(size, border):
+    def build_border(viewport):
+        surface = pygame.Surface((size[0] + border * 2, size[1] + border * 2), pygame.SRCALPHA)
+        pygame.draw.rect(surface, GOLD, surface.get_rect(), border * 2)
+        return surface
+    return assets.cached(('hover', size, border), build_border)
+
 # 카드 클래스
 class Card:
-    def __init__(self, x, y, width, height, card_data):
+    def __init__(self, x, y, width, height, card_data, reversed=False):
+        # 위치와 크기는 기준 해상도 좌표 - 실제 화면 좌표는 그릴 때 app.viewport로 변환
         self.rect = pygame.Rect(x, y, width, height)
         self.card_data = card_data
+        self.reversed = reversed  # 역방향 카드
         self.revealed = False
         self.hover = False
         self.flip_progress = 0  # 0: 뒷면, 100: 앞면
         self.flipping = False
         self.original_pos = (x, y)
         self.target_pos = (x, y)
+        self.original_size = (width, height)
+        self.target_size = (width, height)
         self.move_progress = 0
         self.moving = False
+    
+    # 카드 이미지는 Card가 들고 있지 않고 필요할 때 assets 캐시에서 가져옴
+    # (처음 그릴 때 읽고, 메모리 예산을 넘으면 오래 쓰지 않은 이미지부터 해제됨)
+    @property
+    def image_path(self):
+        return os.path.join(IMAGE_DIR, self.card_data['image_file'])
+    
+    # 방향에 맞는 카드 이름, 의미, 설명
+    @property
+    def name(self):
+        return self.card_data["name"] + (" (역방향)" if self.reversed else "")
+    
+    @property
+    def meaning(self):
+        return self.card_data["reversed_meaning" if self.reversed else "meaning"]
+    
+    @property
+    def description(self):
+        return self.card_data["reversed_description" if self.reversed else "description"]
+    
+    def face_surface(self, size):
+        # 화면 크기에 맞춘 앞면 (역방향이면 미리 돌려 둔 이미지)
+        # 이미지 파일이 없으면 faces에서 메모리에 그린 기본 카드 사용
+        face = assets.scaled_image(self.image_path, size, lambda: faces.face(self.card_data), card_image_size())
+        return assets.rotated(face) if self.reversed else face
+    
+    @property
+    def z(self):
+        # 움직이거나 뒤집히는 카드는 다른 카드보다 위에 그림
+        return 1 if self.moving or self.flipping else 0
+    
+    def draw(self, batch=None):
+        # batch가 있으면 batch에 추가만 하고 (sprites.py), 없으면 바로 그림
+        own_batch = batch is None
+        if own_batch:
+            batch = SpriteBatch()
         
-        # 이미지 로드 또는 생성
-        self.front_image = self.create_card_front()
-        self.back_image = pygame.image.load('images/card_back.png') if os.path.exists('images/card_back.png') else create_card_back()
-        
-    def create_card_front(self):
-        # 실제 이미지 파일이 있는지 확인
-        image_path = os.path.join('images', self.card_data['image_file'])
-        if os.path.exists(image_path):
-            return pygame.image.load(image_path)
-        
-        # 이미지가 없으면 기본 카드 생성
-        card_front = pygame.Surface((120, 180))
-        card_front.fill(WHITE)
-        pygame.draw.rect(card_front, BLACK, card_front.get_rect(), 2)
-        
-        # 카드 이름 렌더링
-        try:
-            name_font = pygame.font.SysFont('malgungothic', 16)
-        except:
-            name_font = pygame.font.Font(None, 16)
-            
-        name_text = name_font.render(self.card_data["name"], True, BLACK)
-        name_rect = name_text.get_rect(center=(60, 30))
-        card_front.blit(name_text, name_rect)
-        
-        # 구분선
-        pygame.draw.line(card_front, BLACK, (20, 50), (100, 50), 1)
-        
-        # 카드 의미
-        try:
-            meaning_font = pygame.font.SysFont('malgungothic', 14)
-        except:
-            meaning_font = pygame.font.Font(None, 14)
-            
-        meaning_text = meaning_font.render(self.card_data["meaning"], True, PURPLE)
-        meaning_rect = meaning_text.get_rect(center=(60, 70))
-        card_front.blit(meaning_text, meaning_rect)
-        
-        # 이미지 저장
-        pygame.image.save(card_front, image_path)
-        return card_front
-        
-    def draw(self):
         # 카드 이동 애니메이션
         if self.moving:
             self.move_progress += 5
@@ -125,10 +148,13 @@ class Card:
                 self.moving = False
                 self.rect.x = self.target_pos[0]
                 self.rect.y = self.target_pos[1]
+                self.rect.size = self.target_size
             else:
                 progress = self.move_progress / 100
                 self.rect.x = self.original_pos[0] + (self.target_pos[0] - self.original_pos[0]) * progress
                 self.rect.y = self.original_pos[1] + (self.target_pos[1] - self.original_pos[1]) * progress
+                self.rect.width = self.original_size[0] + (self.target_size[0] - self.original_size[0]) * progress
+                self.rect.height = self.original_size[1] + (self.target_size[1] - self.original_size[1]) * progress
         
         # 카드 뒤집기 애니메이션
         if self.flipping:
@@ -138,30 +164,37 @@ class Card:
                 self.flipping = False
                 self.revealed = True
         
+        # 실제 화면 좌표와 크기
+        dest = app.viewport.rect(self.rect)
+        
         # 카드 그리기
+        # 목표 크기로 한 번 축소된 이미지를 캐시에서 가져오고,
+        # 애니메이션 중일 때만 백엔드에서 크기를 조정하여 그림 (sdl2는 텍스처 복사)
+        size = app.viewport.scale_size(self.target_size)
         if self.flip_progress < 50:
             # 뒷면 그리기
             width_scale = 1 - (self.flip_progress / 50) * 0.9
-            
-            scaled_width = int(self.rect.width * width_scale)
-            scaled_back = pygame.transform.scale(self.back_image, (scaled_width, self.rect.height))
-            
-            x = self.rect.x + (self.rect.width - scaled_width) // 2
-            screen.blit(scaled_back, (x, self.rect.y))
-            
-            # 호버 효과
-            if self.hover and not self.flipping and not self.revealed:
-                # 더 두꺼운 테두리와 밝은 색상으로 강조
-                pygame.draw.rect(screen, GOLD, (x-2, self.rect.y-2, scaled_width+4, self.rect.height+4), 4)
+            scaled = card_back_surface(size)
         else:
             # 앞면 그리기
             width_scale = (self.flip_progress - 50) / 50 * 0.9 + 0.1
-            
-            scaled_width = int(self.rect.width * width_scale)
-            scaled_front = pygame.transform.scale(self.front_image, (scaled_width, self.rect.height))
-            
-            x = self.rect.x + (self.rect.width - scaled_width) // 2
-            screen.blit(scaled_front, (x, self.rect.y))
+            scaled = self.face_surface(size)
+        
+        scaled_width = int(dest.width * width_scale)
+        
+        x = dest.x + (dest.width - scaled_width) // 2
+        z = self.z
+        batch.add(scaled, pygame.Rect(x, dest.y, scaled_width, dest.height), z)
+        
+        # 호버 효과
+        if self.flip_progress < 50 and self.hover and not self.flipping and not self.revealed:
+            # 더 두꺼운 테두리와 밝은 색상으로 강조
+            border = app.viewport.length(2)
+            outline = hover_border((scaled_width, dest.height), border)
+            batch.add(outline, outline.get_rect(topleft=(x - border, dest.y - border)), z)
+        
+        if own_batch:
+            batch.draw()
     
     def check_hover(self, pos):
         was_hover = self.hover
@@ -173,7 +206,7 @@ class Card:
         # 카드 주변에 약간의 여유를 두어 클릭 감지 영역을 넓힘
         expanded_rect = self.rect.inflate(20, 20)  # 가로, 세로로 각각 20픽셀 확장
         return expanded_rect.collidepoint(pos) and not self.revealed and not self.flipping
-        
+    
     def start_flip(self):
         if not self.revealed and not self.flipping:
             self.flipping = True
@@ -181,9 +214,11 @@ class Card:
             return True
         return False
     
-    def move_to(self, x, y):
+    def move_to(self, x, y, width=None, height=None):
         self.original_pos = (self.rect.x, self.rect.y)
         self.target_pos = (x, y)
+        self.original_size = self.rect.size
+        self.target_size = (width or self.rect.width, height or self.rect.height)
         self.moving = True
         self.move_progress = 0
 
@@ -195,18 +230,23 @@ class Button:
         self.color = color
         self.hover_color = hover_color
         self.hover = False
-        
+    
     def draw(self):
-        if self.hover:
-            pygame.draw.rect(screen, self.hover_color, self.rect, border_radius=10)
-        else:
-            pygame.draw.rect(screen, self.color, self.rect, border_radius=10)
-        
-        pygame.draw.rect(screen, BLACK, self.rect, 2, border_radius=10)
+        # 버튼 모양은 해상도와 상태마다 한 번만 그려 둠
+        def build_button(viewport):
+            rect = viewport.rect(self.rect)
+            radius = viewport.length(10)
+            surface = pygame.Surface(rect.size, pygame.SRCALPHA)
+            
+            pygame.draw.rect(surface, self.hover_color if self.hover else self.color, surface.get_rect(), border_radius=radius)
+            pygame.draw.rect(surface, BLACK, surface.get_rect(), viewport.length(2), border_radius=radius)
+            
+            text = assets.text(self.text, FONT_SIZES['medium'], BLACK)
+            surface.blit(text, text.get_rect(center=surface.get_rect().center))
+            return surface
         
-        text = font_medium.render(self.text, True, BLACK)
-        text_rect = text.get_rect(center=self.rect.center)
-        screen.blit(text, text_rect)
+        key = ('button', id(self), self.text, self.hover)
+        app.backend.blit(assets.cached(key, build_button), app.viewport.point(self.rect.topleft))
     
     def check_hover(self, pos):
         was_hover = self.hover
@@ -220,224 +260,357 @@ class GameState:
     READING = 2
     DETAILED_READING = 3
 
+# 별 이미지 생성
+def create_star(color, size):
+    star = pygame.Surface((size * 2 + 1, size * 2 + 1), pygame.SRCALPHA)
+    pygame.draw.circle(star, color, (size, size), size)
+    return star
+
 # 배경 그리기
-def draw_background():
-    # 그라데이션 배경
-    for y in range(SCREEN_HEIGHT):
-        color_value = int(20 + (y / SCREEN_HEIGHT) * 30)
-        pygame.draw.line(screen, (color_value, color_value, color_value + 10), (0, y), (SCREEN_WIDTH, y))
+def draw_background(theme=DARK_THEME):
+    # 그라데이션 배경 (해상도마다 한 번만 그림)
+    def build_gradient(viewport):
+        gradient = pygame.Surface(viewport.size)
+        top, bottom = theme.background_top, theme.background_bottom
+        for y in range(viewport.height):
+            t = y / viewport.height
+            color = [int(a + (b - a) * t) for a, b in zip(top, bottom)]
+            pygame.draw.line(gradient, color, (0, y), (viewport.width, y))
+        return gradient
     
-    # 별 그리기
-    for i in range(50):
-        x = random.randint(0, SCREEN_WIDTH)
-        y = random.randint(0, SCREEN_HEIGHT)
-        size = random.randint(1, 3)
+    app.backend.blit(assets.cached(('background', id(theme)), build_gradient), (0, 0))
+    
+    # 별 그리기 (크기와 밝기별로 미리 그려 둔 별 이미지 사용)
+    width, height = app.viewport.size
+    for i in range(theme.star_count):
+        x = random.randint(0, width)
+        y = random.randint(0, height)
+        size = app.viewport.length(random.randint(1, 3))
         brightness = random.randint(150, 255)
-        pygame.draw.circle(screen, (brightness, brightness, brightness), (x, y), size)
+        color = theme.star_color or (brightness - brightness % 15,) * 3
+        app.backend.blit(assets.cached(('star', color, size), lambda viewport: create_star(color, size)), (x - size, y - size))
 
 # 게임 초기화
-def init_game():
-    random.shuffle(tarot_cards)
+def init_game(seed=None):
+    # 카드 ID만 섞고 배치되는 카드의 데이터만 읽음
+    # 같은 시드로는 항상 같은 카드와 방향이 나옴 (리딩 기록에 시드를 저장)
+    rng = random.Random(seed)
+    store = open_store()
+    card_ids = list(store.ids())
+    rng.shuffle(card_ids)
     cards = []
     
     # 3행 7열로 카드 배치
-    card_width, card_height = 120, 180
+    card_width, card_height = CARD_WIDTH, CARD_HEIGHT
     margin_x, margin_y = 30, 150  # 상단 여백을 늘려서 안내문과 카드 사이 간격 확보
     
     for row in range(3):
         for col in range(7):
             idx = row * 7 + col
-            if idx < len(tarot_cards):
+            if idx < len(card_ids):
                 x = margin_x + col * (card_width + 10)
                 y = margin_y + row * (card_height + 20)
-                cards.append(Card(x, y, card_width, card_height, tarot_cards[idx]))
+                # 카드마다 방향도 함께 뽑음
+                cards.append(Card(x, y, card_width, card_height, store.get(card_ids[idx]), rng.random() < REVERSED_CHANCE))
     
+    prepare_faces(cards)
     return cards
 
-# 메인 함수
-def main():
-    # 카드 뒷면 이미지 생성
-    if not os.path.exists('images/card_back.png'):
-        create_card_back()
+# 이미지 파일이 없는 카드의 앞면은 작업 스레드에서 한 번에 미리 그림
+def prepare_faces(cards):
+    faces.generate([card.card_data for card in cards if not os.path.exists(card.image_path)])
+
+# 세션 스냅샷에서 카드 복원 (snapshot.py)
+# 카드 데이터는 카드 저장소에서, 이미지는 그릴 때 assets 캐시에서 가져오므로 이미지 파일을 읽지 않음
+def restore_session(state, spreads):
+    spread = next((spread for spread in spreads if spread.id == state.spread_id), None)
+    if spread is None or state.game_state not in (GameState.SELECTING, GameState.READING, GameState.DETAILED_READING):
+        raise SnapshotError("스냅샷의 게임 상태가 올바르지 않습니다.")
+    if len(state.selected) > spread.size:
+        raise SnapshotError("스냅샷의 선택한 카드 수가 스프레드와 맞지 않습니다.")
+    
+    store = open_store()
+    cards = []
+    for record in state.cards:
+        try:
+            card_data = store.get(record[0])
+        except KeyError:
+            raise SnapshotError(f"스냅샷의 카드 ID가 없습니다: {record[0]}")
+        card = Card(0, 0, CARD_WIDTH, CARD_HEIGHT, card_data, record_reversed(record))
+        apply_card_record(card, record)
+        cards.append(card)
+    prepare_faces(cards)
     
-    clock = pygame.time.Clock()
+    selected_cards = [cards[index] for index in state.selected]
+    detailed_card = cards[state.detailed] if state.detailed is not None else None
+    return spread, cards, selected_cards, detailed_card
+
+# 메인 함수
+def main(theme=DARK_THEME, source=None):
+    # 입력 소스 (실제 입력, 입력 기록, 기록 재생 - replay.py)
+    source = source or input_source()
+    app.init()
+    source.start()
+    # 배경의 별과 카드 섞기 시드까지 모든 난수를 입력 소스의 시드로 정함
+    random.seed(source.seed)
     game_state = GameState.INTRO
+    seed = None
     cards = []
     selected_cards = []
     detailed_card = None
+    # 카드를 섞고 나눠 주는 애니메이션 (진행 중이 아니면 None)
+    deal = None
+    # 한 프레임의 카드 이미지를 모아 한 번에 그리는 배치
+    batch = SpriteBatch()
+    # 리딩 화면으로 넘어가기까지 남은 프레임 수 (기다리는 중이 아니면 None)
+    reading_countdown = None
+    # 마지막으로 호버를 확인한 포인터 위치 (움직이지 않으면 다시 확인하지 않음)
+    hover_pos = None
+    
+    # 스프레드 설정
+    spreads = load_spreads()
+    spread = spreads[0]
+    layout = None
+    meanings = []
     
     # 버튼 생성
     start_button = Button(SCREEN_WIDTH//2 - 100, SCREEN_HEIGHT//2 + 100, 200, 50, "시작하기", LIGHT_BLUE, GOLD)
+    spread_button = Button(SCREEN_WIDTH//2 - 150, SCREEN_HEIGHT//2 + 170, 300, 50, spread.name, LIGHT_BLUE, GOLD)
     back_button = Button(SCREEN_WIDTH//2 - 100, SCREEN_HEIGHT - 80, 200, 50, "다시 시작", LIGHT_BLUE, GOLD)
     
+    # 세션 스냅샷 - 실제 입력으로 실행할 때만 화면이 바뀔 때마다 저장하고, 시작할 때 지난 리딩을 이어서 보여 줌
+    use_snapshots = isinstance(source, LiveInput)
+    
+    def save_snapshot():
+        if use_snapshots:
+            snapshots.save(SessionState(
+                game_state, spread.id, seed, [card_record(card) for card in cards],
+                [cards.index(card) for card in selected_cards],
+                cards.index(detailed_card) if detailed_card is not None else None,
+                deal.frame if deal is not None else None, reading_countdown, random.getstate()))
+    
+    def clear_snapshot():
+        if use_snapshots:
+            snapshots.clear()
+    
+    state = snapshots.load() if use_snapshots else None
+    if state is not None:
+        try:
+            spread, cards, selected_cards, detailed_card = restore_session(state, spreads)
+        except SnapshotError as e:
+            print(f"경고: 세션 스냅샷을 복원할 수 없습니다. ({e})")
+            clear_snapshot()
+        else:
+            game_state = state.game_state
+            seed = state.seed
+            reading_countdown = state.reading_countdown
+            random.setstate(state.random_state)
+            spread_button.text = spread.name
+            layout = get_layout(spread, app.viewport, theme.title_color)
+            if state.deal_frame is not None:
+                deal = DealAnimation(len(open_store()), [card.rect.topleft for card in cards],
+                                     (CARD_WIDTH, CARD_HEIGHT), seed)
+                deal.frame = state.deal_frame
+            if game_state in (GameState.READING, GameState.DETAILED_READING):
+                meanings = (layout.render_meanings(selected_cards, theme.text_color) +
+                            layout.render_combinations(selected_cards, theme.text_color))
+    
     running = True
     while running:
-        mouse_pos = pygame.mouse.get_pos()
+        # 포인터 위치를 기준 해상도 좌표로 변환 (움직임은 입력 소스에서 프레임마다 하나로 합쳐짐)
+        mouse_pos, events = source.poll()
+        mouse_pos = app.viewport.to_logical(mouse_pos)
         
-        for event in pygame.event.get():
+        for event in events:
             if event.type == QUIT:
                 running = False
-                
+            
+            # 창 크기 변경 - 화면 크기별 배치와 텍스트만 다시 만듦
+            new_size = app.backend.resize_event_size(event)
+            if new_size is not None:
+                app.resize(*new_size)
+                hover_pos = None
+                if layout is not None:
+                    layout = get_layout(spread, app.viewport, theme.title_color)
+                    if game_state in (GameState.READING, GameState.DETAILED_READING):
+                        meanings = (layout.render_meanings(selected_cards, theme.text_color) +
+                                    layout.render_combinations(selected_cards, theme.text_color))
+            
             if event.type == MOUSEBUTTONDOWN:
+                # 클릭(터치)한 위치로 판정 - 한 프레임에 여러 번 눌러도 각각의 위치를 사용
+                click_pos = app.viewport.to_logical(event.pos)
+                hover_pos = None
                 if game_state == GameState.INTRO:
-                    if start_button.rect.collidepoint(mouse_pos):
+                    if start_button.rect.collidepoint(click_pos):
                         game_state = GameState.SELECTING
-                        cards = init_game()
+                        layout = get_layout(spread, app.viewport, theme.title_color)
+                        seed = random.getrandbits(32)
+                        cards = init_game(seed)
+                        deal = DealAnimation(len(open_store()), [card.rect.topleft for card in cards],
+                                             (CARD_WIDTH, CARD_HEIGHT), seed)
+                        save_snapshot()
                     
-                elif game_state == GameState.SELECTING:
+                    # 스프레드 변경
+                    elif spread_button.rect.collidepoint(click_pos):
+                        spread = spreads[(spreads.index(spread) + 1) % len(spreads)]
+                        spread_button.text = spread.name
+                
+                elif game_state == GameState.SELECTING and len(selected_cards) < spread.size:
+                    # 나눠 주는 중에 클릭하면 애니메이션을 건너뛰고 바로 선택
+                    deal = None
                     for card in cards:
-                        if card.is_clickable(mouse_pos) and not card.revealed and not card.flipping:
+                        if card.is_clickable(click_pos) and not card.revealed and not card.flipping:
+                            # 누른 프레임에 바로 뒤집기 시작
                             if card.start_flip():
                                 selected_cards.append(card)
-                                # 클릭 피드백 추가
-                                pygame.time.delay(100)  # 약간의 딜레이로 클릭 인식 확인
-                                if len(selected_cards) == 3:  # 3장의 카드를 선택하면 리딩 단계로
-                                    # 잠시 대기 후 리딩 화면으로 전환
-                                    pygame.time.delay(1000)
-                                    game_state = GameState.READING
-                                    
-                                    # 카드 위치 재배치
-                                    positions = [
-                                        (SCREEN_WIDTH//4 - 60, SCREEN_HEIGHT//2 - 90),
-                                        (SCREEN_WIDTH//2 - 60, SCREEN_HEIGHT//2 - 90),
-                                        (3*SCREEN_WIDTH//4 - 60, SCREEN_HEIGHT//2 - 90)
-                                    ]
-                                    
-                                    for i, card in enumerate(selected_cards):
-                                        card.move_to(positions[i][0], positions[i][1])
+                                if len(selected_cards) == spread.size:  # 스프레드의 카드를 모두 선택하면 리딩 단계로
+                                    # 마지막 카드가 뒤집히는 것을 보여 준 뒤 리딩 화면으로 전환 (게임 루프는 멈추지 않음)
+                                    reading_countdown = READING_DELAY_FRAMES
+                                save_snapshot()
+                                break
                 
                 elif game_state == GameState.READING:
                     # 카드 클릭 시 상세 리딩으로
                     for i, card in enumerate(selected_cards):
-                        if card.rect.collidepoint(mouse_pos):
+                        if card.rect.collidepoint(click_pos):
                             detailed_card = card
                             game_state = GameState.DETAILED_READING
+                            save_snapshot()
                     
                     # 다시 시작 버튼
-                    if back_button.rect.collidepoint(mouse_pos):
+                    if back_button.rect.collidepoint(click_pos):
                         game_state = GameState.INTRO
+                        # 지난 리딩의 카드와 렌더링된 텍스트를 다음 리딩까지 들고 있지 않도록 정리
+                        cards = []
                         selected_cards = []
+                        detailed_card = None
+                        meanings = []
+                        deal = None
+                        reading_countdown = None
+                        clear_snapshot()
                 
                 elif game_state == GameState.DETAILED_READING:
                     # 아무 곳이나 클릭하면 리딩 화면으로 돌아감
                     game_state = GameState.READING
+                    detailed_card = None
+                    save_snapshot()
         
-        # 마우스 호버 체크
-        if game_state == GameState.INTRO:
-            start_button.check_hover(mouse_pos)
-        elif game_state == GameState.SELECTING:
-            for card in cards:
-                card.check_hover(mouse_pos)
-        elif game_state == GameState.READING:
-            back_button.check_hover(mouse_pos)
+        # 리딩 화면으로 전환
+        if reading_countdown is not None:
+            reading_countdown -= 1
+            if reading_countdown <= 0:
+                reading_countdown = None
+                game_state = GameState.READING
+                hover_pos = None
+                
+                # 카드 위치 재배치 (미리 계산된 스프레드 배치 사용)
+                layout.move_cards(selected_cards)
+                history.record(seed, spread.id, [(card.card_data['id'], card.reversed) for card in selected_cards])
+                meanings = (layout.render_meanings(selected_cards, theme.text_color) +
+                            layout.render_combinations(selected_cards, theme.text_color))
+                save_snapshot()
+        
+        # 마우스 호버 체크 (포인터가 움직였거나 클릭, 화면 전환이 있었을 때만)
+        if mouse_pos != hover_pos:
+            hover_pos = mouse_pos
+            if game_state == GameState.INTRO:
+                start_button.check_hover(mouse_pos)
+                spread_button.check_hover(mouse_pos)
+            elif game_state == GameState.SELECTING and deal is None:
+                for card in cards:
+                    card.check_hover(mouse_pos)
+            elif game_state == GameState.READING:
+                back_button.check_hover(mouse_pos)
         
         # 화면 그리기
-        draw_background()
+        draw_background(theme)
         
         if game_state == GameState.INTRO:
             # 타이틀
-            title = font_large.render("타로 카드 리딩", True, GOLD)
-            subtitle = font_medium.render("당신의 과거, 현재, 미래를 알아보세요", True, WHITE)
-            
-            title_rect = title.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 100))
-            subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 30))
-            
-            screen.blit(title, title_rect)
-            screen.blit(subtitle, subtitle_rect)
+            draw_text("타로 카드 리딩", FONT_SIZES['large'], theme.title_color, center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 100))
+            draw_text("당신의 과거, 현재, 미래를 알아보세요", FONT_SIZES['medium'], theme.text_color, center=(SCREEN_WIDTH//2, SCREEN_HEIGHT//2 - 30))
             
             # 시작 버튼
             start_button.draw()
-            
+            spread_button.draw()
+        
         elif game_state == GameState.SELECTING:
-            # 안내 텍스트 - 위치를 상단에서 더 떨어뜨려 카드와 겹치지 않게 조정
-            title = font_medium.render("세 장의 카드를 선택하세요", True, WHITE)
-            subtitle = font_small.render("첫 번째 카드는 과거, 두 번째는 현재, 세 번째는 미래를 나타냅니다", True, WHITE)
-            
-            # 안내문 위치를 상단에서 더 떨어뜨림
-            title_rect = title.get_rect(center=(SCREEN_WIDTH//2, 80))
-            subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH//2, 110))
+            # 안내문 배경 추가 (가독성 향상) - 화면 가로 전체
+            if theme.panel_color is not None:
+                panel = app.viewport.rect((0, 60, SCREEN_WIDTH, 80))
+                panel.x, panel.width = 0, app.viewport.width
+                app.backend.fill_rect(theme.panel_color, panel)
             
-            # 안내문 배경 추가 (가독성 향상)
-            pygame.draw.rect(screen, (0, 0, 0, 128), pygame.Rect(0, 60, SCREEN_WIDTH, 80), border_radius=5)
-            
-            screen.blit(title, title_rect)
-            screen.blit(subtitle, subtitle_rect)
+            # 안내 텍스트 - 위치를 상단에서 더 떨어뜨려 카드와 겹치지 않게 조정
+            draw_text(f"{spread.size}장의 카드를 선택하세요", FONT_SIZES['medium'], theme.text_color, center=(SCREEN_WIDTH//2, 80))
+            draw_text(spread.description, FONT_SIZES['small'], theme.text_color, center=(SCREEN_WIDTH//2, 110))
             
             # 선택 상태 표시
-            status_text = font_small.render(f"선택한 카드: {len(selected_cards)}/3", True, WHITE)
-            status_rect = status_text.get_rect(topleft=(20, SCREEN_HEIGHT - 30))
-            screen.blit(status_text, status_rect)
-            
-            # 카드 그리기
-            for card in cards:
-                card.draw()
-                
+            draw_text(f"선택한 카드: {len(selected_cards)}/{spread.size}", FONT_SIZES['small'], theme.text_color, topleft=(20, SCREEN_HEIGHT - 30))
+            
+            # 카드 그리기 (나눠 주는 중이면 애니메이션)
+            if deal is not None:
+                deal.update()
+                deal.draw(batch, card_back_surface(app.viewport.scale_size((CARD_WIDTH, CARD_HEIGHT))))
+                if deal.done:
+                    deal = None
+                    hover_pos = None
+            else:
+                for card in cards:
+                    card.draw(batch)
+            batch.draw()
+        
         elif game_state == GameState.READING:
             # 타이틀
-            title = font_medium.render("당신의 타로 리딩 결과", True, GOLD)
-            subtitle = font_small.render("카드를 클릭하면 더 자세한 해석을 볼 수 있습니다", True, WHITE)
-            
-            title_rect = title.get_rect(center=(SCREEN_WIDTH//2, 20))
-            subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH//2, 50))
-            
-            screen.blit(title, title_rect)
-            screen.blit(subtitle, subtitle_rect)
+            draw_text("당신의 타로 리딩 결과", FONT_SIZES['medium'], theme.title_color, center=(SCREEN_WIDTH//2, 20))
+            draw_text("카드를 클릭하면 더 자세한 해석을 볼 수 있습니다", FONT_SIZES['small'], theme.text_color, center=(SCREEN_WIDTH//2, 50))
             
             # 선택된 카드 표시
-            labels = ["과거", "현재", "미래"]
+            for card in selected_cards:
+                card.draw(batch)
+            batch.draw()
             
-            for i, card in enumerate(selected_cards):
-                card.draw()
-                
-                # 라벨 표시
-                label = font_medium.render(labels[i], True, GOLD)
-                label_rect = label.get_rect(center=(card.rect.centerx, card.rect.y - 30))
-                screen.blit(label, label_rect)
-                
-                # 카드 의미 표시
-                meaning = font_small.render(card.card_data["meaning"], True, WHITE)
-                meaning_rect = meaning.get_rect(center=(card.rect.centerx, card.rect.y + card.rect.height + 30))
-                screen.blit(meaning, meaning_rect)
+            # 라벨과 카드 의미 표시 (스프레드 배치에서 미리 렌더링됨)
+            for label, label_rect in layout.labels:
+                app.backend.blit(label, label_rect.topleft)
+            for meaning, meaning_rect in meanings:
+                app.backend.blit(meaning, meaning_rect.topleft)
             
             # 다시 시작 버튼
             back_button.draw()
-            
+        
         elif game_state == GameState.DETAILED_READING:
-            # 배경 어둡게
-            overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-            overlay.fill((0, 0, 0, 180))
-            screen.blit(overlay, (0, 0))
+            # 배경 어둡게 (해상도마다 한 번만 만듦)
+            def build_overlay(viewport):
+                overlay = pygame.Surface(viewport.size, pygame.SRCALPHA)
+                overlay.fill((0, 0, 0, 180))
+                return overlay
+            app.backend.blit(assets.cached('overlay', build_overlay), (0, 0))
             
             # 카드 상세 정보 표시
-            card_width, card_height = 240, 360
+            card_width, card_height = DETAIL_CARD_WIDTH, DETAIL_CARD_HEIGHT
             card_x = SCREEN_WIDTH//2 - card_width//2
             card_y = 100
             
             # 큰 카드 이미지 표시
-            scaled_image = pygame.transform.scale(detailed_card.front_image, (card_width, card_height))
-            screen.blit(scaled_image, (card_x, card_y))
-            pygame.draw.rect(screen, GOLD, (card_x, card_y, card_width, card_height), 3)
+            card_rect = app.viewport.rect((card_x, card_y, card_width, card_height))
+            app.backend.blit(detailed_card.face_surface(card_rect.size), card_rect.topleft)
+            app.backend.draw_rect(GOLD, card_rect, app.viewport.length(3))
             
             # 카드 설명
             desc_y = card_y + card_height + 20
-            name_text = font_medium.render(detailed_card.card_data["name"], True, WHITE)
-            meaning_text = font_medium.render(detailed_card.card_data["meaning"], True, GOLD)
-            
-            name_rect = name_text.get_rect(center=(SCREEN_WIDTH//2, desc_y))
-            meaning_rect = meaning_text.get_rect(center=(SCREEN_WIDTH//2, desc_y + 40))
-            
-            screen.blit(name_text, name_rect)
-            screen.blit(meaning_text, meaning_rect)
+            draw_text(detailed_card.name, FONT_SIZES['medium'], WHITE, center=(SCREEN_WIDTH//2, desc_y))
+            draw_text(detailed_card.meaning, FONT_SIZES['medium'], GOLD, center=(SCREEN_WIDTH//2, desc_y + 40))
             
             # 카드 상세 설명 (여러 줄로 나누기)
-            description = detailed_card.card_data["description"]
+            description = detailed_card.description
             words = description.split()
             lines = []
             current_line = ""
             
             for word in words:
                 test_line = current_line + " " + word if current_line else word
-                if font_small.size(test_line)[0] < card_width + 100:
+                if text_width(test_line, FONT_SIZES['small']) < card_width + 100:
                     current_line = test_line
                 else:
                     lines.append(current_line)
@@ -447,20 +620,22 @@ def main():
                 lines.append(current_line)
             
             for i, line in enumerate(lines):
-                desc_text = font_small.render(line, True, WHITE)
-                desc_rect = desc_text.get_rect(center=(SCREEN_WIDTH//2, desc_y + 80 + i * 25))
-                screen.blit(desc_text, desc_rect)
+                draw_text(line, FONT_SIZES['small'], WHITE, center=(SCREEN_WIDTH//2, desc_y + 80 + i * 25))
             
             # 안내 텍스트
-            instruction = font_small.render("아무 곳이나 클릭하여 돌아가기", True, WHITE)
-            instruction_rect = instruction.get_rect(center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 50))
-            screen.blit(instruction, instruction_rect)
+            draw_text("아무 곳이나 클릭하여 돌아가기", FONT_SIZES['small'], WHITE, center=(SCREEN_WIDTH//2, SCREEN_HEIGHT - 50))
         
-        pygame.display.flip()
-        clock.tick(60)
-        
-    pygame.quit()
-    sys.exit()
+        app.backend.present()
+        app.mark_first_frame()
+        source.end_frame()
+    
+    # 정상 종료하면 다음 실행에서 복원하지 않음
+    clear_snapshot()
+    source.close()
+    faces.close()
+    history.close()
+    snapshots.close()
+    app.quit()
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,368 @@
+import os
+import ast
+import sys
+import json
+import zlib
+import struct
+import argparse
+import tempfile
+import threading
+
+import pygame
+
+from app import app, FONT_SIZES, FACE_FONT_SIZES, resolve_font_path
+
+# 미리 구운 한글 글리프 아틀라스
+#
+# 게임에서 쓰는 글자(카드 데이터, 조합 해석, 스프레드, 화면 문구)를 한글 폰트가 있는 기기에서
+# 한 번 렌더링하여 글자 크기(FONT_SIZES와 카드 앞면의 FACE_FONT_SIZES)마다 한 장의 알파 비트맵으로 저장합니다.
+# 실행할 때는 폰트 없이 아틀라스의 글자를 이어 붙여 텍스트를 만들므로
+# 한글 폰트가 없는 기기에서도 한글이 표시되고, FreeType 렌더링을 거치지 않아 빠릅니다.
+#
+# 아틀라스에 없는 글자가 있거나 아틀라스가 없으면 폰트로 렌더링합니다.
+# 아틀라스 만들기: python glyphs.py [--font 한글 폰트 파일]
+#
+# 파일 구조 (리틀 엔디언)
+#   헤더:     매직(4) 버전(H) 크기 수(H)
+#   크기 표:  크기마다 글자 크기(H) 줄 높이(H) 아틀라스 너비(H) 높이(H) 글자 수(I)
+#             글자 표 오프셋(I) 알파 데이터 오프셋(I) 압축된 길이(I)
+#   글자 표:  글자마다 코드 포인트(I) x(H) y(H) 너비(H) - 글자 코드 순
+#   알파:     zlib으로 압축된 아틀라스 너비 x 높이 바이트 (글자의 불투명도)
+
+MAGIC = b'TRGL'
+VERSION = 1
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PATH = os.path.join(BASE_DIR, 'tarot_glyphs.bin')
+
+# 글자를 모으는 파일 - 파이썬 파일은 문자열 상수만, JSON은 모든 문자열 값
+SOURCE_PATHS = tuple(os.path.join(BASE_DIR, name) for name in (
+    'tarot_data.py', 'combination_data.py', 'combinations.py', 'spreads.json', 'spreads.py', 'game.py', 'main.py',
+))
+
+ATLAS_WIDTH = 1024
+
+# 아틀라스에 굽는 글자 크기
+ATLAS_SIZES = tuple(sorted(set(FONT_SIZES.values()) | set(FACE_FONT_SIZES)))
+
+_HEADER = struct.Struct('<4sHH')
+_SIZE = struct.Struct('<HHHHIIII')
+_GLYPH = struct.Struct('<IHHH')
+
+# 어떤 폰트에도 없는 글자 (폰트에 글자가 있는지 비교할 때 사용)
+_MISSING_CHAR = '\U0010FFFD'
+
+
+class GlyphError(Exception):
+    pass
+
+
+def _strings(value):
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _strings(item)
+
+
+def collect_chars(paths=SOURCE_PATHS):
+    """
+    파일에서 화면에 표시될 수 있는 글자를 모으는 함수 (출력 가능한 ASCII는 항상 포함)
+    """
+    chars = {chr(code) for code in range(0x20, 0x7F)}
+    for path in paths:
+        with open(path, encoding='utf-8') as f:
+            source = f.read()
+        if path.endswith('.json'):
+            texts = _strings(json.loads(source))
+        else:
+            texts = (node.value for node in ast.walk(ast.parse(source))
+                     if isinstance(node, ast.Constant) and isinstance(node.value, str))
+        for text in texts:
+            chars.update(char for char in text if char.isprintable())
+    return sorted(chars)
+
+
+def _glyph_alpha(font, char):
+    # 흰색으로 렌더링한 글자의 (너비, 높이, 불투명도 바이트)
+    surface = font.render(char, True, (255, 255, 255))
+    width, height = surface.get_size()
+    return width, height, pygame.image.tobytes(surface, 'RGBA')[3::4]
+
+
+def _has_hangul(font):
+    return _glyph_alpha(font, '가') != _glyph_alpha(font, _MISSING_CHAR)
+
+
+def bake_atlas(font_path, chars, sizes=ATLAS_SIZES):
+    """
+    글자들을 크기마다 아틀라스로 렌더링하여 바이너리 데이터로 만드는 함수
+
+    Returns:
+        bytes: 아틀라스 파일 데이터
+    """
+    if not pygame.font.get_init():
+        pygame.font.init()
+
+    tables = []
+    for size in sorted(set(sizes)):
+        font = pygame.font.Font(font_path, size)
+        if not _has_hangul(font):
+            raise GlyphError(f"폰트에 한글 글자가 없습니다: {font_path}")
+        line_height = font.get_height()
+
+        # 높이가 같은 글자들을 왼쪽부터 채우고 넘치면 다음 줄로
+        glyphs = []
+        x = y = 0
+        for char in chars:
+            width, height, alpha = _glyph_alpha(font, char)
+            if x + width > ATLAS_WIDTH:
+                x, y = 0, y + line_height
+            glyphs.append((ord(char), x, y, width, min(height, line_height), alpha))
+            x += width
+        atlas_height = y + line_height
+        if atlas_height > 0xFFFF:
+            raise GlyphError(f"{size} 크기의 글자가 너무 많습니다.")
+
+        pixels = bytearray(ATLAS_WIDTH * atlas_height)
+        for _, x, y, width, height, alpha in glyphs:
+            for row in range(height):
+                start = (y + row) * ATLAS_WIDTH + x
+                pixels[start:start + width] = alpha[row * width:(row + 1) * width]
+        glyph_table = b''.join(_GLYPH.pack(code, x, y, width) for code, x, y, width, _, _ in glyphs)
+        tables.append((size, line_height, atlas_height, len(glyphs), glyph_table, zlib.compress(bytes(pixels), 9)))
+
+    offset = _HEADER.size + len(tables) * _SIZE.size
+    header = bytearray(_HEADER.pack(MAGIC, VERSION, len(tables)))
+    blobs = []
+    for size, line_height, atlas_height, count, glyph_table, alpha in tables:
+        header += _SIZE.pack(size, line_height, ATLAS_WIDTH, atlas_height, count,
+                             offset, offset + len(glyph_table), len(alpha))
+        offset += len(glyph_table) + len(alpha)
+        blobs += [glyph_table, alpha]
+    return bytes(header) + b''.join(blobs)
+
+
+class _SizeAtlas:
+    """
+    한 글자 크기의 아틀라스 - 글자 표는 바로 읽고, 아틀라스 Surface는 처음 그릴 때 만듦
+    """
+
+    def __init__(self, data, line_height, width, height, count, glyph_offset, alpha_offset, alpha_length):
+        self.line_height = line_height
+        self._data = data
+        self._size = (width, height)
+        self._alpha = (alpha_offset, alpha_length)
+        self._surface = None
+        # 카드 앞면 작업 스레드(faces)와 메인 스레드가 처음 그릴 때 함께 만들지 않도록 함
+        self._lock = threading.Lock()
+        # 글자 -> (x, y, 너비)
+        self.glyphs = {}
+        for code, x, y, glyph_width in _GLYPH.iter_unpack(data[glyph_offset:glyph_offset + count * _GLYPH.size]):
+            self.glyphs[chr(code)] = (x, y, glyph_width)
+
+    @property
+    def surface(self):
+        if self._surface is not None:
+            return self._surface
+        with self._lock:
+            if self._surface is not None:
+                return self._surface
+            offset, length = self._alpha
+            alpha = zlib.decompress(self._data[offset:offset + length])
+            # 흰색 글자에 불투명도만 다른 RGBA Surface
+            rgba = bytearray(b'\xff') * (len(alpha) * 4)
+            rgba[3::4] = alpha
+            surface = pygame.image.frombytes(bytes(rgba), self._size, 'RGBA')
+            # 화면 픽셀 형식으로 변환해 두면 글자 복사가 빨라짐
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+            self._surface = surface
+            self._data = None
+        return self._surface
+
+    def covers(self, text):
+        return all(char in self.glyphs for char in text)
+
+    def width(self, text):
+        return sum(self.glyphs[char][2] for char in text)
+
+    def render(self, text, color):
+        width = self.width(text)
+        atlas = self.surface
+        surface = pygame.Surface((max(1, width), self.line_height), pygame.SRCALPHA, atlas)
+        if width == 0:
+            return surface
+        # 불투명한 글자색으로 채운 뒤 흰색 글자를 곱하면 (글자색, 글자의 불투명도)가 됨
+        # 글자 상자는 겹치지 않으므로 글자마다 한 번씩만 곱해짐
+        surface.fill(pygame.Color(color))
+        x = 0
+        sources = []
+        for char in text:
+            glyph_x, glyph_y, glyph_width = self.glyphs[char]
+            sources.append((atlas, (x, 0), (glyph_x, glyph_y, glyph_width, self.line_height), pygame.BLEND_RGBA_MULT))
+            x += glyph_width
+        surface.blits(sources, False)
+        return surface
+
+
+class GlyphAtlas:
+    def __init__(self, data, source=None):
+        self.source = source
+        if len(data) < _HEADER.size:
+            raise GlyphError("글리프 아틀라스 파일이 너무 짧습니다.")
+        magic, version, count = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise GlyphError("글리프 아틀라스 파일 형식이 아닙니다.")
+        if version != VERSION:
+            raise GlyphError(f"지원하지 않는 글리프 아틀라스 버전입니다: {version}")
+        self.sizes = {}
+        try:
+            for i in range(count):
+                size, *table = _SIZE.unpack_from(data, _HEADER.size + i * _SIZE.size)
+                self.sizes[size] = _SizeAtlas(data, *table)
+        except struct.error as e:
+            raise GlyphError(f"글리프 아틀라스 파일이 손상되었습니다: {e}")
+
+    @classmethod
+    def open(cls, path=DEFAULT_PATH):
+        with open(path, 'rb') as f:
+            return cls(f.read(), source=path)
+
+    def covers(self, text, size):
+        atlas = self.sizes.get(size)
+        return atlas is not None and atlas.covers(text)
+
+    def width(self, text, size):
+        return self.sizes[size].width(text)
+
+    def render(self, text, size, color):
+        return self.sizes[size].render(text, color)
+
+
+_atlas = False
+
+
+def open_atlas(path=DEFAULT_PATH):
+    """
+    글리프 아틀라스를 여는 함수 - 파일이 없거나 읽을 수 없으면 None
+    """
+    global _atlas
+    if _atlas is False or path != DEFAULT_PATH:
+        try:
+            atlas = GlyphAtlas.open(path)
+        except (OSError, GlyphError):
+            atlas = None
+        if path != DEFAULT_PATH:
+            return atlas
+        _atlas = atlas
+    return _atlas
+
+
+def render_text(text, size, color, font=None):
+    """
+    기준 해상도의 글자 크기로 텍스트를 현재 화면 크기에 맞게 렌더링하는 함수
+
+    화면 글자 크기의 아틀라스가 있으면 아틀라스로, 한글 폰트가 있으면 폰트로 그리고,
+    한글 폰트가 없으면 기준 크기의 아틀라스로 그려 화면 크기에 맞게 확대/축소합니다.
+
+    font(size 크기의 폰트)를 지정하면 화면 배율 없이 size 그대로 그리고 아틀라스에 없는 글자는
+    그 폰트로 그립니다 - 기준 크기로 그린 뒤 확대/축소하는 카드 앞면처럼 app의 폰트를 쓰지 않는 경우.
+    """
+    atlas = open_atlas()
+    if font is not None:
+        if atlas is not None and atlas.covers(text, size):
+            return atlas.render(text, size, color)
+        return font.render(text, True, color)
+    pixel_size = app.viewport.length(size)
+    if atlas is not None and atlas.covers(text, pixel_size):
+        return atlas.render(text, pixel_size, color)
+    if atlas is None or app.font_path is not None or not atlas.covers(text, size):
+        return app.font(pixel_size).render(text, True, color)
+    surface = atlas.render(text, size, color)
+    scale = pixel_size / size
+    return pygame.transform.smoothscale(surface, (max(1, round(surface.get_width() * scale)),
+                                                  max(1, round(surface.get_height() * scale))))
+
+
+def text_width(text, size):
+    """
+    기준 해상도의 글자 크기로 그린 텍스트의 너비 (기준 해상도)
+    """
+    atlas = open_atlas()
+    if atlas is not None and atlas.covers(text, size):
+        return atlas.width(text, size)
+    return app.font(size).size(text)[0]
+
+
+def write_atlas(path, data):
+    """
+    아틀라스 데이터를 파일로 저장하는 함수
+
+    임시 파일에 먼저 쓴 뒤 교체하므로 실행 중인 게임이 깨진 파일을 읽지 않고,
+    동시에 만들어도 임시 파일이 겹치지 않습니다.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        # mkstemp는 소유자만 읽을 수 있는 파일을 만들므로 다른 사용자로 실행한 게임도 읽을 수 있게 함
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='게임에서 쓰는 글자로 한글 글리프 아틀라스 만들기')
+    parser.add_argument('--font', help='한글 폰트 파일 (기본은 시스템에서 찾은 한글 폰트)')
+    parser.add_argument('--output', default=DEFAULT_PATH, help='아틀라스 파일 경로')
+    parser.add_argument('--check', action='store_true', help='아틀라스에 없는 글자만 확인')
+    args = parser.parse_args(argv)
+    chars = collect_chars()
+
+    if args.check:
+        atlas = open_atlas(args.output)
+        if atlas is None:
+            print(f"아틀라스가 없습니다: {args.output}")
+            return 1
+        missing = {size: [char for char in chars if char not in table.glyphs] for size, table in atlas.sizes.items()}
+        missing = {size: chars for size, chars in missing.items() if chars}
+        for size in ATLAS_SIZES:
+            if size not in atlas.sizes:
+                print(f"{size}: 크기가 없습니다.")
+        for size, chars in missing.items():
+            print(f"{size}: 없는 글자 {len(chars)}개 - {''.join(chars)}")
+        ok = not missing and all(size in atlas.sizes for size in ATLAS_SIZES)
+        if ok:
+            print("모든 글자가 아틀라스에 있습니다.")
+        return 0 if ok else 1
+
+    font_path = args.font or resolve_font_path()
+    if font_path is None:
+        print("한글 폰트를 찾을 수 없습니다. --font로 폰트 파일을 지정하세요.")
+        return 1
+    try:
+        data = bake_atlas(font_path, chars)
+    except (OSError, pygame.error, GlyphError) as e:
+        print(f"아틀라스를 만들 수 없습니다: {e}")
+        return 1
+    try:
+        write_atlas(args.output, data)
+    except OSError as e:
+        print(f"아틀라스를 저장할 수 없습니다: {e}")
+        return 1
+    print(f"{args.output} 생성 완료: 글자 {len(chars)}개, 크기 {list(ATLAS_SIZES)}, {len(data)} 바이트")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
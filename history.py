@@ -0,0 +1,245 @@
+import os
+import sys
+import csv
+import json
+import time
+import uuid
+import queue
+import sqlite3
+import argparse
+import threading
+from datetime import datetime
+
+# 리딩 기록 저장소
+#
+# 리딩 결과(시각, 시드, 스프레드, 카드 ID와 방향)를 SQLite(WAL 모드)에 추가만 합니다.
+# record()는 큐에 넣기만 하고 바로 돌아오며, 별도 스레드가 쌓인 기록을 모아
+# 한 트랜잭션으로 씁니다. 따라서 게임 루프는 디스크 쓰기(fsync)를 기다리지 않습니다.
+#
+# 환경 변수 TAROT_HISTORY로 파일 경로를 지정할 수 있고, 빈 값이면 기록하지 않습니다.
+
+# 기본 위치는 app.CACHE_DIR와 같은 디렉토리
+# (내보내기 도구가 pygame을 import하지 않도록 app을 거치지 않고 계산)
+CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'), 'tarot-game')
+HISTORY_PATH = os.environ.get('TAROT_HISTORY', os.path.join(CACHE_DIR, 'history.sqlite3'))
+
+# 한 번에 쓰는 최대 기록 수와, 첫 기록 뒤 더 모으기 위해 기다리는 최대 시간(초)
+BATCH_SIZE = 500
+FLUSH_INTERVAL = 0.5
+
+# 내보내기에서 한 번에 읽는 행 수
+EXPORT_CHUNK = 1000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS readings (
+    id INTEGER PRIMARY KEY,
+    session TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    seed INTEGER NOT NULL,
+    spread TEXT NOT NULL,
+    locale TEXT NOT NULL,
+    cards TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS readings_session ON readings (session, created_at);
+CREATE INDEX IF NOT EXISTS readings_created_at ON readings (created_at);
+"""
+
+_COLUMNS = ('id', 'session', 'created_at', 'seed', 'spread', 'locale', 'cards')
+
+
+def encode_cards(cards):
+    """
+    [(카드 ID, 역방향 여부)] -> "13r,0,21" 형식의 문자열
+    """
+    return ','.join(f"{card_id}{'r' if reversed else ''}" for card_id, reversed in cards)
+
+
+def decode_cards(text):
+    return [(int(item.rstrip('r')), item.endswith('r')) for item in text.split(',') if item]
+
+
+def _connect(path):
+    connection = sqlite3.connect(path)
+    connection.execute('PRAGMA journal_mode=WAL')
+    # WAL 모드에서는 NORMAL로도 손상되지 않음 (전원이 꺼지면 마지막 트랜잭션만 잃을 수 있음)
+    connection.execute('PRAGMA synchronous=NORMAL')
+    connection.executescript(_SCHEMA)
+    return connection
+
+
+class ReadingHistory:
+    def __init__(self, path=HISTORY_PATH, session=None):
+        self.path = path
+        # 게임 실행 한 번이 하나의 세션
+        self.session = session or uuid.uuid4().hex
+        self._queue = queue.Queue()
+        self._writer = None
+        self._lock = threading.Lock()
+        self.error = None
+
+    @property
+    def enabled(self):
+        return bool(self.path) and self.error is None
+
+    def record(self, seed, spread, cards, locale='ko', created_at=None):
+        """
+        리딩 결과를 기록하는 함수 - 쓰기는 기록 스레드에서 이루어지므로 기다리지 않음
+
+        Args:
+            seed (int): 카드를 섞은 시드
+            spread (str): 스프레드 id
+            cards (list): 선택한 순서대로 (카드 ID, 역방향 여부)
+        """
+        if not self.enabled:
+            return
+        row = (self.session, created_at or time.time(), seed, spread, locale, encode_cards(cards))
+        self._start_writer()
+        self._queue.put(row)
+
+    def _start_writer(self):
+        with self._lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name='tarot-history', daemon=True)
+                self._writer.start()
+
+    def _write_loop(self):
+        # 연결은 이 스레드에서만 사용 - 열 수 없으면 기록을 받기만 하고 버림
+        connection = None
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            connection = _connect(self.path)
+        except (OSError, sqlite3.Error) as e:
+            self._fail(e)
+
+        running = True
+        while running:
+            rows = [self._queue.get()]
+            deadline = time.monotonic() + FLUSH_INTERVAL
+            while len(rows) < BATCH_SIZE and rows[-1] is not None:
+                try:
+                    rows.append(self._queue.get(timeout=max(0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+            if rows[-1] is None:
+                running = False
+            batch = [row for row in rows if row is not None]
+
+            try:
+                if batch and connection is not None:
+                    with connection:
+                        connection.executemany(
+                            'INSERT INTO readings (session, created_at, seed, spread, locale, cards) '
+                            'VALUES (?, ?, ?, ?, ?, ?)', batch)
+            except sqlite3.Error as e:
+                self._fail(e)
+                connection.close()
+                connection = None
+            finally:
+                for _ in rows:
+                    self._queue.task_done()
+        if connection is not None:
+            connection.close()
+
+    def _fail(self, error):
+        # 기록에 실패해도 게임은 계속 (이후 기록은 버림)
+        self.error = error
+        print(f"경고: 리딩 기록을 저장할 수 없습니다. ({error})")
+
+    def flush(self):
+        # 지금까지 record()한 기록이 모두 쓰일 때까지 기다림
+        if self._writer is not None:
+            self._queue.join()
+
+    def close(self):
+        with self._lock:
+            writer, self._writer = self._writer, None
+        if writer is not None and writer.is_alive():
+            self._queue.put(None)
+            writer.join()
+
+
+def _timestamp(value):
+    if value is None or isinstance(value, (int, float)):
+        return value
+    return value.timestamp()
+
+
+def iter_readings(path=HISTORY_PATH, session=None, since=None, until=None):
+    """
+    저장된 리딩을 시간 순으로 하나씩 반환하는 제너레이터
+
+    결과를 한 번에 메모리에 올리지 않고 EXPORT_CHUNK 행씩 읽습니다.
+
+    Args:
+        session (str): 이 세션의 리딩만
+        since, until (datetime | float): 이 시각 이후/이전의 리딩만
+    """
+    conditions, params = [], []
+    if session is not None:
+        conditions.append('session = ?')
+        params.append(session)
+    if since is not None:
+        conditions.append('created_at >= ?')
+        params.append(_timestamp(since))
+    if until is not None:
+        conditions.append('created_at < ?')
+        params.append(_timestamp(until))
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+
+    connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    try:
+        cursor = connection.execute(f"SELECT {', '.join(_COLUMNS)} FROM readings {where} ORDER BY created_at, id", params)
+        while True:
+            rows = cursor.fetchmany(EXPORT_CHUNK)
+            if not rows:
+                break
+            for row in rows:
+                reading = dict(zip(_COLUMNS, row))
+                reading['cards'] = decode_cards(reading['cards'])
+                yield reading
+    finally:
+        connection.close()
+
+
+def export(out, format='jsonl', **filters):
+    """
+    저장된 리딩을 JSON Lines 또는 CSV로 내보내는 함수
+
+    Returns:
+        int: 내보낸 리딩 수
+    """
+    count = 0
+    if format == 'csv':
+        writer = csv.writer(out)
+        writer.writerow(_COLUMNS)
+    for reading in iter_readings(**filters):
+        created_at = datetime.fromtimestamp(reading['created_at']).isoformat(timespec='seconds')
+        if format == 'csv':
+            writer.writerow([reading['id'], reading['session'], created_at, reading['seed'],
+                             reading['spread'], reading['locale'], encode_cards(reading['cards'])])
+        else:
+            reading['created_at'] = created_at
+            out.write(json.dumps(reading, ensure_ascii=False) + '\n')
+        count += 1
+    return count
+
+
+history = ReadingHistory()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='타로 리딩 기록 내보내기')
+    parser.add_argument('--path', default=HISTORY_PATH, help='기록 파일 경로')
+    parser.add_argument('--session', help='이 세션의 리딩만')
+    parser.add_argument('--since', type=datetime.fromisoformat, help='이 날짜 이후 (예: 2024-05-01)')
+    parser.add_argument('--until', type=datetime.fromisoformat, help='이 날짜 이전')
+    parser.add_argument('--format', choices=('jsonl', 'csv'), default='jsonl')
+    args = parser.parse_args(argv)
+    if not os.path.exists(args.path):
+        parser.error(f"기록 파일이 없습니다: {args.path}")
+    export(sys.stdout, args.format, path=args.path, session=args.session, since=args.since, until=args.until)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,201 @@
+import os
+import weakref
+
+import pygame
+
+# 렌더링 백엔드
+#
+# 게임의 모든 그리기는 백엔드를 거칩니다.
+#   software: 화면 Surface에 blit하고 크기 조정은 CPU(transform.scale)로 처리 (기본 대체 경로)
+#   sdl2:     pygame._sdl2.video의 Renderer/Texture 사용 - Surface는 처음 그릴 때 한 번만
+#             텍스처로 올리고, 카드 뒤집기 같은 크기 조정은 텍스처 복사로 GPU에서 처리
+#
+# 환경 변수 TAROT_RENDERER로 선택합니다 (auto, sdl2, software - 기본값 auto).
+# auto는 하드웨어 가속 렌더러를 쓸 수 있으면 sdl2, 아니면 software를 사용합니다.
+
+RENDERER = os.environ.get('TAROT_RENDERER', 'auto')
+
+def _same_format(a, b):
+    return (a.get_bitsize() == b.get_bitsize() and a.get_masks() == b.get_masks()
+            and a.get_flags() & pygame.SRCALPHA == b.get_flags() & pygame.SRCALPHA)
+
+
+class SoftwareBackend:
+    name = 'software'
+
+    def __init__(self, size, caption, fullscreen=False):
+        if fullscreen:
+            self.surface = pygame.display.set_mode((0, 0), pygame.FULLSCREEN)
+        else:
+            self.surface = pygame.display.set_mode(size, pygame.RESIZABLE)
+        pygame.display.set_caption(caption)
+        self.fullscreen = fullscreen
+        # 지금까지 표시한 프레임 수
+        self.frames = 0
+        # 뒤집기/이동 중인 카드의 크기를 조정해 그리는 작업 Surface (한 프레임에서 조정하는 이미지마다 하나)
+        self._scratch = []
+
+    @property
+    def size(self):
+        return self.surface.get_size()
+
+    def resize_event_size(self, event):
+        # 창 크기 변경 이벤트이면 새 크기, 아니면 None
+        if event.type == pygame.VIDEORESIZE:
+            return (event.w, event.h)
+        return None
+
+    def resize(self, size):
+        if not self.fullscreen:
+            self.surface = pygame.display.set_mode(size, pygame.RESIZABLE)
+        # 이전 해상도 크기의 작업 Surface는 버림
+        self._scratch = []
+
+    def blit(self, surface, pos):
+        self.surface.blit(surface, pos)
+
+    def _scaled_frame(self, surface, size, slot=0):
+        # 멈춰 있는 카드는 assets가 화면 크기로 맞춘 Surface를 그대로 그리고,
+        # 뒤집기/이동 중인 잠깐의 크기만 그릴 때마다 조정함 (프레임마다 크기가 달라 보관해도 다시 쓰이지 않음)
+        # 조정한 이미지는 slot번째 작업 Surface에 그려 프레임마다 큰 Surface를 새로 할당하지 않음
+        # (카드가 클수록 새 Surface의 메모리를 받는 비용이 크기 조정보다 큼 - 4K에서 카드 21장 약 8ms)
+        if surface.get_size() == size:
+            return surface
+        if size[0] <= 0 or size[1] <= 0:
+            return pygame.transform.scale(surface, size)
+        while len(self._scratch) <= slot:
+            self._scratch.append(None)
+        scratch = self._scratch[slot]
+        if (scratch is None or scratch.get_width() < size[0] or scratch.get_height() < size[1]
+                or not _same_format(scratch, surface)):
+            width, height = size
+            if scratch is not None and _same_format(scratch, surface):
+                width, height = max(width, scratch.get_width()), max(height, scratch.get_height())
+            scratch = self._scratch[slot] = pygame.Surface((width, height), surface.get_flags() & pygame.SRCALPHA,
+                                                           surface)
+        frame = scratch.subsurface((0, 0) + tuple(size))
+        pygame.transform.scale(surface, size, frame)
+        return frame
+
+    def blit_scaled(self, surface, rect):
+        rect = pygame.Rect(rect)
+        self.surface.blit(self._scaled_frame(surface, rect.size), rect)
+
+    def blits(self, sprites):
+        # (Surface, 화면 Rect) 목록을 순서대로 그림 - Surface.blits 한 번으로 처리
+        # 같은 프레임에서 같은 Surface를 같은 크기로 여러 번 그리면(함께 뒤집히거나 나눠 주는 카드 뒷면)
+        # 크기 조정은 한 번만 함
+        frames = {}
+        blits = []
+        for surface, rect in sprites:
+            key = (surface, rect.size)
+            frame = frames.get(key)
+            if frame is None:
+                frame = frames[key] = self._scaled_frame(surface, rect.size, len(frames))
+            blits.append((frame, rect))
+        self.surface.blits(blits, False)
+
+    def fill_rect(self, color, rect):
+        self.surface.fill(color, rect)
+
+    def draw_rect(self, color, rect, width=1):
+        pygame.draw.rect(self.surface, color, rect, width)
+
+    def present(self):
+        pygame.display.flip()
+        self.frames += 1
+
+    def close(self):
+        self.surface = None
+
+
+class SDL2Backend:
+    name = 'sdl2'
+
+    def __init__(self, size, caption, fullscreen=False, accelerated=-1):
+        from pygame._sdl2 import video
+
+        self._video = video
+        if fullscreen:
+            self.window = video.Window(caption, fullscreen_desktop=True)
+        else:
+            self.window = video.Window(caption, size=size, resizable=True)
+        try:
+            self.renderer = video.Renderer(self.window, accelerated=accelerated)
+        except Exception:
+            self.window.destroy()
+            raise
+        # 원본 Surface -> Texture (Surface가 사라지면 텍스처도 해제됨)
+        self._textures = weakref.WeakKeyDictionary()
+        self.frames = 0
+
+    @property
+    def size(self):
+        return self.window.size
+
+    def resize_event_size(self, event):
+        if event.type == pygame.WINDOWSIZECHANGED and event.window is self.window:
+            return (event.x, event.y)
+        # 입력 기록을 재생할 때의 창 크기 변경
+        if event.type == pygame.VIDEORESIZE:
+            return (event.w, event.h)
+        return None
+
+    def resize(self, size):
+        # 창 크기는 SDL이 바꾸므로 렌더러는 새 크기를 그대로 사용
+        pass
+
+    def texture(self, surface):
+        texture = self._textures.get(surface)
+        if texture is None:
+            texture = self._video.Texture.from_surface(self.renderer, surface)
+            self._textures[surface] = texture
+        return texture
+
+    def blit(self, surface, pos):
+        self.texture(surface).draw(dstrect=(pos[0], pos[1], surface.get_width(), surface.get_height()))
+
+    def blit_scaled(self, surface, rect):
+        self.texture(surface).draw(dstrect=pygame.Rect(rect))
+
+    def blits(self, sprites):
+        # 텍스처 복사는 렌더러가 모아서 처리하므로 순서대로 그리기만 함
+        for surface, rect in sprites:
+            self.texture(surface).draw(dstrect=rect)
+
+    def fill_rect(self, color, rect):
+        self.renderer.draw_color = pygame.Color(color)
+        self.renderer.fill_rect(pygame.Rect(rect))
+
+    def draw_rect(self, color, rect, width=1):
+        # 테두리 두께만큼 네 변을 채움
+        rect = pygame.Rect(rect)
+        self.renderer.draw_color = pygame.Color(color)
+        self.renderer.fill_rect((rect.x, rect.y, rect.width, width))
+        self.renderer.fill_rect((rect.x, rect.bottom - width, rect.width, width))
+        self.renderer.fill_rect((rect.x, rect.y, width, rect.height))
+        self.renderer.fill_rect((rect.right - width, rect.y, width, rect.height))
+
+    def present(self):
+        self.renderer.present()
+        self.frames += 1
+
+    def close(self):
+        self._textures = weakref.WeakKeyDictionary()
+        self.window.destroy()
+
+
+def create_backend(size, caption, fullscreen=False, renderer=RENDERER):
+    """
+    렌더링 백엔드를 만드는 함수
+
+    sdl2 백엔드를 만들 수 없으면 software 백엔드를 사용합니다.
+    """
+    if renderer in ('auto', 'sdl2'):
+        try:
+            # auto일 때는 하드웨어 가속 렌더러만 사용
+            return SDL2Backend(size, caption, fullscreen, accelerated=1 if renderer == 'auto' else -1)
+        except (ImportError, RuntimeError, pygame.error) as e:
+            if renderer == 'sdl2':
+                print(f"경고: SDL2 렌더러를 사용할 수 없어 software 렌더러를 사용합니다. ({e})")
+    return SoftwareBackend(size, caption, fullscreen)
@@ -0,0 +1,353 @@
+import os
+import sys
+import json
+import time
+import zlib
+import random
+import struct
+import argparse
+
+import pygame
+
+from app import app
+
+# 입력 기록과 재생
+#
+# 게임 루프는 포인터 위치, 이벤트, 프레임 마무리를 입력 소스를 통해 처리합니다.
+#   LiveInput: 실제 마우스, 터치와 이벤트 (기본)
+#   Recorder:  다른 입력 소스를 감싸 이벤트, 프레임 시간, 난수 시드를 파일에 기록
+#   Player:    기록 파일을 main()의 상태 머신에 다시 넣음 (대기 없이 최대한 빠르게)
+#
+# 환경 변수 TAROT_RECORD에 파일 경로를 지정하면 게임을 하는 동안 기록합니다.
+# 게임의 모든 난수는 시작할 때 기록된 시드로 정해지므로 같은 입력이면 같은 화면이 나옵니다.
+#
+# 파일 구조 (리틀 엔디언)
+#   헤더:   매직(4) 버전(H) 시드(Q) 화면 너비(H) 높이(H)
+#   프레임: zlib으로 압축된 프레임 목록
+#           프레임 시간(H, 0.1ms) 마우스 x(h) y(h) 이벤트 수(B) + 이벤트마다 종류(B)와 값
+
+MAGIC = b'TRRP'
+VERSION = 1
+FPS = 60
+
+RECORD_PATH = os.environ.get('TAROT_RECORD') or None
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SESSIONS_DIR = os.path.join(BASE_DIR, 'sessions')
+
+_HEADER = struct.Struct('<4sHQHH')
+_FRAME = struct.Struct('<HhhB')
+_EVENT_TYPE = struct.Struct('<B')
+
+# 기록하는 이벤트 종류와 값 - 게임 루프에서 쓰지 않는 이벤트는 기록하지 않음
+EVENT_QUIT = 0
+EVENT_MOUSEBUTTONDOWN = 1
+EVENT_MOUSEBUTTONUP = 2
+EVENT_RESIZE = 3
+
+# 게임 루프에서 쓰는 이벤트 - 실제 입력에서는 나머지 이벤트를 큐에 넣지 않음 (set_blocked)
+# 창 크기 변경은 백엔드마다 이벤트가 다름 (software: VIDEORESIZE, sdl2: WINDOWSIZECHANGED)
+INPUT_EVENTS = (
+    pygame.QUIT,
+    pygame.MOUSEMOTION,
+    pygame.MOUSEBUTTONDOWN,
+    pygame.FINGERMOTION,
+    pygame.FINGERDOWN,
+    pygame.VIDEORESIZE,
+    pygame.WINDOWSIZECHANGED,
+)
+
+_EVENT_PAYLOADS = {
+    EVENT_QUIT: struct.Struct('<'),
+    EVENT_MOUSEBUTTONDOWN: struct.Struct('<hhB'),
+    EVENT_MOUSEBUTTONUP: struct.Struct('<hhB'),
+    EVENT_RESIZE: struct.Struct('<HH'),
+}
+
+
+class ReplayError(Exception):
+    pass
+
+
+def encode_event(event):
+    """
+    pygame 이벤트를 (종류, 값) 으로 바꾸는 함수 - 기록하지 않는 이벤트는 None
+    """
+    if event.type == pygame.QUIT:
+        return EVENT_QUIT, ()
+    if event.type == pygame.MOUSEBUTTONDOWN:
+        return EVENT_MOUSEBUTTONDOWN, (event.pos[0], event.pos[1], event.button)
+    if event.type == pygame.MOUSEBUTTONUP:
+        return EVENT_MOUSEBUTTONUP, (event.pos[0], event.pos[1], event.button)
+    # 창 크기 변경은 백엔드마다 이벤트가 다르므로 새 크기만 기록
+    size = app.backend.resize_event_size(event)
+    if size is not None:
+        return EVENT_RESIZE, size
+    return None
+
+
+def decode_event(kind, values):
+    if kind == EVENT_QUIT:
+        return pygame.event.Event(pygame.QUIT)
+    if kind in (EVENT_MOUSEBUTTONDOWN, EVENT_MOUSEBUTTONUP):
+        x, y, button = values
+        event_type = pygame.MOUSEBUTTONDOWN if kind == EVENT_MOUSEBUTTONDOWN else pygame.MOUSEBUTTONUP
+        return pygame.event.Event(event_type, pos=(x, y), button=button)
+    width, height = values
+    return pygame.event.Event(pygame.VIDEORESIZE, w=width, h=height, size=(width, height))
+
+
+class LiveInput:
+    """
+    실제 마우스, 터치와 이벤트를 사용하는 입력 소스
+
+    한 프레임에 쌓인 MOUSEMOTION/FINGERMOTION은 마지막 위치 하나로 합치고,
+    터치(FINGERDOWN)는 그 위치의 MOUSEBUTTONDOWN으로 바꾸어 게임 루프는 마우스와 같이 처리합니다.
+    """
+
+    def __init__(self, seed=None):
+        self.seed = random.getrandbits(64) if seed is None else seed
+        self.clock = pygame.time.Clock()
+        self._pointer = None
+
+    def start(self):
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(INPUT_EVENTS)
+        self._pointer = pygame.mouse.get_pos()
+
+    def _finger_pos(self, event):
+        # 터치 좌표는 창 크기에 대한 비율
+        width, height = app.backend.size
+        return (min(width - 1, int(event.x * width)), min(height - 1, int(event.y * height)))
+
+    def poll(self):
+        # (화면 좌표 포인터 위치, 이벤트 목록)
+        events = []
+        for event in pygame.event.get():
+            if event.type == pygame.MOUSEMOTION:
+                # 터치로 만들어진 마우스 이벤트는 FINGER 이벤트로 처리
+                if not getattr(event, 'touch', False):
+                    self._pointer = event.pos
+            elif event.type == pygame.FINGERMOTION:
+                self._pointer = self._finger_pos(event)
+            elif event.type == pygame.FINGERDOWN:
+                self._pointer = self._finger_pos(event)
+                events.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=self._pointer, button=1, touch=True))
+            elif event.type == pygame.MOUSEBUTTONDOWN:
+                if not getattr(event, 'touch', False):
+                    self._pointer = event.pos
+                    events.append(event)
+            else:
+                events.append(event)
+        return self._pointer, events
+
+    def end_frame(self):
+        self.clock.tick(FPS)
+
+    def close(self):
+        pygame.event.set_allowed(None)
+
+
+class Recorder:
+    """
+    다른 입력 소스를 감싸 입력과 프레임 시간을 파일에 기록하는 입력 소스
+    """
+
+    def __init__(self, source, path):
+        self.source = source
+        self.path = path
+        self.seed = source.seed
+        self._file = None
+        self._compressor = zlib.compressobj()
+        self._frame_count = 0
+        self._frame_start = None
+        self._frame = None
+
+    def start(self):
+        self.source.start()
+        width, height = app.viewport.size
+        self._file = open(self.path, 'wb')
+        self._file.write(_HEADER.pack(MAGIC, VERSION, self.seed, width, height))
+
+    def poll(self):
+        self._frame_start = time.perf_counter()
+        mouse_pos, events = self.source.poll()
+        encoded = [encoded for encoded in map(encode_event, events) if encoded is not None]
+        self._frame = (mouse_pos, encoded[:255])
+        return mouse_pos, events
+
+    def end_frame(self):
+        # 프레임 시간은 poll()부터 화면 표시까지 (FPS를 맞추기 위한 대기는 제외)
+        frame_ms = (time.perf_counter() - self._frame_start) * 1000
+        (x, y), events = self._frame
+        data = bytearray(_FRAME.pack(min(round(frame_ms * 10), 0xFFFF), x, y, len(events)))
+        for kind, values in events:
+            data += _EVENT_TYPE.pack(kind) + _EVENT_PAYLOADS[kind].pack(*values)
+        self._file.write(self._compressor.compress(bytes(data)))
+        # 게임이 비정상 종료되어도 1초 전까지의 기록은 남도록 주기적으로 내보냄
+        self._frame_count += 1
+        if self._frame_count % FPS == 0:
+            self._file.write(self._compressor.flush(zlib.Z_SYNC_FLUSH))
+            self._file.flush()
+        self.source.end_frame()
+
+    def close(self):
+        if self._file is not None:
+            self._file.write(self._compressor.flush())
+            self._file.close()
+            self._file = None
+        self.source.close()
+
+
+def read_session(path):
+    """
+    기록 파일을 읽는 함수
+
+    Returns:
+        tuple: (시드, 화면 크기, [(프레임 시간(ms), 마우스 위치, [(종류, 값)])])
+    """
+    with open(path, 'rb') as f:
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size:
+            raise ReplayError("기록 파일이 너무 짧습니다.")
+        magic, version, seed, width, height = _HEADER.unpack(header)
+        if magic != MAGIC:
+            raise ReplayError("입력 기록 파일 형식이 아닙니다.")
+        if version != VERSION:
+            raise ReplayError(f"지원하지 않는 입력 기록 버전입니다: {version}")
+        try:
+            # 끝까지 쓰이지 않은 기록(비정상 종료)도 남은 부분까지 읽음
+            data = zlib.decompressobj().decompress(f.read())
+        except zlib.error as e:
+            raise ReplayError(f"기록 파일이 손상되었습니다: {e}")
+
+    frames = []
+    offset = 0
+    try:
+        while offset < len(data):
+            frame_time, x, y, count = _FRAME.unpack_from(data, offset)
+            offset += _FRAME.size
+            events = []
+            for _ in range(count):
+                (kind,) = _EVENT_TYPE.unpack_from(data, offset)
+                payload = _EVENT_PAYLOADS[kind]
+                events.append((kind, payload.unpack_from(data, offset + _EVENT_TYPE.size)))
+                offset += _EVENT_TYPE.size + payload.size
+            frames.append((frame_time / 10, (x, y), events))
+    except struct.error:
+        # 마지막 프레임이 잘린 기록 - 온전한 프레임까지만 사용
+        pass
+    except KeyError as e:
+        raise ReplayError(f"알 수 없는 이벤트 종류입니다: {e}")
+    return seed, (width, height), frames
+
+
+class Player:
+    """
+    기록 파일의 입력을 그대로 다시 넣는 입력 소스
+
+    기다리지 않고 프레임을 최대한 빨리 진행하며, 프레임마다 걸린 시간을 기록합니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.seed, self.size, self.frames = read_session(path)
+        self.recorded_times = [frame_time for frame_time, _, _ in self.frames]
+        self.replay_times = []
+        self._index = 0
+        self._frame_start = None
+
+    def start(self):
+        if app.viewport.size != self.size:
+            app.resize(*self.size)
+
+    def poll(self):
+        self._frame_start = time.perf_counter()
+        if self._index >= len(self.frames):
+            # 기록이 끝나면 게임 종료
+            return self.frames[-1][1] if self.frames else (0, 0), [pygame.event.Event(pygame.QUIT)]
+        _, mouse_pos, events = self.frames[self._index]
+        self._index += 1
+        return mouse_pos, [decode_event(kind, values) for kind, values in events]
+
+    def end_frame(self):
+        self.replay_times.append((time.perf_counter() - self._frame_start) * 1000)
+
+    def close(self):
+        pass
+
+
+def input_source():
+    """
+    게임에서 사용할 입력 소스 - TAROT_RECORD가 지정되어 있으면 기록
+    """
+    source = LiveInput()
+    if RECORD_PATH:
+        source = Recorder(source, RECORD_PATH)
+    return source
+
+
+def _frame_stats(times):
+    if not times:
+        return {'mean_ms': 0, 'p95_ms': 0, 'max_ms': 0}
+    ordered = sorted(times)
+    return {
+        'mean_ms': sum(ordered) / len(ordered),
+        'p95_ms': ordered[int(len(ordered) * 0.95)],
+        'max_ms': ordered[-1],
+    }
+
+
+def replay(path, theme=None):
+    """
+    기록 파일을 main()으로 재생하고 프레임 시간 통계를 반환하는 함수
+    """
+    import game
+    from history import history
+
+    # 재생한 리딩은 기록하지 않음
+    history.path = None
+    player = Player(path)
+    start = time.perf_counter()
+    game.main(theme or game.DARK_THEME, player)
+    return {
+        'frames': len(player.replay_times),
+        'total_ms': (time.perf_counter() - start) * 1000,
+        'recorded': _frame_stats(player.recorded_times),
+        'replay': _frame_stats(player.replay_times),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='기록된 입력을 재생하여 프레임 시간 측정')
+    parser.add_argument('path', help='입력 기록 파일 (TAROT_RECORD로 기록)')
+    parser.add_argument('--light', action='store_true', help='밝은 테마로 재생')
+    parser.add_argument('--window', action='store_true', help='창을 띄워 재생 (기본은 창 없이)')
+    parser.add_argument('--json', action='store_true', help='결과를 JSON으로 출력')
+    args = parser.parse_args(argv)
+
+    if not args.window:
+        os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+    theme = None
+    if args.light:
+        from main import LIGHT_THEME
+        theme = LIGHT_THEME
+
+    try:
+        result = replay(args.path, theme)
+    except (OSError, ReplayError) as e:
+        print(f"재생할 수 없습니다: {e}")
+        return 1
+
+    if args.json:
+        print(json.dumps(result))
+    else:
+        print(f"{result['frames']}프레임, {result['total_ms']:.0f}ms")
+        for name in ('recorded', 'replay'):
+            stats = result[name]
+            print(f"  {name:8s} 평균 {stats['mean_ms']:6.2f}ms  p95 {stats['p95_ms']:6.2f}ms  최대 {stats['max_ms']:7.2f}ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,109 @@
+import re
+import sys
+import math
+
+from card_store import open_store, DEFAULT_LOCALE
+
+# 카드 검색 색인
+#
+# 카드 이름, 의미, 설명을 글자 바이그램(두 글자씩 겹쳐 자른 조각)으로 나눈 역색인입니다.
+# 한국어는 조사와 어미가 붙어 단어 단위로는 찾기 어려우므로 "새로운 시작"은
+# "새로", "로운", "시작"으로 나누어 찾습니다. 한 글자 단어("힘")는 그 글자 하나를 조각으로 씁니다.
+#
+# 색인은 로케일마다 처음 검색할 때 한 번 만들고, 검색은 질의 조각의 색인 항목만 읽습니다.
+
+# 필드별 가중치
+SEARCH_FIELDS = {
+    'name': 3.0,
+    'meaning': 2.0,
+    'reversed_meaning': 1.5,
+    'description': 1.0,
+    'reversed_description': 0.5,
+}
+
+_WORD = re.compile(r'\w+')
+
+
+def tokenize(text):
+    """
+    텍스트를 바이그램 목록으로 나누는 함수 (같은 조각이 여러 번 나오면 여러 번 포함)
+    """
+    tokens = []
+    for word in _WORD.findall(text.lower()):
+        if len(word) == 1:
+            tokens.append(word)
+        else:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return tokens
+
+
+class SearchIndex:
+    def __init__(self, store, locale=DEFAULT_LOCALE, fields=SEARCH_FIELDS):
+        self.store = store
+        self.locale = locale
+        # 조각 -> {카드 ID: 가중치 합}
+        self._postings = {}
+        fields = {field: weight for field, weight in fields.items() if field in store.fields}
+        for card_id in store.ids():
+            card = store.get(card_id, locale)
+            for field, weight in fields.items():
+                for token in tokenize(card[field]):
+                    postings = self._postings.setdefault(token, {})
+                    postings[card_id] = postings.get(card_id, 0) + weight
+
+        # 여러 카드에 흔한 조각일수록 점수가 낮음
+        card_count = len(store)
+        self._idf = {token: math.log(1 + card_count / len(postings)) for token, postings in self._postings.items()}
+
+    def search(self, query, limit=10):
+        """
+        질의와 관련된 카드를 점수 순으로 반환하는 함수
+
+        질의 조각을 더 많이 포함한 카드가 먼저 오고, 같으면 필드 가중치와 조각의 희귀도로 정합니다.
+
+        Returns:
+            list: (카드 ID, 점수) 목록
+        """
+        scores = {}
+        matched = {}
+        for token in set(tokenize(query)):
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            idf = self._idf[token]
+            for card_id, weight in postings.items():
+                scores[card_id] = scores.get(card_id, 0) + weight * idf
+                matched[card_id] = matched.get(card_id, 0) + 1
+
+        ranked = sorted(scores, key=lambda card_id: (-matched[card_id], -scores[card_id], card_id))
+        return [(card_id, scores[card_id]) for card_id in ranked[:limit]]
+
+
+_indexes = {}
+
+
+def get_index(locale=DEFAULT_LOCALE):
+    index = _indexes.get(locale)
+    if index is None:
+        index = _indexes[locale] = SearchIndex(open_store(), locale)
+    return index
+
+
+def search(query, locale=DEFAULT_LOCALE, limit=10):
+    """
+    카드를 검색하여 카드 데이터 목록을 반환하는 함수
+    """
+    index = get_index(locale)
+    return [index.store.get(card_id, locale) for card_id, _ in index.search(query, limit)]
+
+
+if __name__ == "__main__":
+    # 사용법: python search.py 검색어
+    query = ' '.join(sys.argv[1:])
+    if not query:
+        print("사용법: python search.py 검색어")
+        sys.exit(1)
+    index = get_index()
+    for card_id, score in index.search(query):
+        card = index.store.get(card_id)
+        print(f"{score:6.2f}  {card['name']} - {card['meaning']}")
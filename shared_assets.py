@@ -0,0 +1,239 @@
+import os
+import sys
+import mmap
+import struct
+import argparse
+import tempfile
+
+import pygame
+
+from app import CACHE_DIR
+
+# 여러 인스턴스가 함께 쓰는 카드 이미지
+#
+# 한 기기에서 게임을 여러 개 실행하면(키오스크 여러 화면) 인스턴스마다 같은 카드 이미지를 디코딩해
+# 따로 보관하게 됩니다. 로더(python shared_assets.py)가 카드 앞면과 뒷면을 한 번만 디코딩하여
+# 게임이 보관하는 크기(card_image_size)의 픽셀 그대로 파일 하나에 써 두면, 각 게임은 이 파일을
+# mmap하여 pygame.image.frombuffer로 복사 없이 Surface를 만듭니다. 모든 인스턴스가 같은
+# 페이지 캐시를 공유하므로 메모리는 인스턴스 수가 아니라 이미지 수에 비례합니다.
+#
+# 기본 위치는 /dev/shm(메모리 파일 시스템)이고, 없으면 캐시 디렉토리입니다.
+# 환경 변수 TAROT_SHARED_ASSETS로 경로를 지정할 수 있고, 빈 값이면 사용하지 않습니다.
+# 파일이 없거나, 보관 크기가 다르거나(다른 화면 배율), 원본 이미지 파일이 바뀐 항목은
+# 지금처럼 각자 파일에서 읽습니다. 이미지나 카드 데이터를 바꾼 뒤에는 로더를 다시 실행하세요.
+#
+# 파일 구조 (리틀 엔디언)
+#   헤더:   매직(4) 버전(H) 항목 수(H) 보관 너비(H) 높이(H)
+#   항목:   항목마다 게임 디렉토리 기준 상대 경로(64, UTF-8, 예: images/00_fool.jpg) 너비(H) 높이(H) 형식(B) 원본 파일 수정 시각(Q, ns) 크기(Q) 픽셀 오프셋(Q)
+#           (이미지 파일이 없어 그린 기본 카드는 수정 시각과 크기가 0)
+#   픽셀:   항목마다 너비 x 높이 x 4바이트 (RGBX 또는 RGBA) - 페이지 경계에 맞춤
+
+MAGIC = b'TRSA'
+VERSION = 1
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_DIR = '/dev/shm' if os.path.isdir('/dev/shm') else CACHE_DIR
+SHARED_ASSETS_PATH = os.environ.get('TAROT_SHARED_ASSETS', os.path.join(DEFAULT_DIR, 'tarot-game-assets.bin'))
+
+_HEADER = struct.Struct('<4sHHHH')
+_ENTRY = struct.Struct('<64sHHBxQQQ')
+
+# 형식 번호 -> frombuffer 형식
+_FORMATS = ('RGBX', 'RGBA')
+
+
+class SharedAssetError(Exception):
+    pass
+
+
+def _key(path):
+    # 게임의 캐시 키(이미지 파일의 절대 경로) -> 파일에 저장하는 게임 디렉토리 기준 상대 경로
+    return os.path.relpath(path, BASE_DIR)
+
+
+def _source_stat(path):
+    # 상대 경로는 게임 디렉토리 기준 - 게임을 어느 디렉토리에서 실행해도 같은 파일을 확인
+    try:
+        stat = os.stat(os.path.join(BASE_DIR, path))
+    except FileNotFoundError:
+        return 0, 0
+    return stat.st_mtime_ns, stat.st_size
+
+
+def encode_assets(images, max_size):
+    """
+    이미지들을 공유 자원 파일 내용으로 만드는 함수
+
+    Args:
+        images (list): (경로, Surface) 목록 - 경로는 게임의 캐시 키(이미지 파일 경로)
+        max_size (tuple): 이미지를 줄인 보관 크기
+    """
+    header = bytearray(_HEADER.pack(MAGIC, VERSION, len(images), *max_size))
+    offset = _HEADER.size + len(images) * _ENTRY.size
+    pixels = []
+    for path, image in images:
+        key = _key(path).encode('utf-8')
+        if len(key) > 64:
+            raise SharedAssetError(f"경로가 너무 깁니다: {path}")
+        format_id = 1 if image.get_flags() & pygame.SRCALPHA else 0
+        data = pygame.image.tobytes(image, _FORMATS[format_id])
+        # 각 이미지가 페이지 경계에서 시작하도록 맞춤
+        padding = -offset % mmap.PAGESIZE
+        pixels.append(bytes(padding))
+        offset += padding
+        header += _ENTRY.pack(key, *image.get_size(), format_id, *_source_stat(path), offset)
+        pixels.append(data)
+        offset += len(data)
+    return bytes(header) + b''.join(pixels)
+
+
+class SharedAssetStore:
+    def __init__(self, buffer, source=None):
+        self.buffer = buffer
+        self.source = source
+        if len(buffer) < _HEADER.size:
+            raise SharedAssetError("공유 자원 파일이 너무 짧습니다.")
+        magic, version, count, *max_size = _HEADER.unpack_from(buffer, 0)
+        if magic != MAGIC:
+            raise SharedAssetError("공유 자원 파일 형식이 아닙니다.")
+        if version != VERSION:
+            raise SharedAssetError(f"지원하지 않는 공유 자원 버전입니다: {version}")
+        self.max_size = tuple(max_size)
+        self._view = memoryview(buffer)
+        # 경로 -> (너비, 높이, 형식, 수정 시각, 크기, 오프셋)
+        self._entries = {}
+        try:
+            for i in range(count):
+                key, *entry = _ENTRY.unpack_from(buffer, _HEADER.size + i * _ENTRY.size)
+                width, height, _, _, _, offset = entry
+                if offset + width * height * 4 > len(buffer):
+                    raise SharedAssetError("공유 자원 파일이 잘렸습니다.")
+                self._entries[key.rstrip(b'\0').decode('utf-8')] = tuple(entry)
+        except (struct.error, UnicodeDecodeError) as e:
+            raise SharedAssetError(f"공유 자원 파일이 손상되었습니다: {e}")
+
+    @classmethod
+    def open(cls, path=SHARED_ASSETS_PATH):
+        # 쓰기 시 복사(ACCESS_COPY) - 읽기만 하는 동안은 모든 프로세스가 같은 페이지를 공유하고,
+        # 실수로 Surface에 그려도 그 페이지만 이 프로세스에 복사됨
+        with open(path, 'rb') as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY)
+        return cls(buffer, source=path)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, path):
+        return _key(path) in self._entries
+
+    def get(self, path, max_size=None):
+        """
+        공유 메모리의 픽셀을 그대로 쓰는 Surface를 반환하는 함수
+
+        항목이 없거나, 보관 크기가 다르거나, 원본 이미지 파일이 바뀌었으면 None
+        """
+        entry = self._entries.get(_key(path))
+        if entry is None or (max_size is not None and tuple(max_size) != self.max_size):
+            return None
+        width, height, format_id, mtime, size, offset = entry
+        if _source_stat(path) != (mtime, size):
+            return None
+        return pygame.image.frombuffer(self._view[offset:offset + width * height * 4], (width, height),
+                                       _FORMATS[format_id])
+
+
+_shared = False
+
+
+def open_shared_assets(path=None):
+    """
+    공유 자원 파일을 여는 함수 - 사용하지 않거나 파일이 없거나 읽을 수 없으면 None
+
+    Surface가 파일의 메모리를 직접 참조하므로 연 파일은 프로세스가 끝날 때까지 닫지 않습니다.
+    """
+    global _shared
+    if path is not None:
+        try:
+            return SharedAssetStore.open(path)
+        except (OSError, ValueError, SharedAssetError):
+            return None
+    if _shared is False:
+        _shared = None
+        if SHARED_ASSETS_PATH:
+            try:
+                _shared = SharedAssetStore.open(SHARED_ASSETS_PATH)
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError, SharedAssetError) as e:
+                print(f"경고: 공유 자원을 사용할 수 없습니다. ({e})")
+    return _shared
+
+
+def load_assets():
+    """
+    게임이 쓰는 카드 이미지(모든 카드 앞면과 뒷면)를 보관 크기로 읽는 함수
+
+    Returns:
+        tuple: ((경로, Surface) 목록, 보관 크기)
+    """
+    from assets import load_image
+    from card_store import open_store
+    from faces import faces
+    from game import IMAGE_DIR, CARD_BACK_PATH, card_image_size, create_card_back
+
+    pygame.display.init()
+    max_size = card_image_size()
+    store = open_store()
+    cards = [store.get(card_id) for card_id in store.ids()]
+    # 이미지 파일이 없는 카드의 기본 앞면은 미리 한 번에 그리기 시작
+    faces.generate([card for card in cards if not os.path.exists(os.path.join(IMAGE_DIR, card['image_file']))])
+
+    images = []
+    sources = [(os.path.join(IMAGE_DIR, card['image_file']), lambda card=card: faces.face(card)) for card in cards]
+    sources.append((CARD_BACK_PATH, create_card_back))
+    for path, fallback in sources:
+        images.append((path, load_image(path, max_size) if os.path.exists(path) else fallback()))
+    faces.close()
+    return images, max_size
+
+
+def write_assets(path=SHARED_ASSETS_PATH):
+    """
+    카드 이미지를 디코딩하여 공유 자원 파일로 쓰는 함수
+
+    임시 파일에 먼저 쓴 뒤 교체하므로 이미 열어 둔 게임은 이전 파일을 계속 사용합니다.
+    """
+    images, max_size = load_assets()
+    data = encode_assets(images, max_size)
+    # 동시에 실행한 다른 로더와 겹치지 않도록 임시 파일 이름은 매번 새로 만듦
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        # mkstemp는 소유자만 읽을 수 있는 파일을 만들므로 다른 사용자로 실행한 게임도 읽을 수 있게 함
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except OSError:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+    return len(images), max_size, len(data)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='여러 게임 인스턴스가 함께 쓰는 카드 이미지 만들기')
+    parser.add_argument('--output', default=SHARED_ASSETS_PATH, help='공유 자원 파일 경로')
+    args = parser.parse_args(argv)
+    if not args.output:
+        parser.error("공유 자원 파일 경로가 비어 있습니다 (TAROT_SHARED_ASSETS).")
+    count, max_size, size = write_assets(args.output)
+    print(f"카드 이미지 {count}개 ({max_size[0]}x{max_size[1]}), {size / 1024 / 1024:.1f}MB -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
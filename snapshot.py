@@ -0,0 +1,263 @@
+import os
+import zlib
+import struct
+import tempfile
+import threading
+
+from app import CACHE_DIR, INSTANCE_ID
+
+# 세션 스냅샷
+#
+# 키오스크가 리딩 도중 다시 시작되어도 이어서 볼 수 있도록 게임 상태(화면, 스프레드, 시드,
+# 카드 ID와 위치, 뒤집기/이동 진행도, 선택한 카드, 난수 상태)를 작은 바이너리 파일로 저장합니다.
+# 게임은 화면이 바뀔 때(시작, 카드 선택, 리딩, 상세 보기)마다 상태를 인코딩해 넘기기만 하고,
+# 파일 쓰기(fsync 포함)는 별도 스레드에서 이루어지므로 프레임이 멈추지 않습니다.
+# 쓰기가 밀리면 가장 최근 상태만 씁니다.
+#
+# 실제 입력으로 실행할 때만 저장하고 복원합니다 (입력 기록 재생과 진단 도구는 사용하지 않음).
+# 한 기기의 여러 인스턴스가 서로의 리딩을 복원하거나 지우지 않도록 기본 파일은 인스턴스(app.INSTANCE_ID)마다 따로 둡니다.
+# 환경 변수 TAROT_SNAPSHOT으로 파일 경로를 지정할 수 있고, 빈 값이면 사용하지 않습니다.
+#
+# 파일 구조 (리틀 엔디언)
+#   헤더:   매직(4) 버전(H) 화면(B) 스프레드 id 길이(B) 시드(Q) 나눠 주기 프레임(h) 리딩 전환까지 남은 프레임(h)
+#           상세 보기 카드 번호(h) 카드 수(H) 선택한 카드 수(H) + 스프레드 id (UTF-8)
+#           (프레임과 카드 번호는 없으면 -1)
+#   카드:   카드마다 ID(H) 상태(B) 뒤집기 진행도(B) 이동 진행도(B) 위치와 크기(hhHH)
+#           이동 시작 위치(hh) 목표 위치(hh) 시작 크기(HH) 목표 크기(HH)
+#   선택:   선택한 순서대로 카드 번호(H)
+#   난수:   버전(B) gauss 여부(B) gauss 값(d) 내부 상태(625 x I)
+#   끝:     앞의 모든 바이트의 CRC32(I)
+
+MAGIC = b'TRSN'
+VERSION = 1
+
+SNAPSHOT_PATH = os.environ.get('TAROT_SNAPSHOT', os.path.join(
+    CACHE_DIR, f"session-{INSTANCE_ID}.snapshot" if INSTANCE_ID else 'session.snapshot'))
+
+_HEADER = struct.Struct('<4sHBBQhhhHH')
+_CARD = struct.Struct('<HBBBhhHHhhhhHHHH')
+_INDEX = struct.Struct('<H')
+_RANDOM = struct.Struct('<BBd625I')
+_CRC = struct.Struct('<I')
+
+# 카드 상태 비트
+_REVERSED = 1
+_REVEALED = 2
+_FLIPPING = 4
+_MOVING = 8
+
+
+class SnapshotError(Exception):
+    pass
+
+
+class SessionState:
+    """
+    스냅샷에 저장하는 게임 상태
+
+    cards는 카드마다 card_record()가 만든 튜플, selected는 cards에서의 번호 목록입니다.
+    """
+
+    def __init__(self, game_state, spread_id, seed, cards, selected, detailed=None, deal_frame=None,
+                 reading_countdown=None, random_state=None):
+        self.game_state = game_state
+        self.spread_id = spread_id
+        self.seed = seed
+        self.cards = cards
+        self.selected = selected
+        self.detailed = detailed
+        self.deal_frame = deal_frame
+        self.reading_countdown = reading_countdown
+        self.random_state = random_state
+
+
+def card_record(card):
+    """
+    Card의 저장할 속성을 튜플로 만드는 함수
+    """
+    flags = ((_REVERSED if card.reversed else 0) | (_REVEALED if card.revealed else 0) |
+             (_FLIPPING if card.flipping else 0) | (_MOVING if card.moving else 0))
+    rect = card.rect
+    return (card.card_data['id'], flags, card.flip_progress, card.move_progress,
+            rect.x, rect.y, rect.width, rect.height, *card.original_pos, *card.target_pos,
+            *card.original_size, *card.target_size)
+
+
+def record_reversed(record):
+    return bool(record[1] & _REVERSED)
+
+
+def apply_card_record(card, record):
+    """
+    card_record()로 저장한 속성을 Card에 되돌리는 함수
+    """
+    (_, flags, card.flip_progress, card.move_progress, x, y, width, height,
+     original_x, original_y, target_x, target_y, original_width, original_height, target_width, target_height) = record
+    card.revealed = bool(flags & _REVEALED)
+    card.flipping = bool(flags & _FLIPPING)
+    card.moving = bool(flags & _MOVING)
+    card.rect.update(x, y, width, height)
+    card.original_pos = (original_x, original_y)
+    card.target_pos = (target_x, target_y)
+    card.original_size = (original_width, original_height)
+    card.target_size = (target_width, target_height)
+
+
+def _optional(value):
+    return -1 if value is None else value
+
+
+def encode_snapshot(state):
+    spread_id = state.spread_id.encode('utf-8')
+    data = bytearray(_HEADER.pack(MAGIC, VERSION, state.game_state, len(spread_id), state.seed,
+                                  _optional(state.deal_frame), _optional(state.reading_countdown),
+                                  _optional(state.detailed), len(state.cards), len(state.selected)))
+    data += spread_id
+    for record in state.cards:
+        data += _CARD.pack(*record)
+    for index in state.selected:
+        data += _INDEX.pack(index)
+    version, internal, gauss = state.random_state
+    data += _RANDOM.pack(version, gauss is not None, gauss or 0.0, *internal)
+    data += _CRC.pack(zlib.crc32(data))
+    return bytes(data)
+
+
+def decode_snapshot(data):
+    if len(data) < _HEADER.size + _CRC.size:
+        raise SnapshotError("스냅샷 파일이 너무 짧습니다.")
+    (crc,) = _CRC.unpack_from(data, len(data) - _CRC.size)
+    if zlib.crc32(data[:-_CRC.size]) != crc:
+        raise SnapshotError("스냅샷 파일이 손상되었습니다.")
+    (magic, version, game_state, spread_length, seed, deal_frame, reading_countdown, detailed,
+     card_count, selected_count) = _HEADER.unpack_from(data, 0)
+    if magic != MAGIC:
+        raise SnapshotError("스냅샷 파일 형식이 아닙니다.")
+    if version != VERSION:
+        raise SnapshotError(f"지원하지 않는 스냅샷 버전입니다: {version}")
+
+    try:
+        offset = _HEADER.size
+        spread_id = data[offset:offset + spread_length].decode('utf-8')
+        offset += spread_length
+        cards = [_CARD.unpack_from(data, offset + i * _CARD.size) for i in range(card_count)]
+        offset += card_count * _CARD.size
+        selected = [_INDEX.unpack_from(data, offset + i * _INDEX.size)[0] for i in range(selected_count)]
+        offset += selected_count * _INDEX.size
+        random_version, has_gauss, gauss, *internal = _RANDOM.unpack_from(data, offset)
+    except (struct.error, UnicodeDecodeError) as e:
+        raise SnapshotError(f"스냅샷 파일이 손상되었습니다: {e}")
+    if any(index >= card_count for index in selected) or detailed >= card_count:
+        raise SnapshotError("스냅샷의 카드 번호가 범위를 벗어났습니다.")
+
+    def optional(value):
+        return None if value < 0 else value
+
+    return SessionState(game_state, spread_id, seed, cards, selected, optional(detailed), optional(deal_frame),
+                        optional(reading_countdown), (random_version, tuple(internal), gauss if has_gauss else None))
+
+
+class SessionSnapshots:
+    def __init__(self, path=SNAPSHOT_PATH):
+        self.path = path
+        self._condition = threading.Condition()
+        # 아직 쓰지 않은 가장 최근 스냅샷 (b''이면 파일 삭제)
+        self._pending = None
+        self._writing = False
+        self._writer = None
+        self.error = None
+
+    @property
+    def enabled(self):
+        return bool(self.path)
+
+    def load(self):
+        """
+        저장된 상태를 읽는 함수 - 없거나 읽을 수 없으면 None
+        """
+        if not self.enabled:
+            return None
+        try:
+            with open(self.path, 'rb') as f:
+                return decode_snapshot(f.read())
+        except FileNotFoundError:
+            return None
+        except (OSError, SnapshotError) as e:
+            print(f"경고: 세션 스냅샷을 복원할 수 없습니다. ({e})")
+            return None
+
+    def save(self, state):
+        """
+        상태를 저장하는 함수 - 인코딩만 하고 쓰기는 스냅샷 스레드에서 이루어짐
+        """
+        if self.enabled:
+            self._submit(encode_snapshot(state))
+
+    def clear(self):
+        # 리딩이 끝났거나 게임을 정상 종료하면 복원할 상태가 없음
+        if self.enabled:
+            self._submit(b'')
+
+    def _submit(self, data):
+        with self._condition:
+            self._pending = data
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write_loop, name='tarot-snapshot', daemon=True)
+                self._writer.start()
+            self._condition.notify()
+
+    def _write_loop(self):
+        while True:
+            with self._condition:
+                while self._pending is None:
+                    self._condition.wait()
+                data, self._pending = self._pending, None
+                self._writing = True
+            try:
+                self._write(data)
+                self.error = None
+            except OSError as e:
+                # 저장에 실패해도 게임은 계속 (다음 화면 전환에서 다시 저장, 경고는 연속된 실패의 처음에만 출력)
+                if self.error is None:
+                    print(f"경고: 세션 스냅샷을 저장할 수 없습니다. ({e})")
+                self.error = e
+            with self._condition:
+                self._writing = False
+                self._condition.notify_all()
+
+    def _write(self, data):
+        if not data:
+            try:
+                os.remove(self.path)
+            except FileNotFoundError:
+                pass
+            return
+        # 전원이 꺼져도 이전 스냅샷이나 새 스냅샷 중 하나는 온전히 남도록 임시 파일에 쓰고 교체
+        # (같은 파일을 쓰는 다른 프로세스와 겹치지 않도록 임시 파일 이름은 매번 새로 만듦)
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=os.path.basename(self.path) + '.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, self.path)
+        except OSError:
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+            raise
+
+    def flush(self):
+        # 지금까지 save()/clear()한 상태가 모두 쓰일 때까지 기다림
+        with self._condition:
+            while self._pending is not None or self._writing:
+                self._condition.wait()
+
+    def close(self):
+        self.flush()
+
+
+snapshots = SessionSnapshots()
@@ -0,0 +1,195 @@
+import os
+import json
+
+import pygame
+
+from app import SCREEN_WIDTH, SCREEN_HEIGHT, FONT_SIZES, CARD_WIDTH, CARD_HEIGHT
+from assets import assets
+from combinations import open_table
+
+# 타로 스프레드(배치 방식)
+#
+# 스프레드는 spreads.json에 정의되며, 환경 변수 TAROT_SPREADS로 사용자 정의
+# 스프레드 파일을 추가로 지정할 수 있습니다. 각 위치의 x, y는 화면 크기에 대한
+# 카드 중심의 비율(0~1)입니다. 카드 위치는 기준 해상도 좌표로 계산되고,
+# 라벨은 실제 화면 크기에 맞게 렌더링됩니다.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SPREADS_PATH = os.path.join(BASE_DIR, 'spreads.json')
+
+# 카드 선택 화면에 놓이는 카드 수 (game.init_game의 3행 7열) - 이보다 위치가 많은 스프레드는 끝낼 수 없음
+MAX_POSITIONS = 21
+
+
+class SpreadError(Exception):
+    pass
+
+
+class Spread:
+    def __init__(self, spread_id, name, description, positions, card_scale=1.0, show_meanings=True,
+                 combinations=False):
+        if not positions:
+            raise SpreadError(f"스프레드 '{spread_id}'에 위치가 없습니다.")
+        if len(positions) > MAX_POSITIONS:
+            raise SpreadError(f"스프레드 '{spread_id}'의 위치가 너무 많습니다: {len(positions)}개 (최대 {MAX_POSITIONS}개)")
+        self.id = spread_id
+        self.name = name
+        self.description = description
+        self.positions = positions
+        self.card_scale = card_scale
+        self.show_meanings = show_meanings
+        self.combinations = combinations  # 이어지는 카드의 조합 해석 표시
+
+    @classmethod
+    def from_dict(cls, data):
+        try:
+            positions = [(p['label'], float(p['x']), float(p['y'])) for p in data['positions']]
+            return cls(data['id'], data['name'], data.get('description', ''), positions,
+                       float(data.get('card_scale', 1.0)), bool(data.get('show_meanings', True)),
+                       bool(data.get('combinations', False)))
+        except (KeyError, TypeError, ValueError) as e:
+            raise SpreadError(f"스프레드 정의가 올바르지 않습니다: {e}")
+
+    @property
+    def size(self):
+        return len(self.positions)
+
+    @property
+    def labels(self):
+        return [label for label, _, _ in self.positions]
+
+
+def load_spreads(paths=None):
+    """
+    스프레드 정의 파일을 읽는 함수
+
+    같은 id의 스프레드가 여러 파일에 있으면 나중 파일의 정의를 사용합니다.
+    사용자 정의 파일(TAROT_SPREADS)이 없거나 올바르지 않으면 경고만 출력하고 기본 스프레드를 사용합니다.
+
+    Returns:
+        list: Spread 목록 (정의된 순서)
+    """
+    if paths is None:
+        paths = [SPREADS_PATH]
+        if os.environ.get('TAROT_SPREADS'):
+            paths.append(os.environ['TAROT_SPREADS'])
+
+    spreads = {}
+    for path in paths:
+        try:
+            spreads.update(_read_spreads(path))
+        except (OSError, ValueError, SpreadError) as e:
+            # 기본 스프레드 파일은 게임과 함께 배포되므로 읽을 수 없으면 그대로 오류
+            if path == SPREADS_PATH:
+                raise
+            print(f"경고: 스프레드 파일을 읽을 수 없어 건너뜁니다: {path} ({e})")
+    return list(spreads.values())
+
+
+def _read_spreads(path):
+    # 파일 하나의 스프레드 (id -> Spread) - 하나라도 올바르지 않으면 파일 전체를 쓰지 않음
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, list):
+        raise SpreadError("스프레드 목록이 아닙니다.")
+    spreads = {}
+    for item in data:
+        spread = Spread.from_dict(item)
+        spreads[spread.id] = spread
+    return spreads
+
+
+class SpreadLayout:
+    """
+    특정 스프레드와 화면 해상도에 대해 미리 계산된 배치
+
+    카드 목표 위치와 라벨 텍스트는 한 번만 계산/렌더링되므로
+    카드 수와 관계없이 프레임마다 드는 비용이 같습니다.
+    """
+
+    def __init__(self, spread, viewport, label_color):
+        self.spread = spread
+        self.viewport = viewport
+        card_width = int(CARD_WIDTH * spread.card_scale)
+        card_height = int(CARD_HEIGHT * spread.card_scale)
+
+        # 카드 크기에 맞는 라벨 폰트
+        label_size = FONT_SIZES['medium'] if spread.card_scale >= 1 else FONT_SIZES['small']
+        label_gap = 30 if spread.card_scale >= 1 else 20
+
+        # 카드 목표 위치 (기준 해상도 좌표)
+        self.card_rects = []
+        # 라벨 (Surface, 화면 좌표 Rect)
+        self.labels = []
+        for label, x, y in spread.positions:
+            rect = pygame.Rect(0, 0, card_width, card_height)
+            rect.center = (int(SCREEN_WIDTH * x), int(SCREEN_HEIGHT * y))
+            self.card_rects.append(rect)
+
+            surface = assets.text(label, label_size, label_color)
+            self.labels.append((surface, surface.get_rect(center=viewport.point((rect.centerx, rect.y - label_gap)))))
+
+    def move_cards(self, cards):
+        # 선택된 카드를 스프레드 위치로 이동
+        for card, rect in zip(cards, self.card_rects):
+            card.move_to(rect.x, rect.y, rect.width, rect.height)
+
+    def render_meanings(self, cards, color):
+        """
+        리딩 결과 화면에 표시할 카드 의미 텍스트를 한 번에 렌더링하는 함수
+
+        Returns:
+            list: (Surface, Rect) 목록 - show_meanings가 꺼져 있으면 빈 목록
+        """
+        if not self.spread.show_meanings:
+            return []
+        meanings = []
+        for card, rect in zip(cards, self.card_rects):
+            surface = assets.text(card.meaning, FONT_SIZES['small'], color)
+            meanings.append((surface, surface.get_rect(center=self.viewport.point((rect.centerx, rect.bottom + 30)))))
+        return meanings
+
+    def render_combinations(self, cards, color):
+        """
+        이어지는 두 카드와 (세 장 스프레드이면) 세 카드 전체의 조합 해석을 렌더링하는 함수
+
+        해석은 미리 컴파일된 조합 표에서 카드마다 한 번씩만 조회합니다.
+
+        Returns:
+            list: (Surface, Rect) 목록 - combinations가 꺼져 있으면 빈 목록
+        """
+        if not self.spread.combinations or len(cards) < 2:
+            return []
+        table = open_table()
+        keys = [(card.card_data['id'], card.reversed) for card in cards]
+        labels = self.spread.labels
+
+        lines = [f"{labels[i]} → {labels[i + 1]}: {table.pair(keys[i], keys[i + 1])}" for i in range(len(keys) - 1)]
+        if len(keys) == 3:
+            lines.append(table.triple(*keys))
+
+        top = max(rect.bottom for rect in self.card_rects) + 80
+        rendered = []
+        for i, line in enumerate(lines):
+            surface = assets.text(line, FONT_SIZES['small'], color)
+            rendered.append((surface, surface.get_rect(center=self.viewport.point((SCREEN_WIDTH // 2, top + i * 30)))))
+        return rendered
+
+
+_layouts = {}
+_layout_resolution = None
+
+
+def get_layout(spread, viewport, label_color):
+    global _layout_resolution
+    # 해상도가 바뀌면 이전 해상도의 배치는 버림
+    if viewport.size != _layout_resolution:
+        _layouts.clear()
+        _layout_resolution = viewport.size
+
+    key = (spread.id, viewport.size, label_color)
+    layout = _layouts.get(key)
+    if layout is None:
+        layout = SpreadLayout(spread, viewport, label_color)
+        _layouts[key] = layout
+    return layout
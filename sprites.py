@@ -0,0 +1,165 @@
+import math
+import random
+from operator import itemgetter
+
+from app import app, SCREEN_WIDTH, SCREEN_HEIGHT
+
+# 카드 스프라이트 배치
+#
+# 카드마다 blit을 따로 부르지 않고, 한 프레임에 그릴 카드 이미지(앞면, 뒷면, 호버 테두리)를
+# SpriteBatch에 모은 뒤 z 순서대로 정렬하여 백엔드의 blits()로 한 번에 그립니다.
+# z가 같으면 추가한 순서대로 그립니다.
+#
+# DealAnimation은 카드 뭉치를 리플 셔플한 뒤 한 장씩 자리로 나눠 주는 애니메이션입니다.
+# 모든 카드가 같은 뒷면 Surface를 쓰므로 78장 덱도 Surface 하나와 Rect 목록만으로 그립니다.
+
+
+class SpriteBatch:
+    def __init__(self):
+        self._sprites = []
+
+    def __len__(self):
+        return len(self._sprites)
+
+    def add(self, surface, rect, z=0):
+        """
+        그릴 이미지를 추가하는 함수
+
+        Args:
+            surface: 그릴 Surface (rect 크기와 다르면 백엔드에서 확대/축소)
+            rect: 실제 화면 좌표의 Rect
+            z (int): 클수록 위에 그림
+        """
+        self._sprites.append((z, surface, rect))
+
+    def draw(self, backend=None):
+        # 정렬은 안정 정렬이므로 z가 같은 이미지는 추가한 순서를 유지
+        self._sprites.sort(key=itemgetter(0))
+        (backend or app.backend).blits([(surface, rect) for _, surface, rect in self._sprites])
+        self._sprites.clear()
+
+
+# 셔플과 나눠 주기 애니메이션 (프레임 수 - 입력 기록을 재생해도 같은 화면이 되도록 시간 대신 프레임 기준)
+RIFFLES = 2
+RIFFLE_FRAMES = 24
+DEAL_INTERVAL = 2
+DEAL_FRAMES = 15
+
+# 뭉치에서 카드 한 장의 두께와 리플 셔플할 때 두 뭉치가 벌어지는 거리 (기준 해상도)
+STACK_OFFSET = 0.25
+SPLIT_DISTANCE = 90
+
+
+class DealAnimation:
+    """
+    카드 뭉치를 섞은 뒤 위쪽 카드부터 한 장씩 목표 위치로 나눠 주는 애니메이션
+
+    Args:
+        deck_size (int): 뭉치의 카드 수
+        targets (list): 나눠 줄 카드마다 목표 위치 (기준 해상도 왼쪽 위 좌표) - 남은 카드는 뭉치에 남음
+        card_size (tuple): 카드 크기 (기준 해상도)
+        seed: 리플 셔플 순서를 정하는 시드
+    """
+
+    def __init__(self, deck_size, targets, card_size, seed=None, center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)):
+        self.deck_size = deck_size
+        self.targets = list(targets)[:deck_size]
+        self.card_size = card_size
+        self.pile_pos = (center[0] - card_size[0] / 2, center[1] - card_size[1] / 2)
+        self.frame = 0
+
+        # 리플마다 (섞기 전 순서, 섞은 뒤 순서) - 카드 번호의 목록이며 뒤쪽이 뭉치 위
+        rng = random.Random(seed)
+        self._riffles = []
+        order = list(range(deck_size))
+        for _ in range(RIFFLES):
+            shuffled = self._riffle(order, rng)
+            self._riffles.append((order, shuffled))
+            order = shuffled
+        self._order = order
+
+        self._deal_start = RIFFLES * RIFFLE_FRAMES
+        self.total_frames = self._deal_start + max(0, len(self.targets) - 1) * DEAL_INTERVAL + DEAL_FRAMES
+
+    @staticmethod
+    def _riffle(order, rng):
+        # 뭉치를 반으로 나누어 남은 카드 수에 비례한 확률로 한 장씩 번갈아 떨어뜨림
+        half = len(order) // 2
+        left, right = order[:half], order[half:]
+        merged = []
+        while left and right:
+            source = left if rng.random() < len(left) / (len(left) + len(right)) else right
+            merged.append(source.pop(0))
+        return merged + left + right
+
+    @property
+    def done(self):
+        return self.frame >= self.total_frames
+
+    def update(self):
+        if not self.done:
+            self.frame += 1
+
+    def finish(self):
+        self.frame = self.total_frames
+
+    def _pile_position(self, index, shift=0):
+        # 뭉치의 index번째 카드 위치 (위로 갈수록 조금씩 위에 쌓임)
+        return (self.pile_pos[0] + shift, self.pile_pos[1] - index * STACK_OFFSET)
+
+    def positions(self):
+        """
+        현재 프레임의 카드 위치를 그리는 순서대로 반환하는 함수
+
+        Returns:
+            list: (z, 기준 해상도 x, y) 목록
+        """
+        if self.frame < self._deal_start:
+            before, after = self._riffles[self.frame // RIFFLE_FRAMES]
+            t = (self.frame % RIFFLE_FRAMES) / RIFFLE_FRAMES
+            # 앞 절반 동안 두 뭉치가 양옆으로 벌어졌다가, 뒤 절반 동안 섞인 순서로 모임
+            shift = SPLIT_DISTANCE * math.sin(math.pi * t)
+            if t < 0.5:
+                half = len(before) // 2
+                return [(index, *(self._pile_position(index, -shift) if index < half else self._pile_position(index - half, shift)))
+                        for index in range(len(before))]
+            left = set(before[:len(before) // 2])
+            return [(index, *self._pile_position(index, -shift if card in left else shift))
+                    for index, card in enumerate(after)]
+
+        # 뭉치 위쪽(목록 뒤쪽)부터 나눠 줌 - 나눠 준 카드는 뭉치보다 위에 그림
+        dealing = self.frame - self._deal_start
+        pile = len(self._order)
+        positions = []
+        for index in range(pile):
+            dealt = pile - 1 - index
+            if dealt >= len(self.targets):
+                positions.append((index, *self._pile_position(index)))
+                continue
+            t = min(1, max(0, (dealing - dealt * DEAL_INTERVAL) / DEAL_FRAMES))
+            start = self._pile_position(index)
+            if t <= 0:
+                positions.append((index, *start))
+                continue
+            # 감속하며 도착
+            t = 1 - (1 - t) ** 3
+            target = self.targets[dealt]
+            positions.append((pile + dealt, start[0] + (target[0] - start[0]) * t, start[1] + (target[1] - start[1]) * t))
+        return positions
+
+    def draw(self, batch, back):
+        """
+        카드 뒷면 Surface 하나로 모든 카드를 batch에 추가하는 함수
+
+        Args:
+            back: 화면 크기에 맞춘 카드 뒷면 Surface
+        """
+        # 뭉치에서 같은 화면 위치에 겹친 카드는 가장 위의 카드만 보이므로 하나만 그림
+        width, height = self.card_size
+        top = {}
+        for z, x, y in self.positions():
+            pos = (round(x), round(y))
+            if top.get(pos, -1) < z:
+                top[pos] = z
+        for (x, y), z in top.items():
+            batch.add(back, app.viewport.rect((x, y, width, height)), z)